@@ -6,6 +6,7 @@ Utilise EnricherService pour réutiliser la logique d'enrichissement.
 """
 
 import logging
+import sys
 from typing import List
 
 from .core.enricher_service import EnricherService
@@ -36,39 +37,41 @@ def cli_process_folder(folder: str, autosave: bool = False) -> List[EpubMeta]:
 
 
 def print_metadata_summary(metas: List[EpubMeta]):
-    """Affiche un résumé des métadonnées traitées."""
-    print("\n=== Résumé du traitement ===")
-    print(f"Fichiers traités: {len(metas)}")
+    """
+    Affiche un résumé des métadonnées traitées.
 
-    with_suggestions = sum(1 for m in metas if m.processed)
-    print(f"Avec suggestions: {with_suggestions}")
+    Les lignes sont accumulées puis écrites en une seule fois sur stdout.
+    """
+    lines = ["\n=== Résumé du traitement ===", f"Fichiers traités: {len(metas)}"]
 
-    if with_suggestions > 0:
-        print("\n=== Fichiers avec suggestions ===")
-        for meta in metas:
-            if not meta.processed:
-                continue
+    # Un seul passage pour repérer les fichiers traités (comptage et affichage)
+    processed_idx = [i for i, m in enumerate(metas) if m.processed]
+    lines.append(f"Avec suggestions: {len(processed_idx)}")
 
-            print(f"\n{meta.filename}:")
+    if processed_idx:
+        lines.append("\n=== Fichiers avec suggestions ===")
+        for i in processed_idx:
+            meta = metas[i]
+            lines.append(f"\n{meta.filename}:")
 
             # Comparer et afficher les changements
             if meta.original_title != meta.suggested_title:
-                print(f"  Titre: {meta.original_title} -> {meta.suggested_title}")
+                lines.append(f"  Titre: {meta.original_title} -> {meta.suggested_title}")
 
             if meta.original_authors != meta.suggested_authors:
-                print(f"  Auteurs: {meta.original_authors} -> {meta.suggested_authors}")
+                lines.append(f"  Auteurs: {meta.original_authors} -> {meta.suggested_authors}")
 
             if meta.original_isbn != meta.suggested_isbn:
-                print(f"  ISBN: {meta.original_isbn} -> {meta.suggested_isbn}")
+                lines.append(f"  ISBN: {meta.original_isbn} -> {meta.suggested_isbn}")
 
             if meta.original_language != meta.suggested_language:
-                print(f"  Langue: {meta.original_language} -> {meta.suggested_language}")
+                lines.append(f"  Langue: {meta.original_language} -> {meta.suggested_language}")
 
             if meta.original_publisher != meta.suggested_publisher:
-                print(f"  Éditeur: {meta.original_publisher} -> {meta.suggested_publisher}")
+                lines.append(f"  Éditeur: {meta.original_publisher} -> {meta.suggested_publisher}")
 
             if meta.original_publication_date != meta.suggested_publication_date:
-                print(
+                lines.append(
                     f"  Date: {meta.original_publication_date} -> "
                     f"{meta.suggested_publication_date}"
                 )
@@ -76,12 +79,16 @@ def print_metadata_summary(metas: List[EpubMeta]):
             if meta.original_tags != meta.suggested_tags:
                 orig_tags = ", ".join(meta.original_tags or [])
                 sugg_tags = ", ".join(meta.suggested_tags or [])
-                print(f"  Tags: {orig_tags} -> {sugg_tags}")
+                lines.append(f"  Tags: {orig_tags} -> {sugg_tags}")
 
             if meta.original_summary != meta.suggested_summary:
                 orig_summary = (meta.original_summary or "")[:50] + "..."
                 sugg_summary = (meta.suggested_summary or "")[:50] + "..."
-                print(f"  Résumé: {orig_summary} -> {sugg_summary}")
+                lines.append(f"  Résumé: {orig_summary} -> {sugg_summary}")
+
+            if meta.suggested_cover_id or (
+                meta.suggested_cover_data and meta.suggested_cover_data != meta.original_cover_data
+            ):
+                lines.append("  Couverture: Nouvelle couverture disponible")
 
-            if meta.suggested_cover_data and meta.suggested_cover_data != meta.original_cover_data:
-                print("  Couverture: Nouvelle couverture disponible")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -7,20 +7,68 @@ import os
 import re
 
 # ---------- Configuration réseau ----------
-API_TIMEOUT = 10
+API_TIMEOUT = 10  # délai de lecture (s)
+API_CONNECT_TIMEOUT = 3.05  # délai d'établissement de connexion (s)
 OPENLIB_SEARCH = "https://openlibrary.org/search.json"
 OPENLIB_BOOK = "https://openlibrary.org/api/books"
+OPENLIB_BATCH_SIZE = 50  # ISBN par requête groupée (bibkeys), pour borner la longueur d'URL
+HTTP_POOL_SIZE = 32  # connexions conservées par hôte (>= requêtes simultanées)
+USER_AGENT = "epub-enricher/0.1.0"
+MAX_CONCURRENT_LOOKUPS = 10  # livres enrichis simultanément (respect des rate limits)
+FOLDER_BATCH_SIZE = 64  # fichiers en vol lors du traitement d'un dossier
+LOOKUP_MEMO_SIZE = 4096  # recherches identiques mémorisées par dossier (doublons, séries)
 
 # ---------- Dossiers ----------
 COVER_CACHE_DIR = ".cover_cache"
 BACKUP_DIR = "backups"
+# Sauvegarde de chaque EPUB avant écriture des métadonnées (lien physique si possible)
+BACKUP_BEFORE_APPLY = True
 LOG_DIR = "logs"
 
+# ---------- Cache des réponses API ----------
+API_CACHE_PATH = os.path.join(COVER_CACHE_DIR, "api_cache.sqlite")
+API_CACHE_TTL = 30 * 24 * 3600  # 30 jours
+METADATA_CACHE_TTL = 365 * 24 * 3600  # clé liée à la taille et la date du fichier
+# Au-delà, les métadonnées ne sont pas mises en cache (couverture en base64 dans SQLite)
+METADATA_CACHE_MAX_COVER_BYTES = 512 * 1024
+API_MEMO_SIZE = 1024  # réponses gardées en mémoire par source (évite de relire SQLite)
+
 # ---------- Extensions supportées ----------
 SUPPORTED_EXT = (".epub",)
 
 # ---------- Expressions régulières ----------
-ISBN_RE = re.compile(r"(?:(?:ISBN(?:-1[03])?:?\s*)?)(97[89][ -]?)?[0-9][0-9 -]{8,}[0-9Xx]")
+# Longueur bornée: un ISBN-13 avec séparateurs tient en 17 caractères, ce qui
+# évite de longs retours arrière sur les suites de chiffres du texte.
+ISBN_RE = re.compile(r"(?:ISBN(?:-1[03])?:?\s*)?(?:97[89][ -]?)?[0-9][0-9 -]{8,15}[0-9Xx]")
+# Même motif sur bytes (ASCII uniquement): analyse du contenu brut sans décodage
+ISBN_BYTES_RE = re.compile(ISBN_RE.pattern.encode("ascii"))
+ISBN_SCAN_BYTES = 64 * 1024  # octets analysés par document (l'ISBN est dans le colophon)
+ISBN_VALIDATION_MEMO_SIZE = 4096  # candidats ISBN déjà validés gardés en mémoire
+ISBN_SCAN_DOCS = 3  # documents analysés au début et à la fin du livre pour trouver un ISBN
+LANG_SCAN_BYTES = 20 * 1024  # octets HTML décodés pour la détection de langue
+LANG_SAMPLE_CHARS = 3000  # caractères de texte transmis au détecteur de langue
+# Bornes d'analyse de CLD3 (extra "fast"): en deçà, le résultat n'est pas fiable
+CLD3_MIN_BYTES = 100
+CLD3_MAX_BYTES = 1000
+LANG_DETECT_MEMO_SIZE = 2048  # échantillons déjà analysés gardés en mémoire (par processus)
+# Profils langdetect chargés (au lieu des 55): mémoire et premier appel réduits
+LANGDETECT_LANGUAGES = (
+    "en",
+    "fr",
+    "de",
+    "es",
+    "it",
+    "pt",
+    "nl",
+    "ru",
+    "ja",
+    "zh-cn",
+    "zh-tw",
+    "ko",
+    "ar",
+    "hi",
+    "id",
+)
 
 # ---------- Configuration retry/backoff ----------
 MAX_RETRIES = 5
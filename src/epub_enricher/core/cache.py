@@ -0,0 +1,296 @@
+# epub_enricher/src/epub_enricher/core/cache.py
+"""
+Cache persistant (SQLite) pour les réponses des APIs externes.
+
+Évite de ré-interroger les APIs pour les mêmes livres d'une exécution
+à l'autre. Les entrées expirent après un TTL configurable. Un niveau
+optionnel en mémoire (LRU) sert les appels répétés d'une même exécution,
+et les appels identiques simultanés partagent une seule requête.
+"""
+
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..config import API_CACHE_PATH, API_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+_enabled = True
+
+# Connexion SQLite propre à chaque thread (une connexion ne se partage pas
+# entre threads), rouverte si la base change ou après un fork.
+_local = threading.local()
+# Bases dont le dossier, le mode WAL et la table ont déjà été initialisés
+_initialized_paths: set = set()
+_init_lock = threading.Lock()
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Active ou désactive le cache (ex: option --no-cache)."""
+    global _enabled
+    _enabled = enabled
+    logger.debug("API cache %s", "enabled" if enabled else "disabled")
+
+
+def is_cache_enabled() -> bool:
+    """
+    Indique si le cache est actif dans ce processus.
+
+    Les pools de processus le transmettent à leurs workers via
+    initializer=set_cache_enabled: un worker "spawn" réimporte le module
+    avec le cache actif, et un fork ne reflète pas un changement ultérieur.
+    """
+    return _enabled
+
+
+def _init_database(path: str) -> None:
+    """
+    Crée le dossier et la table du cache, une seule fois par base et par processus.
+
+    Le mode WAL (persistant dans le fichier) permet aux lectures de se
+    poursuivre pendant une écriture (plusieurs threads et processus
+    accèdent au cache simultanément).
+    """
+    with _init_lock:
+        if path in _initialized_paths:
+            return
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=10)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+        _initialized_paths.add(path)
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Retourne la connexion au cache du thread courant, ouverte au premier appel.
+
+    La connexion reste ouverte pour la durée de vie du thread. Elle n'est
+    jamais réutilisée par un processus enfant (fork): celui-ci ouvre la sienne.
+    """
+    owner = (API_CACHE_PATH, os.getpid())
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.owner == owner:
+        return conn
+
+    _init_database(API_CACHE_PATH)
+    conn = sqlite3.connect(API_CACHE_PATH, timeout=10)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _local.conn, _local.owner = conn, owner
+    return conn
+
+
+def _drop_connection() -> None:
+    """
+    Abandonne la connexion du thread après une erreur.
+
+    Elle est rouverte au prochain appel, la base étant réinitialisée au
+    passage (ex: fichier de cache supprimé pendant l'exécution).
+    """
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is None:
+        return
+    path, pid = _local.owner
+    with _init_lock:
+        _initialized_paths.discard(path)
+    if pid == os.getpid():
+        conn.close()
+
+
+def make_key(source: str, *parts: Any) -> str:
+    """Construit une clé de cache stable pour une source et ses paramètres."""
+    raw = json.dumps([source, *parts], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cache_get(key: str) -> Tuple[bool, Any]:
+    """
+    Lit une entrée du cache.
+
+    Returns:
+        Tuple (trouvé, valeur). La valeur est None si non trouvée ou expirée.
+    """
+    try:
+        row = (
+            _connect()
+            .execute(
+                "SELECT value FROM api_cache WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+    except sqlite3.Error as e:
+        logger.warning("API cache read failed: %s", e)
+        _drop_connection()
+        return False, None
+
+    if row is None:
+        return False, None
+    return True, json.loads(row[0])
+
+
+def cache_set(key: str, value: Any, ttl: float = API_CACHE_TTL) -> None:
+    """Écrit une entrée dans le cache (valeur sérialisable en JSON)."""
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO api_cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + ttl),
+            )
+    except (TypeError, ValueError) as e:
+        logger.warning("API cache write failed: %s", e)
+    except sqlite3.Error as e:
+        logger.warning("API cache write failed: %s", e)
+        _drop_connection()
+
+
+def clear_cache() -> None:
+    """Vide entièrement le cache."""
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM api_cache")
+    except sqlite3.Error as e:
+        logger.warning("API cache clear failed: %s", e)
+        _drop_connection()
+
+
+def cached(
+    source: str,
+    ttl: float = API_CACHE_TTL,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+    encode: Optional[Callable[[Any], Any]] = None,
+    decode: Optional[Callable[[Any], Any]] = None,
+    memo_size: int = 0,
+    ignore: Tuple[str, ...] = (),
+):
+    """
+    Decorator de mise en cache persistante du résultat d'une requête API.
+
+    La clé est construite à partir des arguments nommés (un appel positionnel
+    et un appel par mots-clés partagent la même entrée). La fonction décorée
+    expose is_cached(*args, **kwargs) pour savoir si un appel serait servi
+    par le cache, sans l'exécuter.
+
+    Args:
+        source: Nom de la source (préfixe de clé, ex: 'openlibrary')
+        ttl: Durée de validité des entrées en secondes
+        should_cache: Prédicat indiquant si un résultat mérite d'être stocké
+            (par défaut: résultat non vide). Permet de ne pas figer un échec réseau.
+        encode: Conversion du résultat en valeur sérialisable en JSON
+        decode: Conversion inverse appliquée à la lecture du cache
+        memo_size: Nombre de résultats gardés en mémoire devant SQLite
+            (0 = pas de niveau mémoire). Chaque appelant en reçoit une copie:
+            modifier un résultat ne change pas les appels suivants.
+        ignore: Paramètres exclus de la clé (indications qui ne changent pas
+            la requête, ex: données déjà pré-chargées par lot)
+
+    Note:
+        Si un appel pour la même clé est déjà en cours dans un autre thread
+        (ex: deux livres d'une même série), l'appelant attend son résultat
+        au lieu de lancer une seconde requête.
+    """
+    accept = should_cache or bool
+
+    def deco(func: Callable):
+        signature = inspect.signature(func)
+        memo: "OrderedDict[str, Any]" = OrderedDict()
+        memo_lock = threading.Lock()
+        inflight: Dict[str, Future] = {}
+        inflight_lock = threading.Lock()
+
+        def remember(key: str, result: Any) -> None:
+            with memo_lock:
+                memo[key] = copy.deepcopy(result)
+                if len(memo) > memo_size:
+                    memo.popitem(last=False)
+
+        def key_for(args: tuple, kwargs: dict) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in ignore}
+            return make_key(source, params)
+
+        def fetch_once(key: str, *args, **kwargs) -> Any:
+            """Exécute la requête, ou attend celle déjà en cours pour cette clé."""
+            with inflight_lock:
+                pending = inflight.get(key)
+                if pending is None:
+                    future = inflight[key] = Future()
+            if pending is not None:
+                logger.debug("Joining in-flight request for %s", source)
+                # Copie: le résultat appartient déjà à l'appelant qui a lancé la requête
+                return copy.deepcopy(pending.result())
+
+            try:
+                result = func(*args, **kwargs)
+                if accept(result):
+                    cache_set(key, encode(result) if encode else result, ttl)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+            finally:
+                with inflight_lock:
+                    del inflight[key]
+            return result
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            key = key_for(args, kwargs)
+            if memo_size:
+                with memo_lock:
+                    if key in memo:
+                        memo.move_to_end(key)
+                        return copy.deepcopy(memo[key])
+
+            found, value = cache_get(key)
+            if found:
+                logger.debug("API cache hit for %s", source)
+                result = decode(value) if decode else value
+            else:
+                result = fetch_once(key, *args, **kwargs)
+                if not accept(result):
+                    return result
+
+            if memo_size:
+                remember(key, result)
+            return result
+
+        def is_cached(*args, **kwargs) -> bool:
+            """Indique si cet appel serait servi par le cache (sans requête)."""
+            if not _enabled:
+                return False
+            key = key_for(args, kwargs)
+            with memo_lock:
+                if key in memo:
+                    return True
+            return cache_get(key)[0]
+
+        wrapper.is_cached = is_cached
+        return wrapper
+
+    return deco
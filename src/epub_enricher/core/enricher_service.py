@@ -9,19 +9,121 @@ Ce service est utilisé à la fois par le mode GUI et le mode CLI
 pour éviter la duplication de logique.
 """
 
+import copy
 import logging
 import os
-from typing import List, Optional
-
-from .enrichment import fetch_enriched_metadata
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..config import (
+    BACKUP_BEFORE_APPLY,
+    FOLDER_BATCH_SIZE,
+    LOOKUP_MEMO_SIZE,
+    MAX_CONCURRENT_LOOKUPS,
+)
+from .cache import is_cache_enabled, set_cache_enabled
+from .enrichment import fetch_enriched_metadata, query_google_books, query_google_books_batch
 from .epub import extract_metadata, update_epub_with_metadata
-from .file_utils import find_epubs_in_folder, rename_epub_file
+from .file_utils import backup_file, iter_epubs_in_folder, rename_epub_file
 from .models import EpubMeta
-from .openlibrary_client import query_openlibrary_full
+from .openlibrary_client import batch_lookup_openlib, download_cover, is_openlibrary_cached
 
 logger = logging.getLogger(__name__)
 
 
+def _build_original_meta(epub_path: str, res: Dict) -> EpubMeta:
+    """Crée l'EpubMeta d'un fichier à partir de ses métadonnées extraites."""
+    return EpubMeta(
+        path=epub_path,
+        filename=os.path.basename(epub_path),
+        original_title=res.get("title"),
+        original_authors=res.get("authors"),
+        original_isbn=res.get("identifier"),
+        original_language=res.get("language"),
+        original_publisher=res.get("publisher"),
+        original_publication_date=res.get("date"),
+        original_tags=res.get("tags"),
+        original_cover_data=res.get("cover_data"),
+        original_summary=res.get("summary"),
+    )
+
+
+def _extract_only(epub_path: str) -> Optional[EpubMeta]:
+    """
+    Extrait les métadonnées originales d'un EPUB (phase locale, CPU-bound).
+
+    Fonction de niveau module pour rester picklable par ProcessPoolExecutor.
+
+    La couverture originale n'est pas renvoyée: ni l'enrichissement ni
+    l'écriture n'en ont besoin (l'ancienne couverture est conservée depuis
+    le fichier), et ses octets seraient sérialisés entre processus pour rien.
+
+    Args:
+        epub_path: Chemin vers le fichier EPUB
+
+    Returns:
+        EpubMeta sans suggestions ni couverture originale, ou None en cas d'erreur
+    """
+    try:
+        res = extract_metadata(epub_path)
+        return _build_original_meta(epub_path, {**res, "cover_data": None})
+    except Exception as e:
+        logger.exception("Error extracting %s: %s", epub_path, e)
+        return None
+
+
+@dataclass
+class _BatchPrefetch:
+    """Résultats des requêtes groupées d'un lot de livres (ISBN -> données)."""
+
+    editions: Dict[str, Dict] = field(default_factory=dict)  # OpenLibrary (API Books)
+    books: Dict[str, Dict] = field(default_factory=dict)  # Google Books ({} = inconnu)
+
+
+def _prefetch_batch(metas: List[EpubMeta]) -> _BatchPrefetch:
+    """
+    Interroge les sources par lot pour les livres d'un lot absents du cache.
+
+    Une édition OpenLibrary trouvée par lot remplace la recherche du livre
+    (seule son œuvre est ensuite demandée); les ISBN inconnus de l'API Books
+    passent par la recherche habituelle.
+    Les livres dont la recherche est déjà en cache ne sont pas redemandés:
+    une seconde exécution sur le même dossier n'envoie aucune requête.
+    """
+    with_isbn = [m for m in metas if m.original_isbn]
+    ol_missing = [
+        m.original_isbn
+        for m in with_isbn
+        if not is_openlibrary_cached(m.original_title, m.original_authors or None, m.original_isbn)
+    ]
+    google_missing = [
+        m.original_isbn
+        for m in with_isbn
+        if not query_google_books.is_cached(m.original_title, m.original_isbn)
+    ]
+    return _BatchPrefetch(
+        editions=batch_lookup_openlib(ol_missing) if ol_missing else {},
+        books=query_google_books_batch(google_missing) if google_missing else {},
+    )
+
+
+def _has_data(enriched_data: Dict[str, Any]) -> bool:
+    """Indique si une recherche a trouvé quelque chose (sinon elle n'est pas mémorisée)."""
+    return any(
+        enriched_data.get(k) for k in ("related_docs", "summary", "tags", "genre", "cover_id")
+    )
+
+
+def _batched(paths: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Découpe un flux de chemins en lots de taille bornée."""
+    it = iter(paths)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 class EnricherService:
     """
     Service d'enrichissement EPUB.
@@ -36,56 +138,108 @@ class EnricherService:
         """Initialise le service."""
         logger.debug("EnricherService initialized")
 
-    def process_epub(self, epub_path: str) -> Optional[EpubMeta]:
+    def _lookup(
+        self,
+        title: Optional[str],
+        authors: Optional[Tuple[str, ...]],
+        isbn: Optional[str],
+        memo: Optional[Dict[Tuple, Dict[str, Any]]] = None,
+        prefetch: Optional[_BatchPrefetch] = None,
+    ) -> Dict[str, Any]:
+        """
+        Interroge les APIs externes pour un livre.
+
+        OpenLibrary et Google Books sont interrogés en parallèle par
+        fetch_enriched_metadata, qui renvoie aussi les éditions OpenLibrary.
+
+        Avec un memo (propre à un traitement de dossier), les recherches
+        identiques (doublons, séries) ne sont faites qu'une fois. Seuls les
+        résultats non vides sont mémorisés: un échec réseau est retenté au
+        livre suivant. Chaque appelant reçoit sa propre copie, modifiable
+        sans affecter les autres EpubMeta.
+
+        Args:
+            title: Titre du livre
+            authors: Auteurs (tuple, pour servir de clé)
+            isbn: Code ISBN
+            memo: Résultats déjà obtenus pendant ce traitement
+            prefetch: Résultats des requêtes groupées du lot en cours
+
+        Returns:
+            Métadonnées enrichies (voir fetch_enriched_metadata)
+        """
+        key = (title, authors, isbn)
+        if memo is not None and key in memo:
+            return copy.deepcopy(memo[key])
+
+        result = fetch_enriched_metadata(
+            title=title,
+            authors=list(authors) if authors else None,
+            isbn=isbn,
+            ol_edition=prefetch.editions.get(isbn) if prefetch and isbn else None,
+            google_prefetched=prefetch.books.get(isbn) if prefetch and isbn else None,
+        )
+        if memo is not None and _has_data(result) and len(memo) < LOOKUP_MEMO_SIZE:
+            memo[key] = result
+            return copy.deepcopy(result)
+        return result
+
+    def process_epub(self, epub_path: str, extracted: Optional[Dict] = None) -> Optional[EpubMeta]:
         """
         Traite un fichier EPUB: extrait et enrichit les métadonnées.
 
         Args:
             epub_path: Chemin vers le fichier EPUB
+            extracted: Métadonnées déjà extraites (évite une seconde lecture)
 
         Returns:
             Objet EpubMeta avec métadonnées originales et suggérées,
             ou None en cas d'erreur
         """
         try:
-            # 1. Extraction des métadonnées originales
-            logger.info(f"Processing EPUB: {epub_path}")
-            res = extract_metadata(epub_path)
-
-            # 2. Création de l'objet EpubMeta
-            meta = EpubMeta(
-                path=epub_path,
-                filename=os.path.basename(epub_path),
-                original_title=res.get("title"),
-                original_authors=res.get("authors"),
-                original_isbn=res.get("identifier"),
-                original_language=res.get("language"),
-                original_publisher=res.get("publisher"),
-                original_publication_date=res.get("date"),
-                original_tags=res.get("tags"),
-                original_cover_data=res.get("cover_data"),
-                original_summary=res.get("summary"),
-            )
+            # 1-2. Extraction des métadonnées originales et création de l'EpubMeta
+            logger.info("Processing EPUB: %s", epub_path)
+            res = extracted if extracted is not None else extract_metadata(epub_path)
+            meta = _build_original_meta(epub_path, res)
+        except Exception as e:
+            logger.exception("Error processing %s: %s", epub_path, e)
+            return None
 
-            # 3. Récupération des suggestions depuis OpenLibrary
-            ol_data = query_openlibrary_full(
-                title=meta.original_title,
-                authors=meta.original_authors,
-                isbn=meta.original_isbn,
-            )
+        return self._enrich(meta)
+
+    def _enrich(
+        self,
+        meta: EpubMeta,
+        memo: Optional[Dict] = None,
+        prefetch: Optional[_BatchPrefetch] = None,
+    ) -> Optional[EpubMeta]:
+        """
+        Complète un EpubMeta avec les suggestions des APIs externes (phase réseau).
 
-            # 4. Récupération des métadonnées enrichies (genre, résumé, etc.)
-            enriched_data = fetch_enriched_metadata(
-                title=meta.original_title,
-                authors=meta.original_authors,
-                isbn=meta.original_isbn,
+        Args:
+            meta: EpubMeta contenant les métadonnées originales
+            memo: Recherches déjà faites pendant le traitement en cours (voir _lookup)
+            prefetch: Résultats des requêtes groupées du lot en cours
+
+        Returns:
+            Le même objet avec ses suggestions, ou None en cas d'erreur
+        """
+        try:
+            # 3-4. Suggestions OpenLibrary et métadonnées enrichies (genre, résumé, etc.)
+            enriched_data = self._lookup(
+                meta.original_title,
+                tuple(meta.original_authors) if meta.original_authors else None,
+                meta.original_isbn,
+                memo,
+                prefetch,
             )
 
             # 5. Remplissage des suggestions
             # Utiliser OpenLibrary comme source principale pour titre/auteurs/langue
-            if ol_data.get("related_docs"):
+            related_docs = enriched_data.get("related_docs")
+            if related_docs:
                 # Prendre le premier résultat comme meilleure suggestion
-                best_doc = ol_data["related_docs"][0]
+                best_doc = related_docs[0]
                 meta.suggested_title = best_doc.get("title") or meta.original_title
 
                 # Auteurs
@@ -115,7 +269,7 @@ class EnricherService:
                     meta.suggested_isbn = meta.original_isbn
 
                 # Stocker les éditions alternatives
-                meta.found_editions = ol_data.get("related_docs", [])
+                meta.found_editions = related_docs
             else:
                 # Fallback: conserver les originaux
                 meta.suggested_title = meta.original_title
@@ -131,19 +285,40 @@ class EnricherService:
             )
             meta.suggested_tags = enriched_data.get("tags") or meta.original_tags
             meta.suggested_summary = enriched_data.get("summary") or meta.original_summary
-            meta.suggested_cover_data = enriched_data.get("cover_data") or meta.original_cover_data
+            # La couverture proposée n'est téléchargée qu'au moment de l'appliquer
+            meta.suggested_cover_id = enriched_data.get("cover_id")
+            meta.suggested_cover_data = meta.original_cover_data
 
             # 7. Marquer comme traité
             meta.processed = True
             meta.note = "Suggestions fetched"
 
-            logger.info(f"Successfully processed: {meta.filename}")
+            logger.info("Successfully processed: %s", meta.filename)
             return meta
 
         except Exception as e:
-            logger.exception(f"Error processing {epub_path}: {e}")
+            logger.exception("Error processing %s: %s", meta.path, e)
             return None
 
+    def load_suggested_cover(self, meta: EpubMeta) -> Optional[bytes]:
+        """
+        Télécharge la couverture proposée, si elle ne l'a pas encore été.
+
+        En cas d'échec du téléchargement, la couverture originale est conservée.
+
+        Args:
+            meta: Objet EpubMeta avec suggestions
+
+        Returns:
+            Données de la couverture suggérée (ou None)
+        """
+        if meta.suggested_cover_id:
+            cover_data = download_cover(meta.suggested_cover_id)
+            if cover_data:
+                meta.suggested_cover_data = cover_data
+            meta.suggested_cover_id = None
+        return meta.suggested_cover_data
+
     def apply_enrichment(self, meta: EpubMeta) -> bool:
         """
         Applique les suggestions de métadonnées à un fichier EPUB.
@@ -155,7 +330,14 @@ class EnricherService:
             True si succès, False sinon
         """
         try:
-            logger.info(f"Applying enrichment to: {meta.filename}")
+            logger.info("Applying enrichment to: %s", meta.filename)
+
+            # Seul point où la nouvelle couverture est réellement nécessaire
+            self.load_suggested_cover(meta)
+
+            # Sauvegarde avant toute modification (lien physique si possible)
+            if BACKUP_BEFORE_APPLY:
+                backup_file(meta.path)
 
             # Appliquer les métadonnées
             success = update_epub_with_metadata(meta.path, meta)
@@ -163,45 +345,99 @@ class EnricherService:
             if success:
                 # Renommer le fichier si nécessaire
                 rename_epub_file(meta)
-                logger.info(f"Successfully applied enrichment to: {meta.filename}")
+                logger.info("Successfully applied enrichment to: %s", meta.filename)
                 return True
             else:
-                logger.error(f"Failed to apply enrichment to: {meta.filename}")
+                logger.error("Failed to apply enrichment to: %s", meta.filename)
                 return False
 
         except Exception as e:
-            logger.exception(f"Error applying enrichment to {meta.filename}: {e}")
+            logger.exception("Error applying enrichment to %s: %s", meta.filename, e)
             meta.note = f"Error: {e}"
             return False
 
-    def process_folder(self, folder_path: str, autosave: bool = False) -> List[EpubMeta]:
+    def _extract_all(self, files: List[str], executor: Executor) -> List[Optional[EpubMeta]]:
+        """
+        Extrait les métadonnées de plusieurs EPUBs en parallèle.
+
+        La lecture EPUB (décompression ZIP + parsing XML) est CPU-bound:
+        elle est répartie sur un pool de processus. L'ordre des fichiers
+        est conservé.
+
+        Args:
+            files: Liste des chemins EPUB
+            executor: Pool de processus partagé pour tout le dossier
+
+        Returns:
+            Liste des EpubMeta originaux (None pour les échecs)
+        """
+        if len(files) < 2:
+            return [_extract_only(p) for p in files]
+
+        return list(executor.map(_extract_only, files, chunksize=4))
+
+    def process_folder(
+        self, folder_path: str, autosave: bool = False, max_workers: Optional[int] = None
+    ) -> List[EpubMeta]:
         """
         Traite un dossier entier de fichiers EPUB.
 
+        Les fichiers sont traités par lots au fil du parcours du dossier:
+        le premier lot démarre sans attendre la fin du scan et le nombre
+        de fichiers en cours de traitement reste borné. La couverture
+        originale n'est pas chargée (original_cover_data reste None).
+
         Args:
             folder_path: Chemin vers le dossier
             autosave: Si True, applique automatiquement les suggestions
+            max_workers: Nombre de processus pour l'extraction (défaut: nombre de CPU)
 
         Returns:
             Liste des objets EpubMeta traités
         """
-        logger.info(f"Processing folder: {folder_path}")
-
-        # Trouver tous les fichiers EPUB
-        files = find_epubs_in_folder(folder_path)
-        logger.info(f"Found {len(files)} EPUB files")
+        logger.info("Processing folder: %s", folder_path)
 
         metas = []
-        for epub_path in files:
-            # Traiter chaque fichier
-            meta = self.process_epub(epub_path)
-
-            if meta:
-                metas.append(meta)
-
-                # Si autosave, appliquer immédiatement
-                if autosave and meta.processed:
-                    self.apply_enrichment(meta)
-
-        logger.info(f"Processed {len(metas)} files")
+        saves = []
+        found = 0
+        # Recherches mémorisées pour ce seul traitement (doublons, séries)
+        memo: Dict = {}
+        with (
+            # Les workers reprennent l'état du cache (option --no-cache)
+            ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count(),
+                initializer=set_cache_enabled,
+                initargs=(is_cache_enabled(),),
+            ) as extractors,
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LOOKUPS) as fetchers,
+            # Un seul writer: les renommages de fichiers ne se concurrencent pas
+            ThreadPoolExecutor(max_workers=1) as writer,
+        ):
+            # Les fichiers EPUB sont découverts au fil de l'eau
+            for files in _batched(iter_epubs_in_folder(folder_path), FOLDER_BATCH_SIZE):
+                found += len(files)
+
+                # Extraction locale en parallèle (CPU-bound)
+                extracted = [m for m in self._extract_all(files, extractors) if m is not None]
+
+                # Une requête groupée par source pour les ISBN du lot absents du cache
+                prefetch = _prefetch_batch(extracted)
+
+                # Enrichissement réseau en parallèle (I/O-bound, ordre conservé)
+                enrich = partial(self._enrich, memo=memo, prefetch=prefetch)
+                results = fetchers.map(enrich, extracted)
+
+                for meta in results:
+                    if meta:
+                        metas.append(meta)
+
+                        # Si autosave, écrire en tâche de fond pendant le traitement du lot suivant
+                        if autosave and meta.processed:
+                            saves.append(writer.submit(self.apply_enrichment, meta))
+
+        failed_saves = sum(1 for future in saves if not future.result())
+        if failed_saves:
+            logger.warning("Autosave failed for %d of %d files", failed_saves, len(saves))
+
+        logger.info("Processed %d of %d EPUB files", len(metas), found)
         return metas
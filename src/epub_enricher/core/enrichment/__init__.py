@@ -9,11 +9,12 @@ informations complémentaires (résumé, genre, tags).
 
 # Exports publics
 from .aggregator import fetch_enriched_metadata
-from .google_books import query_google_books
+from .google_books import query_google_books, query_google_books_batch
 from .wikipedia import query_wikipedia_summary
 
 __all__ = [
     "fetch_enriched_metadata",
     "query_google_books",
+    "query_google_books_batch",
     "query_wikipedia_summary",
 ]
@@ -7,18 +7,47 @@ et agréger intelligemment leurs résultats.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-from ..openlibrary_client import download_cover, query_openlibrary_full
+from ...config import MAX_CONCURRENT_LOOKUPS
+from ..openlibrary_client import query_openlibrary_full
 from .genre_mapper import aggregate_genre
 from .google_books import query_google_books
 from .wikipedia import query_wikipedia_summary
 
 logger = logging.getLogger(__name__)
 
+# Pool partagé pour interroger les sources d'un même livre simultanément.
+# Les requêtes sont purement réseau (I/O-bound): des threads suffisent.
+_SOURCES_POOL = ThreadPoolExecutor(
+    max_workers=3 * MAX_CONCURRENT_LOOKUPS, thread_name_prefix="enrichment-source"
+)
+
+# Titres génériques laissés par les outils de création: une recherche par titre
+# ne peut rien trouver de pertinent et coûterait une requête (et une entrée de cache).
+_PLACEHOLDER_TITLES = frozenset(
+    ("untitled", "unknown", "no title", "sans titre", "inconnu", "titre inconnu")
+)
+
+
+def _is_searchable_title(title: Optional[str]) -> bool:
+    """Indique si un titre mérite une recherche par titre (Google Books, Wikipedia)."""
+    if not title:
+        return False
+    normalized = title.strip().casefold()
+    if normalized in _PLACEHOLDER_TITLES:
+        return False
+    # Au moins deux caractères alphanumériques (exclut "?", "-", "1"...)
+    return sum(c.isalnum() for c in normalized) >= 2
+
 
 def fetch_enriched_metadata(
-    title: Optional[str] = None, authors: Optional[List[str]] = None, isbn: Optional[str] = None
+    title: Optional[str] = None,
+    authors: Optional[List[str]] = None,
+    isbn: Optional[str] = None,
+    ol_edition: Optional[Dict[str, Any]] = None,
+    google_prefetched: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Interroge toutes les sources externes et agrège les résultats.
@@ -28,42 +57,65 @@ def fetch_enriched_metadata(
     - Google Books
     - Wikipedia
 
-    Et agrège intelligemment leurs résultats selon un ordre de priorité.
+    OpenLibrary et Google Books sont interrogés en parallèle; Wikipedia ne
+    l'est que si aucun résumé n'a été trouvé. Les résultats sont ensuite
+    agrégés intelligemment selon un ordre de priorité.
+
+    Les recherches par titre (Google Books sans ISBN, Wikipedia) sont
+    évitées pour les titres génériques ou trop courts ("Untitled", "?").
 
     Args:
         title: Titre du livre
         authors: Liste des auteurs
         isbn: Code ISBN
+        ol_edition: Édition OpenLibrary de cet ISBN déjà obtenue par requête
+            groupée (batch_lookup_openlib), transmise à query_openlibrary_full
+        google_prefetched: Résultat Google Books de cet ISBN déjà obtenu par
+            requête groupée (query_google_books_batch), {} si inconnu de Google
 
     Returns:
         Dictionnaire avec les clés:
         - genre: Genre suggéré
         - summary: Résumé (meilleure source)
         - tags: Liste agrégée de tags
-        - cover_data: Données de la couverture (bytes)
+        - cover_id: Identifiant de couverture OpenLibrary (téléchargée à la
+          demande via download_cover, seulement si elle est réellement utilisée)
         - ol_pub_date: Date de publication (OpenLibrary)
         - ol_publisher: Éditeur (OpenLibrary)
+        - related_docs: Éditions trouvées par OpenLibrary (la première est la
+          meilleure suggestion)
     """
     if not (title or isbn):
         logger.warning("Cannot fetch metadata without title or ISBN.")
         return {
             "genre": None,
             "summary": None,
-            "cover_data": None,
+            "cover_id": None,
             "tags": [],
             "ol_pub_date": None,
             "ol_publisher": None,
+            "related_docs": [],
         }
 
-    # 1. Interrogation des sources en parallèle logique
-    logger.debug(f"Fetching enriched metadata for: title={title}, isbn={isbn}")
+    # 1. Interrogation des sources en parallèle
+    logger.debug("Fetching enriched metadata for: title=%s, isbn=%s", title, isbn)
+
+    ol_future = _SOURCES_POOL.submit(query_openlibrary_full, title, authors, isbn, ol_edition)
+    searchable = _is_searchable_title(title)
+    if isbn or searchable:
+        google_future = _SOURCES_POOL.submit(query_google_books, title, isbn, google_prefetched)
+    else:
+        logger.debug("Skipping Google Books title search for %r", title)
+        google_future = None
 
-    ol_data = query_openlibrary_full(title, authors, isbn)
-    google_data = query_google_books(title, isbn)
-    wiki_summary = query_wikipedia_summary(title) if title else None
+    ol_data = ol_future.result()
+    google_data = google_future.result() if google_future else {}
 
-    # 2. Agrégation des résumés (priorité: OL > Google > Wikipedia)
-    summary = ol_data.get("summary") or google_data.get("summary") or wiki_summary
+    # 2. Agrégation des résumés (priorité: OL > Google > Wikipedia).
+    # Wikipedia n'est qu'un dernier recours: interrogé seulement sans autre résumé.
+    summary = ol_data.get("summary") or google_data.get("summary")
+    if not summary and searchable:
+        summary = query_wikipedia_summary(title)
 
     # 3. Agrégation du genre (logique complexe dans genre_mapper)
     genre = aggregate_genre(
@@ -72,22 +124,19 @@ def fetch_enriched_metadata(
         summary_text=summary or "",
     )
 
-    # 4. Agrégation des tags (fusion simple)
-    all_tags = list(set((ol_data.get("tags") or []) + (google_data.get("tags") or [])))
-
-    # 5. Couverture (via OpenLibrary uniquement - meilleure qualité)
-    cover_data = None
-    cover_id = ol_data.get("cover_id")
-    if cover_id:
-        cover_data = download_cover(cover_id)
+    # 4. Agrégation des tags (fusion sans doublon, ordre des sources conservé)
+    all_tags = list(dict.fromkeys((*(ol_data.get("tags") or []), *(google_data.get("tags") or []))))
 
     result = {
         "genre": genre,
         "summary": summary,
         "tags": all_tags,
-        "cover_data": cover_data,
+        # Couverture (via OpenLibrary uniquement - meilleure qualité): l'image n'est
+        # pas téléchargée ici, la plupart des parcours (aperçu, résumé CLI) ne l'écrivent pas
+        "cover_id": ol_data.get("cover_id"),
         "ol_pub_date": ol_data.get("publication_date"),
         "ol_publisher": ol_data.get("publisher"),
+        "related_docs": ol_data.get("related_docs") or [],
     }
 
     logger.info(
@@ -7,7 +7,14 @@ vers un ensemble normalisé de genres standards.
 """
 
 import logging
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+try:
+    import ahocorasick
+except ImportError:  # Dépendance optionnelle (extra "fast")
+    ahocorasick = None
 
 from ..text_utils import classify_genre_from_text
 
@@ -32,6 +39,54 @@ GENRE_MAPPING = {
     "Children": ["Children's", "Kids", "Young Adult"],
 }
 
+# Index précalculés (en minuscules) pour éviter de reconstruire les listes à chaque appel.
+# Un mot-clé présent dans plusieurs genres est associé au premier d'entre eux, ce qui
+# respecte l'ordre de priorité de GENRE_MAPPING.
+_GENRES = list(GENRE_MAPPING)
+_KEYWORD_TO_RANK: Dict[str, int] = {}
+for _rank, _keywords in enumerate(GENRE_MAPPING.values()):
+    for _keyword in _keywords:
+        _KEYWORD_TO_RANK.setdefault(_keyword.lower(), _rank)
+
+
+def _build_subject_automaton():
+    """
+    Construit un automate Aho-Corasick sur les mots-clés de GENRE_MAPPING.
+
+    Chaque mot-clé est associé au rang de son genre: un seul parcours du
+    sujet suffit pour trouver tous les mots-clés présents.
+
+    Returns:
+        Automate prêt à l'emploi, ou None si pyahocorasick n'est pas installé
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, rank in _KEYWORD_TO_RANK.items():
+        automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_SUBJECT_AUTOMATON = _build_subject_automaton()
+
+# Repli sans pyahocorasick: une seule alternation compilée, parcourue en C.
+# Le lookahead autorise les correspondances chevauchantes; les mots-clés sont
+# rangés par priorité, donc seul le meilleur rang est retenu à chaque position.
+_SUBJECT_RE = re.compile("(?=(" + "|".join(map(re.escape, _KEYWORD_TO_RANK)) + "))")
+
+
+@lru_cache(maxsize=8192)
+def _tag_rank(tag: str) -> Optional[int]:
+    """
+    Rang du genre correspondant à un tag (None si aucun).
+
+    Le vocabulaire des tags est réduit et se répète d'un livre à l'autre:
+    la mise en cache évite de recalculer tag.lower() pour chaque livre.
+    """
+    return _KEYWORD_TO_RANK.get(tag.lower())
+
 
 def map_tags_to_genre(tags: List[str]) -> Optional[str]:
     """
@@ -49,17 +104,22 @@ def map_tags_to_genre(tags: List[str]) -> Optional[str]:
     if not tags:
         return None
 
-    for genre, keywords in GENRE_MAPPING.items():
-        if any(tag.lower() in [k.lower() for k in keywords] for tag in tags):
-            return genre
-
-    return None
+    # Le genre le plus prioritaire parmi ceux reconnus dans les tags
+    best_rank = min(
+        (rank for tag in tags if (rank := _tag_rank(tag)) is not None),
+        default=None,
+    )
+    return _GENRES[best_rank] if best_rank is not None else None
 
 
+@lru_cache(maxsize=8192)
 def map_openlibrary_subject_to_genre(subject: str) -> Optional[str]:
     """
     Mappe un sujet OpenLibrary vers un genre standard.
 
+    Comme pour les tags, les sujets se répètent d'un livre à l'autre:
+    le résultat est mis en cache par sujet.
+
     Args:
         subject: Sujet OpenLibrary (chaîne de caractères)
 
@@ -68,12 +128,16 @@ def map_openlibrary_subject_to_genre(subject: str) -> Optional[str]:
     """
     subject_lower = subject.lower()
 
-    for genre, keywords in GENRE_MAPPING.items():
-        for keyword in keywords:
-            if keyword.lower() in subject_lower:
-                return genre
+    if _SUBJECT_AUTOMATON is not None:
+        # Un seul parcours du sujet; le genre le plus prioritaire l'emporte
+        best_rank = min((rank for _, rank in _SUBJECT_AUTOMATON.iter(subject_lower)), default=None)
+        return _GENRES[best_rank] if best_rank is not None else None
 
-    return None
+    best_rank = min(
+        (_KEYWORD_TO_RANK[m.group(1)] for m in _SUBJECT_RE.finditer(subject_lower)),
+        default=None,
+    )
+    return _GENRES[best_rank] if best_rank is not None else None
 
 
 def aggregate_genre(ol_tags: List[str], google_tags: List[str], summary_text: str) -> Optional[str]:
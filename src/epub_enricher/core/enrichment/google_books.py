@@ -7,15 +7,20 @@ des métadonnées complémentaires (résumé, tags/catégories).
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from ..network_utils import http_get
+from ..cache import cached
+from ..network_utils import http_get_json
 from ..text_utils import clean_html_text, clean_text
 
 logger = logging.getLogger(__name__)
 
 # Configuration API
 GOOGLE_BOOKS_API = "https://www.googleapis.com/books/v1/volumes"
+GOOGLE_BATCH_SIZE = 40  # maxResults maximal autorisé par l'API
+# Réponse partielle: seuls les champs lus par _parse_google_book (et l'ISBN pour
+# les lots) sont renvoyés, ce qui réduit le volume transféré et décodé.
+GOOGLE_BOOKS_FIELDS = "items/volumeInfo(description,categories,industryIdentifiers)"
 
 
 def _parse_google_book(item: Dict) -> Dict[str, Any]:
@@ -37,18 +42,80 @@ def _parse_google_book(item: Dict) -> Dict[str, Any]:
     # Extraction des catégories/sujets
     raw_tags = info.get("categories") or info.get("subjects")
     if raw_tags:
-        metadata["tags"] = [clean_text(t) for t in raw_tags if clean_text(t)]
+        # Dédoublonnage insensible à la casse, en gardant la première forme vue
+        tags: Dict[str, str] = {}
+        for raw in raw_tags:
+            tag = clean_text(raw)
+            if tag:
+                tags.setdefault(tag.lower(), tag)
+        metadata["tags"] = list(tags.values())
 
     return metadata
 
 
-def query_google_books(title: Optional[str] = None, isbn: Optional[str] = None) -> Dict[str, Any]:
+def query_google_books_batch(isbns: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Recherche plusieurs ISBN en une requête Google Books (isbn:A OR isbn:B ...).
+
+    Les résultats sont rattachés à l'ISBN demandé via les industryIdentifiers
+    (ISBN-10 ou ISBN-13) de chaque volume.
+
+    Args:
+        isbns: Liste d'ISBN (doublons et valeurs vides ignorés)
+
+    Returns:
+        Dictionnaire ISBN -> métadonnées (summary, tags). Un ISBN absent d'une
+        réponse complète (moins de résultats que maxResults) est associé à {}:
+        Google Books ne le connaît pas, inutile de le redemander seul. Les ISBN
+        d'un lot en échec ou tronqué sont absents.
+    """
+    unique = list(dict.fromkeys(i for i in isbns if i))
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for start in range(0, len(unique), GOOGLE_BATCH_SIZE):
+        chunk = unique[start : start + GOOGLE_BATCH_SIZE]
+        params = {
+            "q": " OR ".join(f"isbn:{isbn}" for isbn in chunk),
+            "maxResults": GOOGLE_BATCH_SIZE,
+            "langRestrict": "fr|en",
+            "fields": GOOGLE_BOOKS_FIELDS,
+        }
+        try:
+            items = http_get_json(GOOGLE_BOOKS_API, params=params).get("items") or []
+        except Exception as e:
+            logger.warning("Google Books batch query failed for %d ISBN(s): %s", len(chunk), e)
+            continue
+
+        wanted = set(chunk)
+        if len(items) < GOOGLE_BATCH_SIZE:
+            # Réponse complète: les ISBN sans volume n'existent pas chez Google Books
+            results.update({isbn: {} for isbn in wanted if isbn not in results})
+        for item in items:
+            identifiers = item.get("volumeInfo", {}).get("industryIdentifiers", [])
+            for ident in identifiers:
+                isbn = ident.get("identifier")
+                if isbn in wanted and not results.get(isbn):
+                    results[isbn] = _parse_google_book(item)
+
+    found = sum(1 for metadata in results.values() if metadata)
+    logger.info("Google Books batch: %d/%d ISBN(s) found", found, len(unique))
+    return results
+
+
+@cached("google_books", ignore=("prefetched",))
+def query_google_books(
+    title: Optional[str] = None,
+    isbn: Optional[str] = None,
+    prefetched: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Recherche Google Books par ISBN ou titre.
 
     Args:
         title: Titre du livre (optionnel)
         isbn: Code ISBN (optionnel)
+        prefetched: Résultat de cet ISBN déjà obtenu par query_google_books_batch
+            (renvoyé sans requête et mis en cache; ne change pas la clé de cache)
 
     Returns:
         Dictionnaire avec les métadonnées trouvées (summary, tags) ou {}
@@ -59,13 +126,21 @@ def query_google_books(title: Optional[str] = None, isbn: Optional[str] = None)
     if not (title or isbn):
         return {}
 
+    # Résultat déjà obtenu par une requête groupée
+    if prefetched is not None:
+        return prefetched
+
     # Construction de la requête (priorité ISBN)
     query = f"isbn:{isbn}" if isbn else f"intitle:{title}"
-    params = {"q": query, "maxResults": 1, "langRestrict": "fr|en"}
+    params = {
+        "q": query,
+        "maxResults": 1,
+        "langRestrict": "fr|en",
+        "fields": GOOGLE_BOOKS_FIELDS,
+    }
 
     try:
-        r = http_get(GOOGLE_BOOKS_API, params=params)
-        data = r.json()
+        data = http_get_json(GOOGLE_BOOKS_API, params=params)
         items = data.get("items")
 
         if items:
@@ -10,7 +10,10 @@ import logging
 from typing import Optional
 from urllib.parse import quote
 
-from ..network_utils import http_get
+import requests
+
+from ..cache import cached
+from ..network_utils import http_get_json
 from ..text_utils import clean_html_text
 
 logger = logging.getLogger(__name__)
@@ -51,16 +54,36 @@ def query_wikipedia_summary(title: str) -> Optional[str]:
     """
     if not title:
         return None
+    return _fetch_wikipedia_summary(title) or None
+
 
+# Une page absente (404) ou sans résumé est une réponse définitive: elle est
+# mise en cache sous la forme "" (cache négatif), contrairement aux échecs
+# réseau (None) qui pourront être retentés.
+@cached("wikipedia", should_cache=lambda summary: summary is not None)
+def _fetch_wikipedia_summary(title: str) -> Optional[str]:
+    """
+    Interroge l'API REST Wikipedia pour un titre.
+
+    Returns:
+        Résumé nettoyé, "" si la page n'existe pas ou n'a pas de résumé,
+        None en cas d'échec réseau
+    """
     # L'API utilise le titre de la page encodé dans l'URL
     encoded_title = quote(title, safe="")
     url = f"{WIKIPEDIA_API}/{encoded_title}"
 
     try:
-        r = http_get(url)
-        data = r.json()
+        data = http_get_json(url)
         logger.info("Wikipedia: Found summary for %s.", title)
-        return _parse_wiki_page(data)
+        return _parse_wiki_page(data) or ""
+
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            logger.info("Wikipedia: No page for '%s'.", title)
+            return ""
+        logger.info("Failed to get Wikipedia summary for '%s': %s", title, e)
+        return None
 
     except Exception as e:
         logger.info("Failed to get Wikipedia summary for '%s': %s", title, e)
@@ -7,11 +7,12 @@ des fichiers EPUB en respectant la séparation des responsabilités.
 """
 
 # Exports publics pour compatibilité rétroactive
-from .reader import extract_metadata, safe_read_epub
+from .reader import extract_metadata, extract_metadata_many, safe_read_epub
 from .writer import update_epub_with_metadata
 
 __all__ = [
     "extract_metadata",
+    "extract_metadata_many",
     "safe_read_epub",
     "update_epub_with_metadata",
 ]
@@ -11,9 +11,11 @@ Pattern: Strategy Pattern pour les différentes méthodes de recherche.
 import logging
 from typing import Optional
 
-from ebooklib import epub
+import ebooklib
 from ebooklib.epub import EpubBook, EpubItem
 
+from .fast_reader import FastEpub
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +29,7 @@ def _find_cover_by_type(book: EpubBook) -> Optional[EpubItem]:
     Returns:
         Item de couverture ou None
     """
-    items = list(book.get_items_of_type(epub.ITEM_COVER))
+    items = list(book.get_items_of_type(ebooklib.ITEM_COVER))
     if items:
         logger.info("Cover found via ITEM_COVER")
         return items[0]
@@ -38,18 +40,23 @@ def _find_cover_by_opf(book: EpubBook) -> Optional[EpubItem]:
     """
     Stratégie 2: Chercher dans les métadonnées OPF.
 
+    Avec la lecture rapide, l'id est lu par XPath sur l'OPF déjà parsé.
+
     Args:
         book: Objet EpubBook
 
     Returns:
         Item de couverture ou None
     """
-    meta_cover = book.get_metadata("OPF", "cover")
-    if meta_cover:
-        cover_id = meta_cover[0][1].get("content")
-        if cover_id:
-            logger.info("Cover found via OPF metadata")
-            return book.get_item_with_id(cover_id)
+    if isinstance(book, FastEpub):
+        cover_id = book.get_cover_id()
+    else:
+        meta_cover = book.get_metadata("OPF", "cover")
+        cover_id = meta_cover[0][1].get("content") if meta_cover else None
+
+    if cover_id:
+        logger.info("Cover found via OPF metadata")
+        return book.get_item_with_id(cover_id)
     return None
 
 
@@ -67,17 +74,23 @@ def _find_cover_by_bruteforce(book: EpubBook) -> Optional[EpubItem]:
         Item de couverture (meilleure estimation) ou None
     """
     logger.info("Standard cover methods failed. Trying brute-force...")
-    images = list(book.get_items_of_type(epub.ITEM_IMAGE))
-    if images:
-        # Trier pour prioriser les images avec "cover" dans le nom
-        images.sort(
-            key=lambda x: (
-                0 if "cover" in x.get_name().lower() else 1 if "couv" in x.get_name().lower() else 2
-            )
-        )
-        logger.info("Cover found via brute-force: %s", images[0].get_name())
-        return images[0]
-    return None
+    first_couv = first_image = None
+
+    # Un seul parcours: une image "cover" ne peut pas être battue, on s'arrête dessus
+    for image in book.get_items_of_type(ebooklib.ITEM_IMAGE):
+        name = image.get_name().lower()
+        if "cover" in name:
+            first_image = first_couv = image
+            break
+        if first_couv is None and "couv" in name:
+            first_couv = image
+        if first_image is None:
+            first_image = image
+
+    best = first_couv or first_image
+    if best:
+        logger.info("Cover found via brute-force: %s", best.get_name())
+    return best
 
 
 def find_cover_data(book: EpubBook, epub_path: str) -> Optional[bytes]:
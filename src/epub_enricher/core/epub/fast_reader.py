@@ -0,0 +1,267 @@
+# epub_enricher/src/epub_enricher/core/epub/fast_reader.py
+"""
+Module de lecture EPUB rapide.
+
+Responsabilité unique: Lire les métadonnées OPF et le manifeste directement
+depuis l'archive ZIP, sans charger tout le contenu du livre comme le fait
+ebooklib. L'OPF est parsé en flux jusqu'à la fin du manifeste (spine et
+guide ne sont pas lus) et le contenu des items n'est lu qu'à la demande.
+
+L'objet retourné expose le sous-ensemble de l'API d'EpubBook utilisé par
+la lecture (get_metadata, get_items_of_type, get_item_with_id), ce qui
+permet de le passer aux extracteurs existants.
+"""
+
+import logging
+import posixpath
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+import ebooklib
+from ebooklib.epub import NAMESPACES
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_PATH = "META-INF/container.xml"
+
+MetadataValue = Tuple[Optional[str], Dict[str, str]]
+
+# Expressions XPath compilées une seule fois, évaluées sur la racine <package>
+_OPF_NS = {"opf": NAMESPACES["OPF"]}
+_XP_COVER_META = etree.XPath("opf:metadata/opf:meta[@name='cover']/@content", namespaces=_OPF_NS)
+_XP_MANIFEST_ITEMS = etree.XPath("opf:manifest/opf:item[@href]", namespaces=_OPF_NS)
+
+
+class ZipItem:
+    """Item du manifeste dont le contenu est lu à la demande dans l'archive."""
+
+    __slots__ = (
+        "_zip",
+        "_path",
+        "_type",
+        "_prefix",
+        "_prefix_size",
+        "id",
+        "file_name",
+        "media_type",
+        "properties",
+    )
+
+    def __init__(
+        self,
+        zf: zipfile.ZipFile,
+        path: str,
+        uid: str,
+        file_name: str,
+        media_type: str,
+        properties: List[str],
+    ):
+        self._zip = zf
+        self._path = path
+        self.id = uid
+        self.file_name = file_name
+        self.media_type = media_type
+        self.properties = properties
+        self._type = self._detect_type()
+        # Dernier préfixe lu (et taille demandée): les analyses de contenu
+        # successives (ISBN puis langue) ne décompressent le début qu'une fois
+        self._prefix: Optional[bytes] = None
+        self._prefix_size = 0
+
+    def _detect_type(self) -> int:
+        """Type d'item au sens d'ebooklib, déduit une fois du media-type et des propriétés."""
+        if self.media_type.startswith("image/"):
+            if "cover-image" in self.properties:
+                return ebooklib.ITEM_COVER
+            return ebooklib.ITEM_IMAGE
+        if self.media_type == "application/xhtml+xml":
+            if "nav" in self.properties:
+                return ebooklib.ITEM_NAVIGATION
+            return ebooklib.ITEM_DOCUMENT
+        return ebooklib.ITEM_UNKNOWN
+
+    def get_id(self) -> str:
+        return self.id
+
+    def get_name(self) -> str:
+        return self.file_name
+
+    def get_type(self) -> int:
+        """Retourne le type d'item au sens d'ebooklib (ITEM_DOCUMENT, ITEM_IMAGE...)."""
+        return self._type
+
+    def get_content(self) -> bytes:
+        return self._zip.read(self._path)
+
+    def read_prefix(self, size: int) -> bytes:
+        """Lit les size premiers octets de l'item sans décompresser le reste."""
+        if self._prefix is not None and size <= self._prefix_size:
+            return self._prefix[:size]
+        with self._zip.open(self._path) as f:
+            self._prefix = f.read(size)
+        self._prefix_size = size
+        return self._prefix
+
+
+class FastEpub:
+    """Vue légère d'un EPUB ouvert: métadonnées OPF et manifeste."""
+
+    def __init__(
+        self,
+        zf: zipfile.ZipFile,
+        opf: etree._Element,
+        metadata: Dict[str, Dict[str, List[MetadataValue]]],
+        items: List[ZipItem],
+    ):
+        self._zip = zf
+        self.opf = opf
+        self.metadata = metadata
+        self.items = items
+        self._items_by_id = {item.id: item for item in items}
+        # Items groupés par type (ordre du manifeste conservé): chaque recherche
+        # de couverture ou de documents ne parcourt que les items concernés
+        self._items_by_type: Dict[int, List[ZipItem]] = {}
+        for item in items:
+            self._items_by_type.setdefault(item.get_type(), []).append(item)
+
+    def get_metadata(self, namespace: str, name: str) -> List[MetadataValue]:
+        namespace = NAMESPACES.get(namespace, namespace)
+        return self.metadata.get(namespace, {}).get(name, [])
+
+    def get_cover_id(self) -> Optional[str]:
+        """Retourne l'id déclaré par <meta name="cover"> dans l'OPF déjà parsé."""
+        cover_ids = _XP_COVER_META(self.opf)
+        return cover_ids[0] if cover_ids else None
+
+    def get_item_with_id(self, uid: str) -> Optional[ZipItem]:
+        return self._items_by_id.get(uid)
+
+    def get_items_of_type(self, item_type: int) -> Iterator[ZipItem]:
+        return iter(self._items_by_type.get(item_type, ()))
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "FastEpub":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _parse_xml(data: bytes) -> etree._Element:
+    """Parse un document XML de l'archive sans résolution d'entités externes."""
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    return etree.fromstring(data, parser)
+
+
+def _find_opf_path(zf: zipfile.ZipFile) -> str:
+    """Trouve le chemin du fichier OPF via META-INF/container.xml."""
+    container = _parse_xml(zf.read(CONTAINER_PATH))
+    rootfile = container.find(".//{%s}rootfile" % NAMESPACES["CONTAINERNS"])
+    if rootfile is None or not rootfile.get("full-path"):
+        raise ValueError("No rootfile in container.xml")
+    return rootfile.get("full-path")
+
+
+def _parse_opf(zf: zipfile.ZipFile, opf_path: str) -> etree._Element:
+    """
+    Parse l'OPF en flux et s'arrête dès la fin du manifeste.
+
+    Returns:
+        Élément racine <package> contenant les métadonnées et le manifeste
+    """
+    with zf.open(opf_path) as f:
+        context = etree.iterparse(
+            f,
+            events=("end",),
+            tag="{%s}manifest" % NAMESPACES["OPF"],
+            resolve_entities=False,
+            no_network=True,
+        )
+        for _, manifest in context:
+            return manifest.getparent()
+        return context.root
+
+
+def _parse_metadata(opf: etree._Element) -> Dict[str, Dict[str, List[MetadataValue]]]:
+    """
+    Extrait les métadonnées OPF au format d'ebooklib.
+
+    Returns:
+        {namespace: {nom: [(valeur, attributs), ...]}}
+    """
+    metadata_el = opf.find("{%s}metadata" % NAMESPACES["OPF"])
+    if metadata_el is None:
+        raise ValueError("No metadata element in OPF")
+
+    metadata: Dict[str, Dict[str, List[MetadataValue]]] = {}
+    for el in metadata_el:
+        if not isinstance(el.tag, str):
+            continue  # Commentaires et instructions de traitement
+
+        qname = etree.QName(el)
+        if qname.localname == "meta" and qname.namespace == NAMESPACES["OPF"]:
+            # <meta name="cover" content="..."/> et métadonnées préfixées (calibre:...)
+            name = el.get("name")
+            prefix = None
+            if name and ":" in name:
+                prefix, name = name.split(":", 1)
+            namespace = el.nsmap.get(prefix, prefix)
+        else:
+            namespace, name = qname.namespace, qname.localname
+
+        metadata.setdefault(namespace, {}).setdefault(name, []).append((el.text, dict(el.items())))
+    return metadata
+
+
+def _parse_manifest(zf: zipfile.ZipFile, opf: etree._Element, opf_dir: str) -> List[ZipItem]:
+    """Construit la liste des items du manifeste (dans l'ordre de l'OPF)."""
+    items = []
+    for el in _XP_MANIFEST_ITEMS(opf):
+        file_name = unquote(el.get("href"))
+        items.append(
+            ZipItem(
+                zf,
+                posixpath.normpath(posixpath.join(opf_dir, file_name)),
+                el.get("id"),
+                file_name,
+                el.get("media-type", ""),
+                el.get("properties", "").split(),
+            )
+        )
+    return items
+
+
+def read_epub_fast(epub_path: str) -> Optional[FastEpub]:
+    """
+    Ouvre un EPUB en ne lisant que container.xml et l'OPF.
+
+    L'archive reste ouverte pour la lecture à la demande des items:
+    l'appelant doit fermer l'objet retourné (close() ou bloc with).
+
+    Args:
+        epub_path: Chemin vers le fichier EPUB
+
+    Returns:
+        FastEpub si succès, None si le fichier n'a pas pu être lu
+        (l'appelant peut alors se rabattre sur ebooklib)
+    """
+    try:
+        zf = zipfile.ZipFile(epub_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        logger.debug("Fast EPUB read failed for %s: %s", epub_path, e)
+        return None
+
+    try:
+        opf_path = _find_opf_path(zf)
+        opf = _parse_opf(zf, opf_path)
+        return FastEpub(
+            zf, opf, _parse_metadata(opf), _parse_manifest(zf, opf, posixpath.dirname(opf_path))
+        )
+    except Exception as e:
+        zf.close()
+        logger.info("Fast EPUB read failed for %s, falling back to ebooklib: %s", epub_path, e)
+        return None
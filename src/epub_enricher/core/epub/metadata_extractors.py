@@ -6,43 +6,205 @@ Responsabilité unique: Fournir des extracteurs spécialisés pour
 les métadonnées difficiles à obtenir (langue, ISBN depuis le texte).
 """
 
+import hashlib
 import logging
-import re
-from typing import Optional
-
-from ebooklib import epub
-from ebooklib.epub import EpubBook
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import List, Optional
+
+from ebooklib.epub import EpubItem
 from isbnlib import canonical, is_isbn10, is_isbn13
+from lxml import etree
+
+try:
+    import gcld3
+except ImportError:  # Dépendance optionnelle (extra "fast")
+    gcld3 = None
+
+from ...config import (
+    CLD3_MAX_BYTES,
+    CLD3_MIN_BYTES,
+    ISBN_BYTES_RE,
+    ISBN_SCAN_BYTES,
+    ISBN_SCAN_DOCS,
+    ISBN_VALIDATION_MEMO_SIZE,
+    LANG_DETECT_MEMO_SIZE,
+    LANG_SAMPLE_CHARS,
+    LANG_SCAN_BYTES,
+    LANGDETECT_LANGUAGES,
+)
+from .fast_reader import ZipItem
 
 logger = logging.getLogger(__name__)
 
 
-def detect_language_from_text(book: EpubBook) -> Optional[str]:
+# Fabrique langdetect propre au module, limitée à LANGDETECT_LANGUAGES.
+# Construite au premier besoin (une fois par processus) au lieu de la
+# fabrique globale de langdetect qui charge les 55 profils.
+_detector_factory = None
+_detector_factory_lock = threading.Lock()
+
+
+def _get_detector_factory():
+    """Retourne la fabrique langdetect restreinte, en la créant si nécessaire."""
+    global _detector_factory
+    with _detector_factory_lock:
+        if _detector_factory is None:
+            from langdetect.detector_factory import PROFILES_DIRECTORY, DetectorFactory
+
+            profiles = []
+            for lang in LANGDETECT_LANGUAGES:
+                with open(os.path.join(PROFILES_DIRECTORY, lang), encoding="utf-8") as f:
+                    profiles.append(f.read())
+
+            factory = DetectorFactory()
+            factory.load_json_profile(profiles)
+            _detector_factory = factory
+        return _detector_factory
+
+
+# Identifiant CLD3 (réseau de neurones compact, bien plus rapide que
+# langdetect), créé au premier besoin. L'appel n'étant pas documenté comme
+# thread-safe, il est protégé par un verrou.
+_cld3_identifier = None
+_cld3_lock = threading.Lock()
+
+
+def _detect_with_cld3(sample: str) -> Optional[str]:
+    """
+    Détecte la langue avec CLD3 (extra "fast").
+
+    Returns:
+        Code de langue, ou None si gcld3 n'est pas installé ou si le
+        résultat n'est pas fiable (l'appelant se rabat sur langdetect)
+    """
+    global _cld3_identifier
+    if gcld3 is None:
+        return None
+    with _cld3_lock:
+        if _cld3_identifier is None:
+            _cld3_identifier = gcld3.NNetLanguageIdentifier(
+                min_num_bytes=CLD3_MIN_BYTES, max_num_bytes=CLD3_MAX_BYTES
+            )
+        result = _cld3_identifier.FindLanguage(sample)
+    return result.language if result.is_reliable else None
+
+
+def _detect_with_langdetect(sample: str) -> str:
+    """Détecte la langue avec langdetect (profils restreints)."""
+    detector = _get_detector_factory().create()
+    detector.append(sample)
+    return detector.detect()
+
+
+# Langues déjà détectées, indexées par empreinte de l'échantillon: les pages
+# liminaires se répètent d'un livre à l'autre (séries, même éditeur)
+_detected_languages: "OrderedDict[bytes, str]" = OrderedDict()
+_detected_languages_lock = threading.Lock()
+
+
+def _detect_language(sample: str) -> str:
+    """Détecte la langue d'un échantillon: CLD3 si disponible, sinon langdetect (mémoïsé)."""
+    key = hashlib.blake2b(sample.encode("utf-8", errors="ignore"), digest_size=8).digest()
+    with _detected_languages_lock:
+        if key in _detected_languages:
+            _detected_languages.move_to_end(key)
+            return _detected_languages[key]
+
+    lang = _detect_with_cld3(sample) or _detect_with_langdetect(sample)
+
+    with _detected_languages_lock:
+        _detected_languages[key] = lang
+        if len(_detected_languages) > LANG_DETECT_MEMO_SIZE:
+            _detected_languages.popitem(last=False)
+    return lang
+
+
+@lru_cache(maxsize=ISBN_VALIDATION_MEMO_SIZE)
+def validate_isbn(raw: str) -> Optional[str]:
+    """
+    Valide un ISBN candidat (séparateurs tolérés).
+
+    Le candidat n'est normalisé qu'une fois, puis seul le contrôle
+    correspondant à sa longueur (ISBN-10 ou ISBN-13) est appliqué.
+    Fonction pure: les candidats récurrents (identifiants d'une même
+    collection, numéros répétés dans les pages liminaires) sont mémoïsés.
+
+    Returns:
+        ISBN canonique, ou None si le candidat n'est pas un ISBN valide
+    """
+    isbn = canonical(raw)
+    if len(isbn) == 10:
+        return isbn if is_isbn10(isbn) else None
+    if len(isbn) == 13:
+        return isbn if is_isbn13(isbn) else None
+    return None
+
+
+def _read_prefix(item: EpubItem, size: int) -> bytes:
+    """
+    Lit le début du contenu d'un document.
+
+    Avec la lecture rapide, seul ce début est décompressé depuis l'archive;
+    les items ebooklib ont déjà leur contenu en mémoire.
+    """
+    if isinstance(item, ZipItem):
+        return item.read_prefix(size)
+    return item.get_content()[:size]
+
+
+def _html_text(html: bytes, max_chars: int) -> str:
+    """
+    Extrait le texte d'un fragment HTML (espaces normalisés).
+
+    Le parseur HTML de lxml travaille en temps linéaire, tolère un document
+    tronqué (préfixe) et décode lui-même l'UTF-8: environ deux fois plus
+    rapide que le nettoyage par expression régulière sur LANG_SCAN_BYTES.
+
+    Args:
+        html: Début du document (octets UTF-8)
+        max_chars: Longueur maximale du texte retourné
+
+    Returns:
+        Texte sur une ligne, au plus max_chars caractères
+    """
+    root = etree.HTML(html, etree.HTMLParser(encoding="utf-8", no_network=True))
+    if root is None:
+        return ""
+    text = etree.tostring(root, method="text", encoding="unicode")
+    return " ".join(text.split())[:max_chars]
+
+
+def detect_language_from_text(docs: List[EpubItem]) -> Optional[str]:
     """
     Détecte la langue du livre depuis son contenu textuel.
 
     Fallback utilisé quand la métadonnée DC language est absente.
-    Analyse les 3000 premiers caractères du premier document.
+    Analyse les LANG_SAMPLE_CHARS premiers caractères de texte du premier
+    document; seul le début du HTML (LANG_SCAN_BYTES) est lu et analysé.
+    CLD3 est utilisé s'il est installé (extra "fast"); sinon, ou si son
+    résultat n'est pas fiable, langdetect avec les seuls profils de
+    LANGDETECT_LANGUAGES.
 
     Args:
-        book: Objet EpubBook
+        docs: Documents XHTML du livre (dans l'ordre du manifeste)
 
     Returns:
         Code de langue (ex: 'fr', 'en') ou None si échec
     """
     try:
-        from langdetect import detect
-
-        docs = list(book.get_items_of_type(epub.ITEM_DOCUMENT))
         if docs:
-            # Prendre le premier document
-            text = docs[0].get_content().decode("utf-8", errors="ignore")
+            # Prendre le début du premier document
+            html = _read_prefix(docs[0], LANG_SCAN_BYTES)
 
-            # Nettoyer du HTML et prendre un échantillon
-            sample = re.sub("<[^<]+?>", "", text)[:3000]
+            # Extraire le texte du HTML et prendre un échantillon
+            sample = _html_text(html, LANG_SAMPLE_CHARS)
 
             if sample.strip():
-                detected_lang = detect(sample)
+                detected_lang = _detect_language(sample)
                 logger.info("Language detected from text: %s", detected_lang)
                 return detected_lang
 
@@ -54,31 +216,33 @@ def detect_language_from_text(book: EpubBook) -> Optional[str]:
     return None
 
 
-def find_isbn_in_text(book: EpubBook) -> Optional[str]:
+def find_isbn_in_text(docs: List[EpubItem]) -> Optional[str]:
     """
     Recherche un ISBN dans le contenu textuel du livre.
 
     Fallback utilisé quand l'ISBN n'est pas dans les métadonnées.
-    Scanne tous les documents XHTML à la recherche d'un ISBN valide.
+    Scanne le début (ISBN_SCAN_BYTES octets) des ISBN_SCAN_DOCS premiers
+    puis des ISBN_SCAN_DOCS derniers documents XHTML (page de copyright ou
+    colophon) et s'arrête au premier ISBN valide. Le motif étant purement
+    ASCII, le contenu brut est analysé directement, sans décodage UTF-8.
 
     Args:
-        book: Objet EpubBook
+        docs: Documents XHTML du livre (dans l'ordre du manifeste)
 
     Returns:
         ISBN canonique ou None si non trouvé
     """
-    from ...config import ISBN_RE
-
     try:
-        for item in book.get_items_of_type(epub.ITEM_DOCUMENT):
-            txt = item.get_content().decode("utf-8", errors="ignore")
-            m = ISBN_RE.search(txt)
+        # Début puis fin du livre, sans analyser deux fois un même document
+        head = docs[:ISBN_SCAN_DOCS]
+        tail = docs[max(ISBN_SCAN_DOCS, len(docs) - ISBN_SCAN_DOCS) :]
+        for item in chain(head, reversed(tail)):
+            content = _read_prefix(item, ISBN_SCAN_BYTES)
 
-            if m:
-                raw = m.group(0)
+            for m in ISBN_BYTES_RE.finditer(content):
                 # Valider que c'est bien un ISBN
-                if is_isbn10(raw) or is_isbn13(raw):
-                    isbn = canonical(raw)
+                isbn = validate_isbn(m.group(0).decode("ascii"))
+                if isbn:
                     logger.info("ISBN found in text: %s", isbn)
                     return isbn
 
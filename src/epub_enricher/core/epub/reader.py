@@ -5,14 +5,21 @@ Module de lecture EPUB.
 Responsabilité unique: Extraire les métadonnées depuis les fichiers EPUB.
 """
 
+import base64
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import ebooklib
 from ebooklib import epub
-from ebooklib.epub import EpubBook
+from ebooklib.epub import NAMESPACES, EpubBook
 
+from ...config import ISBN_RE, METADATA_CACHE_MAX_COVER_BYTES, METADATA_CACHE_TTL
+from ..cache import cached, is_cache_enabled, set_cache_enabled
 from .cover_finder import find_cover_data
-from .metadata_extractors import detect_language_from_text, find_isbn_in_text
+from .fast_reader import MetadataValue, read_epub_fast
+from .metadata_extractors import detect_language_from_text, find_isbn_in_text, validate_isbn
 
 logger = logging.getLogger(__name__)
 
@@ -37,111 +44,231 @@ def safe_read_epub(epub_path: str) -> Optional[EpubBook]:
 # --- Extracteurs de métadonnées de base ---
 
 
-def _get_metadata_field(book: EpubBook, namespace: str, name: str) -> Optional[Any]:
+def _extract_all_dc(book: EpubBook) -> Dict[str, List[MetadataValue]]:
     """
-    Helper générique pour extraire un champ de métadonnées.
+    Récupère en une fois toutes les métadonnées Dublin Core du livre.
 
-    Args:
-        book: Objet EpubBook
-        namespace: Namespace de métadonnées (ex: 'DC')
-        name: Nom du champ (ex: 'title')
+    EpubBook et FastEpub rangent déjà leurs métadonnées par namespace puis
+    par nom: un seul accès remplace un appel à get_metadata par champ.
 
     Returns:
-        Valeur du champ ou None
+        {nom: [(valeur, attributs), ...]} (vide si illisible)
     """
     try:
-        meta = book.get_metadata(namespace, name)
-        if meta:
-            return meta[0][0]
+        return book.metadata.get(NAMESPACES["DC"], {})
     except Exception:
-        pass  # Le logging sera fait par l'appelant si nécessaire
-    return None
+        return {}
 
 
-def _get_title(book: EpubBook) -> Optional[str]:
-    """Extrait le titre du livre."""
-    return _get_metadata_field(book, "DC", "title")
+def _dc_values(book: EpubBook, name: str) -> List[MetadataValue]:
+    """Valeurs d'un champ DC (extracteurs unitaires), liste vide si absent."""
+    return _extract_all_dc(book).get(name) or []
 
 
-def _get_publisher(book: EpubBook) -> Optional[str]:
-    """Extrait l'éditeur du livre."""
-    return _get_metadata_field(book, "DC", "publisher")
+def _first_value(values: Optional[List[MetadataValue]]) -> Optional[str]:
+    """Première valeur d'un champ de métadonnées, ou None."""
+    return values[0][0] if values else None
 
 
-def _get_date(book: EpubBook) -> Optional[str]:
-    """Extrait la date de publication."""
-    return _get_metadata_field(book, "DC", "date")
+def _parse_authors(values: Optional[List[MetadataValue]]) -> Optional[List[str]]:
+    """
+    Convertit les valeurs DC creator en liste d'auteurs.
 
+    Returns:
+        Liste des auteurs ou None si aucun trouvé
+    """
+    authors = [a[0] if isinstance(a, tuple) else str(a) for a in values or ()]
+    return authors or None
 
-def _get_summary(book: EpubBook) -> Optional[str]:
-    """Extrait le résumé/description."""
-    return _get_metadata_field(book, "DC", "description")
 
+def _parse_tags(values: Optional[List[MetadataValue]]) -> Optional[List[str]]:
+    """
+    Convertit les valeurs DC subject en liste de tags.
 
-def _get_language(book: EpubBook) -> Optional[str]:
-    """Extrait la langue du livre."""
-    return _get_metadata_field(book, "DC", "language")
+    Returns:
+        Liste des tags ou None si aucun trouvé
+    """
+    return [s[0] for s in values or () if s[0]] or None
 
 
-def _get_authors(book: EpubBook) -> Optional[List[str]]:
+def _parse_identifier(values: Optional[List[MetadataValue]]) -> Optional[str]:
     """
-    Extrait la liste des auteurs.
+    Extrait l'ISBN canonique depuis les valeurs DC identifier.
 
     Returns:
-        Liste des auteurs ou None si aucun trouvé
+        ISBN canonique ou None
     """
-    try:
-        auths_meta = book.get_metadata("DC", "creator")
-        authors = []
-        for a in auths_meta:
-            authors.append(a[0] if isinstance(a, tuple) else str(a))
-        return authors if authors else None
-    except Exception:
-        return None
+    for candidate, _ in values or ():
+        # Une seule recherche par identifiant, une seule normalisation par candidat
+        if isinstance(candidate, str) and (match := ISBN_RE.search(candidate)):
+            isbn = validate_isbn(match.group(0))
+            if isbn:
+                return isbn
+    return None
+
+
+# Clé du résultat -> (élément DC, conversion des valeurs brutes).
+# Un champ absent donne None, sans try/except par champ.
+_DC_FIELDS: Dict[str, Tuple[str, Callable[[Optional[List[MetadataValue]]], Any]]] = {
+    "title": ("title", _first_value),
+    "authors": ("creator", _parse_authors),
+    "language": ("language", _first_value),
+    "identifier": ("identifier", _parse_identifier),
+    "publisher": ("publisher", _first_value),
+    "date": ("date", _first_value),
+    "summary": ("description", _first_value),
+    "tags": ("subject", _parse_tags),
+}
+
+
+def _get_title(book: EpubBook) -> Optional[str]:
+    """Extrait le titre du livre."""
+    return _first_value(_dc_values(book, "title"))
+
+
+def _get_language(book: EpubBook) -> Optional[str]:
+    """Extrait la langue du livre."""
+    return _first_value(_dc_values(book, "language"))
+
+
+def _get_authors(book: EpubBook) -> Optional[List[str]]:
+    """Extrait la liste des auteurs."""
+    return _parse_authors(_dc_values(book, "creator"))
 
 
 def _get_tags(book: EpubBook) -> Optional[List[str]]:
+    """Extrait les sujets/tags."""
+    return _parse_tags(_dc_values(book, "subject"))
+
+
+def _get_identifier(book: EpubBook) -> Optional[str]:
+    """Extrait l'ISBN canonique depuis les identifiants."""
+    return _parse_identifier(_dc_values(book, "identifier"))
+
+
+# --- Fonction principale d'extraction ---
+
+_METADATA_KEYS = (
+    "title",
+    "authors",
+    "language",
+    "identifier",
+    "publisher",
+    "date",
+    "tags",
+    "summary",
+    "cover_data",
+)
+# Gabarit copié à chaque extraction (copie superficielle: valeurs toutes None)
+_EMPTY_METADATA: Dict = dict.fromkeys(_METADATA_KEYS)
+
+
+def _encode_metadata(data: Dict) -> Dict:
+    """Rend les métadonnées sérialisables en JSON (couverture en base64)."""
+    cover = data.get("cover_data")
+    return {**data, "cover_data": base64.b64encode(cover).decode("ascii") if cover else None}
+
+
+def _decode_metadata(data: Dict) -> Dict:
+    """Inverse de _encode_metadata."""
+    cover = data.get("cover_data")
+    return {**data, "cover_data": base64.b64decode(cover) if cover else None}
+
+
+def extract_metadata(epub_path: str) -> Dict:
     """
-    Extrait les sujets/tags.
+    Extrait toutes les métadonnées d'un fichier EPUB.
+
+    Le résultat est mis en cache sur disque, indexé par le chemin, la taille
+    et la date de modification du fichier: un EPUB inchangé n'est pas relu.
+    Toute écriture dans le fichier invalide naturellement l'entrée.
+
+    Args:
+        epub_path: Chemin vers le fichier EPUB
 
     Returns:
-        Liste des tags ou None si aucun trouvé
+        Dictionnaire contenant toutes les métadonnées extraites
+        (voir _extract_metadata_uncached)
     """
     try:
-        subj_meta = book.get_metadata("DC", "subject")
-        return [s[0] for s in subj_meta if s[0]] or None
+        st = os.stat(epub_path)
+    except OSError:
+        return _extract_metadata_uncached(epub_path)
+    return _extract_metadata_cached(os.path.abspath(epub_path), st.st_size, st.st_mtime_ns)
+
+
+def _extract_metadata_safe(epub_path: str) -> Optional[Dict]:
+    """Variante d'extract_metadata qui journalise les erreurs au lieu de les propager."""
+    try:
+        return extract_metadata(epub_path)
     except Exception:
+        logger.exception("Failed to extract metadata from %s", epub_path)
         return None
 
 
-def _get_identifier(book: EpubBook) -> Optional[str]:
+def extract_metadata_many(
+    epub_paths: List[str],
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[Optional[Dict]]:
     """
-    Extrait l'ISBN canonique depuis les identifiants.
+    Extrait les métadonnées de plusieurs EPUBs en parallèle.
+
+    La lecture (décompression ZIP + parsing XML) est CPU-bound: elle est
+    répartie sur un pool de processus. Seuls les dictionnaires de
+    métadonnées traversent la frontière entre processus.
+
+    Args:
+        epub_paths: Chemins des fichiers EPUB
+        max_workers: Nombre de processus (défaut: nombre de CPU)
+        executor: Pool existant à utiliser à la place d'un nouveau pool de
+            processus (ex: ThreadPoolExecutor quand les fichiers sont petits)
 
     Returns:
-        ISBN canonique ou None
+        Métadonnées de chaque fichier, dans l'ordre des chemins
+        (None pour les fichiers en échec)
     """
-    from isbnlib import canonical, is_isbn10, is_isbn13
+    if len(epub_paths) < 2:
+        return [_extract_metadata_safe(p) for p in epub_paths]
 
-    from ...config import ISBN_RE
+    if executor is not None:
+        return list(executor.map(_extract_metadata_safe, epub_paths))
 
-    try:
-        ids_meta = book.get_metadata("DC", "identifier")
-        for ident in ids_meta:
-            candidate = ident[0]
-            if isinstance(candidate, str) and ISBN_RE.search(candidate):
-                m = ISBN_RE.search(candidate).group(0)
-                if is_isbn10(m) or is_isbn13(m):
-                    return canonical(m)
-    except Exception:
-        return None
-    return None
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=set_cache_enabled,
+        initargs=(is_cache_enabled(),),
+    ) as pool:
+        return list(pool.map(_extract_metadata_safe, epub_paths, chunksize=8))
 
 
-# --- Fonction principale d'extraction ---
+def _should_cache_metadata(data: Dict) -> bool:
+    """
+    Indique si des métadonnées extraites méritent une entrée de cache.
 
+    Les extractions vides (fichier illisible) ne sont pas conservées, ni
+    celles dont la couverture dépasse METADATA_CACHE_MAX_COVER_BYTES: elle
+    gonflerait la base SQLite pour un gain faible face à sa relecture.
+    """
+    cover = data.get("cover_data")
+    if cover and len(cover) > METADATA_CACHE_MAX_COVER_BYTES:
+        return False
+    return any(v is not None for v in data.values())
 
-def extract_metadata(epub_path: str) -> Dict:
+
+@cached(
+    "epub_metadata",
+    ttl=METADATA_CACHE_TTL,
+    should_cache=_should_cache_metadata,
+    encode=_encode_metadata,
+    decode=_decode_metadata,
+)
+def _extract_metadata_cached(epub_path: str, size: int, mtime_ns: int) -> Dict:
+    """Extraction mise en cache (taille et date ne servent qu'à la clé)."""
+    return _extract_metadata_uncached(epub_path)
+
+
+def _extract_metadata_uncached(epub_path: str) -> Dict:
     """
     Extrait toutes les métadonnées d'un fichier EPUB.
 
@@ -157,47 +284,44 @@ def extract_metadata(epub_path: str) -> Dict:
         Les clés possibles sont: title, authors, language, identifier,
         publisher, date, tags, summary, cover_data
     """
-    # Initialiser le dictionnaire de résultats
-    data = {
-        k: None
-        for k in [
-            "title",
-            "authors",
-            "language",
-            "identifier",
-            "publisher",
-            "date",
-            "tags",
-            "summary",
-            "cover_data",
-        ]
-    }
-
-    # Lire le fichier EPUB
-    book = safe_read_epub(epub_path)
+    data = _EMPTY_METADATA.copy()
+
+    # Lire le fichier EPUB: OPF seul via zipfile, ebooklib en secours
+    fast_book = read_epub_fast(epub_path)
+    book = fast_book or safe_read_epub(epub_path)
     if not book:
         logger.warning("Could not read EPUB file: %s", epub_path)
         return data
 
-    # Extraction des métadonnées de base
-    data["title"] = _get_title(book)
-    data["authors"] = _get_authors(book)
-    data["language"] = _get_language(book)
-    data["identifier"] = _get_identifier(book)
-    data["publisher"] = _get_publisher(book)
-    data["date"] = _get_date(book)
-    data["summary"] = _get_summary(book)
-    data["tags"] = _get_tags(book)
+    try:
+        _fill_metadata(data, book, epub_path)
+    finally:
+        if fast_book:
+            fast_book.close()
+
+    logger.info("Extracted metadata for %s", epub_path)
+    return data
+
+
+def _fill_metadata(data: Dict, book: EpubBook, epub_path: str) -> None:
+    """Remplit le dictionnaire de métadonnées depuis un livre ouvert."""
+    # Extraction des métadonnées de base (une seule lecture du bloc DC)
+    dc = _extract_all_dc(book)
+    for key, (dc_name, parse) in _DC_FIELDS.items():
+        data[key] = parse(dc.get(dc_name))
 
     # Extraction de la couverture
     data["cover_data"] = find_cover_data(book, epub_path)
 
-    # Logique de fallback pour les métadonnées manquantes
-    if not data["language"]:
-        data["language"] = detect_language_from_text(book)
+    # Logique de fallback pour les métadonnées manquantes.
+    # Les documents ne sont listés qu'une fois pour toutes les analyses de contenu.
+    if not data["language"] or not data["identifier"]:
+        docs = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
 
-    if not data["identifier"]:
-        data["identifier"] = find_isbn_in_text(book)
+        # ISBN d'abord: son préfixe (le plus long) du premier document est
+        # conservé par l'item et resservi à la détection de langue
+        if not data["identifier"]:
+            data["identifier"] = find_isbn_in_text(docs)
 
-    logger.info("Extracted metadata for %s", epub_path)
-    return data
+        if not data["language"]:
+            data["language"] = detect_language_from_text(docs)
@@ -6,14 +6,17 @@ Responsabilité unique: Écrire les métadonnées dans les fichiers EPUB
 en reconstruisant le fichier de manière propre.
 """
 
+import io
 import logging
 import os
-import traceback
-from typing import TYPE_CHECKING, Dict
+import zipfile
+from typing import TYPE_CHECKING, Callable, Dict, Iterable
 
 from ebooklib import epub
-from ebooklib.epub import EpubBook, EpubItem
+from ebooklib.epub import NAMESPACES, EpubBook, EpubItem
+from lxml import etree
 
+from .fast_reader import _find_opf_path, _parse_xml
 from .reader import _get_language, safe_read_epub
 
 if TYPE_CHECKING:
@@ -22,6 +25,139 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_DC_NS = NAMESPACES["DC"]
+_OPF_NS = NAMESPACES["OPF"]
+
+# Niveau deflate des entrées recopiées (celui d'origine n'est pas lisible dans
+# l'archive): défaut de zlib, compromis entre taille et temps de recompression
+_DEFLATE_LEVEL = 6
+
+
+# --- Mise à jour directe de l'OPF (métadonnées seules) ---
+
+
+def _has_new_cover(meta: "EpubMeta") -> bool:
+    """Indique si une couverture différente de l'originale doit être écrite."""
+    return bool(meta.suggested_cover_data) and meta.suggested_cover_data != meta.original_cover_data
+
+
+def _set_dc_values(metadata_el: etree._Element, name: str, values: Iterable[str]):
+    """
+    Remplace toutes les valeurs d'un champ DC du bloc <metadata>.
+
+    Les nouvelles valeurs prennent la place de la première ancienne; les
+    <meta refines="#id"> (EPUB 3) qui décrivaient les anciennes sont retirés.
+    """
+    old = metadata_el.findall(f"{{{_DC_NS}}}{name}")
+    old_ids = {f"#{el.get('id')}" for el in old if el.get("id")}
+    refines = [
+        el for el in metadata_el.iterchildren(f"{{{_OPF_NS}}}meta") if el.get("refines") in old_ids
+    ]
+
+    position = len(metadata_el)
+    if old:
+        position = metadata_el.index(old[0])
+        position -= sum(1 for el in refines if metadata_el.index(el) < position)
+    for el in old + refines:
+        metadata_el.remove(el)
+
+    for offset, value in enumerate(values):
+        # SubElement réutilise le préfixe "dc" déjà déclaré, puis l'élément est déplacé
+        el = etree.SubElement(metadata_el, f"{{{_DC_NS}}}{name}")
+        el.text = value
+        metadata_el.insert(position + offset, el)
+
+
+def _set_identifier(opf: etree._Element, metadata_el: etree._Element, isbn: str):
+    """Remplace la valeur de l'identifiant unique du livre (unique-identifier)."""
+    uid = opf.get("unique-identifier")
+    for el in metadata_el.iterchildren(f"{{{_DC_NS}}}identifier"):
+        if uid is None or el.get("id") == uid:
+            el.text = isbn
+            return
+    el = etree.SubElement(metadata_el, f"{{{_DC_NS}}}identifier")
+    el.text = isbn
+
+
+def _patch_opf_metadata(opf: etree._Element, meta: "EpubMeta"):
+    """
+    Applique les métadonnées suggérées directement dans l'OPF parsé.
+
+    Seuls les champs suggérés sont modifiés: les autres métadonnées,
+    le manifeste, le spine et le guide restent tels quels.
+    """
+    metadata_el = opf.find(f"{{{_OPF_NS}}}metadata")
+    if metadata_el is None:
+        raise ValueError("No metadata element in OPF")
+
+    if meta.suggested_title:
+        _set_dc_values(metadata_el, "title", [meta.suggested_title])
+    if meta.suggested_isbn:
+        _set_identifier(opf, metadata_el, meta.suggested_isbn)
+    if meta.suggested_language:
+        _set_dc_values(metadata_el, "language", [meta.suggested_language])
+    if meta.suggested_authors:
+        _set_dc_values(metadata_el, "creator", meta.suggested_authors)
+    if meta.suggested_publisher:
+        _set_dc_values(metadata_el, "publisher", [meta.suggested_publisher])
+    if meta.suggested_publication_date:
+        _set_dc_values(metadata_el, "date", [meta.suggested_publication_date])
+    if meta.suggested_tags:
+        _set_dc_values(metadata_el, "subject", meta.suggested_tags)
+    if meta.suggested_summary:
+        _set_dc_values(metadata_el, "description", [meta.suggested_summary])
+
+
+def _write_zip_entry(
+    dst: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes, compress_type: int
+) -> None:
+    """
+    Écrit une entrée via l'API publique de zipfile, à partir de l'entrée source.
+
+    Nom, date et attributs sont conservés; la méthode de compression est
+    explicite (ZIP_STORED pour mimetype, sinon celle d'origine) et le niveau
+    deflate vaut _DEFLATE_LEVEL. Les champs extra source (zip64, data
+    descriptor) ne sont pas recopiés: zipfile produit des en-têtes neufs.
+    """
+    entry = zipfile.ZipInfo(info.filename, info.date_time)
+    entry.create_system = info.create_system
+    entry.external_attr = info.external_attr
+    entry.comment = info.comment
+    dst.writestr(entry, data, compress_type=compress_type, compresslevel=_DEFLATE_LEVEL)
+
+
+def _update_opf_in_place(epub_path: str, meta: "EpubMeta"):
+    """
+    Met à jour les métadonnées en ne réécrivant que l'OPF.
+
+    Les autres entrées de l'archive sont recopiées dans le même ordre, avec
+    leur contenu et leur méthode de compression (mimetype reste en tête, non
+    compressé): aucun item n'est parsé ni resérialisé. Les entrées compressées
+    sont recompressées au niveau _DEFLATE_LEVEL (voir _write_zip_entry).
+
+    Raises:
+        Exception: Si l'OPF est introuvable ou illisible
+    """
+
+    def write(temp_path: str):
+        # L'archive source est refermée avant le remplacement du fichier
+        with zipfile.ZipFile(epub_path) as src:
+            opf_path = _find_opf_path(src)
+            opf = _parse_xml(src.read(opf_path))
+            _patch_opf_metadata(opf, meta)
+            opf_bytes = etree.tostring(opf.getroottree(), xml_declaration=True, encoding="utf-8")
+
+            with zipfile.ZipFile(temp_path, "w") as dst:
+                for info in src.infolist():
+                    data = opf_bytes if info.filename == opf_path else src.read(info)
+                    compress_type = (
+                        zipfile.ZIP_STORED if info.filename == "mimetype" else info.compress_type
+                    )
+                    _write_zip_entry(dst, info, data, compress_type)
+
+    _write_atomically(epub_path, write)
+
+
 # --- Helpers pour la reconstruction EPUB ---
 
 
@@ -67,6 +203,9 @@ def _apply_new_metadata(new_book: EpubBook, meta: "EpubMeta", old_book: EpubBook
         new_book.add_metadata("DC", "description", meta.suggested_summary)
 
 
+_NAV_FILE_NAMES = frozenset(("toc.ncx", "nav.xhtml"))
+
+
 def _copy_items(new_book: EpubBook, old_book: EpubBook, meta: "EpubMeta") -> Dict[str, EpubItem]:
     """
     Copie les items de l'ancien livre vers le nouveau.
@@ -83,17 +222,22 @@ def _copy_items(new_book: EpubBook, old_book: EpubBook, meta: "EpubMeta") -> Dic
         Dictionnaire {item_id: item} des items copiés
     """
     item_map = {}
+    drop_old_cover = bool(meta.suggested_cover_data)
 
     for item in old_book.get_items():
+        file_name = item.file_name.lower()
+
         # Ignorer les fichiers de navigation (seront recréés)
-        if item.file_name.lower() in ("toc.ncx", "nav.xhtml"):
+        if file_name in _NAV_FILE_NAMES:
             continue
 
         # Ignorer l'ancienne couverture si une nouvelle est suggérée
-        is_image = item.media_type and item.media_type.startswith("image/")
-        is_cover_name = "cover" in item.id.lower() or "cover" in item.file_name.lower()
-
-        if meta.suggested_cover_data and is_image and is_cover_name:
+        if (
+            drop_old_cover
+            and item.media_type
+            and item.media_type.startswith("image/")
+            and ("cover" in file_name or "cover" in item.id.lower())
+        ):
             logger.info("Ignoré l'ancienne cover lors de la copie.")
             continue
 
@@ -124,7 +268,7 @@ def _handle_cover(
         if old_cover_id_meta:
             cover_id = old_cover_id_meta[0][1].get("content")
             if cover_id in item_map:
-                logger.info(f"Conservation de l'ancienne couverture (ID: {cover_id})")
+                logger.info("Conservation de l'ancienne couverture (ID: %s)", cover_id)
                 new_book.metadata["OPF"] = {"cover": [("", {"content": cover_id})]}
 
 
@@ -144,15 +288,15 @@ def _copy_navigation(new_book: EpubBook, old_book: EpubBook):
     new_book.add_item(epub.EpubNav())
 
 
-def _write_rebuilt_epub(book: EpubBook, epub_path: str):
+def _write_atomically(epub_path: str, write: Callable[[str], None]):
     """
-    Écrit le livre reconstruit de manière sécurisée.
+    Écrit un fichier via un fichier temporaire puis le remplace atomiquement.
 
-    Utilise un fichier temporaire pour éviter la corruption en cas d'échec.
+    Évite la corruption du fichier original en cas d'échec.
 
     Args:
-        book: Livre EPUB à écrire
         epub_path: Chemin de destination
+        write: Fonction écrivant le contenu complet au chemin temporaire reçu
 
     Raises:
         Exception: Si l'écriture échoue
@@ -160,7 +304,7 @@ def _write_rebuilt_epub(book: EpubBook, epub_path: str):
     temp_epub_path = epub_path + ".tmp"
 
     try:
-        epub.write_epub(temp_epub_path, book)
+        write(temp_epub_path)
         logger.info("Successfully wrote to temporary file: %s", temp_epub_path)
 
         # Remplacer atomiquement l'ancien fichier
@@ -170,26 +314,51 @@ def _write_rebuilt_epub(book: EpubBook, epub_path: str):
     except Exception as write_e:
         logger.exception("Failed during temp write or replace: %s", write_e)
 
-        # Nettoyer le fichier temporaire en cas d'échec
-        if os.path.exists(temp_epub_path):
-            try:
-                os.remove(temp_epub_path)
-            except Exception:
-                pass
+        # Nettoyer le fichier temporaire en cas d'échec (absent si l'écriture
+        # n'a pas démarré: FileNotFoundError est un OSError)
+        try:
+            os.remove(temp_epub_path)
+        except OSError:
+            pass
 
         raise write_e
 
 
+def _write_rebuilt_epub(book: EpubBook, epub_path: str):
+    """
+    Écrit le livre reconstruit de manière sécurisée.
+
+    Args:
+        book: Livre EPUB à écrire
+        epub_path: Chemin de destination
+
+    Raises:
+        Exception: Si l'écriture échoue
+    """
+    # L'archive est assemblée en mémoire (ebooklib y détient déjà tout le
+    # contenu), puis écrite d'un bloc: pas d'écritures/seeks fragmentés de
+    # zipfile sur le disque, coûteux sur un partage réseau.
+    buffer = io.BytesIO()
+    epub.write_epub(buffer, book)
+
+    def write(temp_path: str):
+        with open(temp_path, "wb") as f:
+            f.write(buffer.getbuffer())
+
+    _write_atomically(epub_path, write)
+
+
 # --- Fonction principale d'écriture ---
 
 
 def update_epub_with_metadata(epub_path: str, meta: "EpubMeta") -> bool:
     """
-    Met à jour un fichier EPUB en le reconstruisant complètement.
+    Met à jour un fichier EPUB avec les métadonnées suggérées.
 
-    Cette fonction applique les métadonnées suggérées stockées dans
-    l'objet meta en reconstruisant entièrement le fichier EPUB.
-    Ce mode "rebuild" garantit des métadonnées propres et sans corruption.
+    Sans nouvelle couverture, seul l'OPF est modifié (les autres entrées de
+    l'archive sont recopiées sans être parsées). Sinon, ou si cette mise à
+    jour directe échoue, le fichier est entièrement reconstruit: ce mode
+    "rebuild" garantit des métadonnées propres et sans corruption.
 
     Args:
         epub_path: Chemin vers le fichier EPUB à modifier
@@ -201,6 +370,16 @@ def update_epub_with_metadata(epub_path: str, meta: "EpubMeta") -> bool:
     Note:
         En cas d'échec, meta.note sera rempli avec l'erreur détaillée
     """
+    if not _has_new_cover(meta):
+        try:
+            _update_opf_in_place(epub_path, meta)
+            logger.info("UPDATED OPF OF %s IN PLACE. SUCCESS.", epub_path)
+            return True
+        except Exception:
+            logger.warning(
+                "In-place OPF update failed for %s, rebuilding", epub_path, exc_info=True
+            )
+
     logger.info("--- DEBUT UPDATE EPUB (REBUILD MODE) - %s ---", meta.filename)
 
     try:
@@ -218,6 +397,9 @@ def update_epub_with_metadata(epub_path: str, meta: "EpubMeta") -> bool:
         _handle_cover(new_book, old_book, meta, item_map)
         _copy_navigation(new_book, old_book)
 
+        # Libérer l'ancien livre avant l'écriture (pic mémoire)
+        old_book = None
+
         # 4. Écrire le nouveau livre
         _write_rebuilt_epub(new_book, epub_path)
 
@@ -225,6 +407,7 @@ def update_epub_with_metadata(epub_path: str, meta: "EpubMeta") -> bool:
         return True
 
     except Exception as e:
-        meta.note = f"Error rebuilding epub: {e}\n{traceback.format_exc()}"
+        # La trace complète est journalisée ci-dessous: la note reste lisible
+        meta.note = f"Error rebuilding epub: {e}"
         logger.exception("Error rebuilding epub %s", epub_path)
         return False
@@ -19,11 +19,15 @@ from .epub import (
     update_epub_with_metadata,
 )
 
-warnings.warn(
-    "epub_metadata module is deprecated. Use 'from epub_enricher.core.epub import ...' instead",
-    DeprecationWarning,
-    stacklevel=2,
-)
+# Avertir une seule fois par processus, même si le module est rechargé
+# (importlib.reload conserve l'espace de noms du module)
+if not globals().get("_WARNED", False):
+    warnings.warn(
+        "epub_metadata module is deprecated. Use 'from epub_enricher.core.epub import ...' instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    _WARNED = True
 
 __all__ = [
     "extract_metadata",
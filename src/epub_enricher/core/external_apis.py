@@ -25,12 +25,16 @@ from .enrichment.genre_mapper import (
 # Alias pour compatibilité
 fetch_genre_and_summary_from_sources = fetch_enriched_metadata
 
-warnings.warn(
-    "external_apis module is deprecated. "
-    "Use 'from epub_enricher.core.enrichment import ...' instead",
-    DeprecationWarning,
-    stacklevel=2,
-)
+# Avertir une seule fois par processus, même si le module est rechargé
+# (importlib.reload conserve l'espace de noms du module)
+if not globals().get("_WARNED", False):
+    warnings.warn(
+        "external_apis module is deprecated. "
+        "Use 'from epub_enricher.core.enrichment import ...' instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    _WARNED = True
 
 __all__ = [
     "fetch_genre_and_summary_from_sources",
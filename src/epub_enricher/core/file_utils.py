@@ -3,47 +3,138 @@
 Logique pour les opérations sur le système de fichiers (trouver, sauvegarder, renommer).
 """
 
+import errno
+import itertools
 import logging
 import os
 import re
 import shutil
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 from ..config import BACKUP_DIR, SUPPORTED_EXT, ensure_directories
 from .models import EpubMeta  # Importation du modèle
 
 logger = logging.getLogger(__name__)
 
+# Caractères interdits dans un nom de fichier (supprimés via str.translate)
+_FORBIDDEN_FILENAME_CHARS = str.maketrans("", "", '\\/*?:"<>|')
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Erreurs de os.link signifiant "lien physique impossible ici" (autre volume,
+# système de fichiers sans liens, limite de liens): seules à justifier une copie.
+# EEXIST en est exclue: la cible appartient déjà à une autre sauvegarde.
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK}
+)
+
+
+def iter_epubs_in_folder(folder: str) -> Iterator[str]:
+    """
+    Parcourt un dossier et ses sous-dossiers en produisant les chemins EPUB au fil de l'eau.
+
+    Utilise os.scandir: le type de chaque entrée est connu sans appel stat()
+    supplémentaire. Le parcours est itératif (pile de dossiers) plutôt que
+    récursif: pas de chaîne de générateurs imbriqués sur les arborescences
+    profondes. Comme os.walk, les liens symboliques vers des dossiers ne
+    sont pas suivis et les dossiers illisibles sont ignorés.
+    """
+    pending = [folder]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.lower().endswith(SUPPORTED_EXT) and not entry.is_dir():
+                        yield entry.path
+        except OSError as e:
+            logger.warning("Cannot scan folder %s: %s", current, e)
+
 
 def find_epubs_in_folder(folder: str) -> List[str]:
     """Trouve tous les fichiers EPUB dans un dossier et ses sous-dossiers."""
-    files = []
-    for root, _, filenames in os.walk(folder):
-        for f in filenames:
-            if f.lower().endswith(SUPPORTED_EXT):
-                files.append(os.path.join(root, f))
+    files = list(iter_epubs_in_folder(folder))
     logger.info("Found %d epub(s) in folder %s", len(files), folder)
     return files
 
 
+def _backup_names(basename: str) -> Iterator[str]:
+    """Chemins de sauvegarde candidats: horodaté, puis suffixé (1), (2)... si déjà pris."""
+    ts = time.strftime("%Y%m%d-%H%M%S")
+    yield os.path.join(BACKUP_DIR, f"{ts}-{basename}")
+    stem, ext = os.path.splitext(basename)
+    for n in itertools.count(1):
+        yield os.path.join(BACKUP_DIR, f"{ts}-{stem} ({n}){ext}")
+
+
+def _copy_exclusive(path: str, dst: str) -> None:
+    """
+    Copie un fichier vers dst, qui ne doit pas exister.
+
+    dst est créé en mode exclusif: FileExistsError est levée sans rien écrire
+    si une autre sauvegarde (éventuellement un lien vers un original) l'occupe.
+    """
+    with open(path, "rb") as src:
+        out = open(dst, "xb")
+        try:
+            with out:
+                shutil.copyfileobj(src, out)
+            shutil.copystat(path, dst)
+        except BaseException:
+            os.remove(dst)
+            raise
+
+
+def _same_device(path: str, directory: str) -> bool:
+    """Indique si un fichier et un dossier sont sur le même système de fichiers."""
+    return os.stat(path).st_dev == os.stat(directory).st_dev
+
+
 def backup_file(path: str) -> str:
-    """Crée une sauvegarde d'un fichier avec timestamp."""
+    """
+    Crée une sauvegarde d'un fichier avec timestamp.
+
+    Sur le même système de fichiers (st_dev identique), la sauvegarde est un
+    lien physique (aucune copie de données). Sinon, ou si le lien est refusé
+    (autre volume, liens non supportés), le fichier est copié. Un nom déjà
+    pris (même nom de fichier sauvegardé dans la même seconde) n'est jamais
+    réécrit: le suivant libre est utilisé.
+
+    Invariant: le lien partage l'inode de l'original. Il ne reste une
+    sauvegarde que si aucun écrivain ne modifie le fichier sur place: toute
+    écriture doit produire un nouveau fichier qui remplace l'original par
+    os.replace (voir epub.writer._write_atomically), un renommage étant
+    également sans risque. Une ouverture en "r+b"/"wb" de l'original
+    modifierait aussi la sauvegarde.
+    """
     ensure_directories()
-    basename = os.path.basename(path)
-    ts = time.strftime("%Y%m%d-%H%M%S")
-    dst = os.path.join(BACKUP_DIR, f"{ts}-{basename}")
-    shutil.copy2(path, dst)
-    logger.info("Backed up %s -> %s", path, dst)
-    return dst
+    use_link = _same_device(path, BACKUP_DIR)
+    names = _backup_names(os.path.basename(path))
+    while True:
+        dst = next(names)
+        try:
+            if use_link:
+                try:
+                    os.link(path, dst)
+                except OSError as e:
+                    if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                        raise
+                    use_link = False
+                    _copy_exclusive(path, dst)
+            else:
+                _copy_exclusive(path, dst)
+        except FileExistsError:
+            continue
+        logger.info("Backed up %s -> %s", path, dst)
+        return dst
 
 
 def sanitize_filename(value: str) -> str:
     """Nettoie un texte pour un nom de fichier valide."""
-    value = re.sub(r'[\\/*?:"<>|]', "", value)
-    value = re.sub(r"\s+", " ", value)
-    return value.strip()
+    return _WHITESPACE_RE.sub(" ", value.translate(_FORBIDDEN_FILENAME_CHARS)).strip()
 
 
 def _get_filename_parts(meta: "EpubMeta") -> Dict[str, str]:
@@ -68,7 +159,7 @@ def _get_filename_parts(meta: "EpubMeta") -> Dict[str, str]:
     }
 
 
-def _resolve_filename_collision(folder: Path, base_name_parts: Dict[str, str]) -> Path:
+def _resolve_filename_collision(folder: Path, base_name_parts: Dict[str, str]) -> Tuple[Path, str]:
     """Génère un chemin final, en évitant les collisions."""
     year_part = f"{base_name_parts['year']} - " if base_name_parts["year"] else ""
     authors = base_name_parts["authors"]
@@ -76,16 +167,22 @@ def _resolve_filename_collision(folder: Path, base_name_parts: Dict[str, str]) -
 
     new_name = f"{year_part}{authors} - {title}.epub"
     new_path = folder / new_name
+    if not new_path.exists():
+        return new_path, new_name
+
+    # Gérer les collisions: le dossier est listé une seule fois, au lieu d'un
+    # stat() par suffixe essayé. Comparaison insensible à la casse, comme
+    # les systèmes de fichiers de Windows et macOS.
+    with os.scandir(folder) as entries:
+        existing = {entry.name.casefold() for entry in entries}
 
-    # Gérer les collisions
     counter = 1
-    while new_path.exists():
+    while True:
         new_name = f"{year_part}{authors} - {title} ({counter}).epub"
-        new_path = folder / new_name
+        if new_name.casefold() not in existing:
+            return folder / new_name, new_name
         counter += 1
 
-    return new_path, new_name
-
 
 def rename_epub_file(meta: "EpubMeta") -> None:
     """Renomme le fichier EPUB en fonction des métadonnées."""
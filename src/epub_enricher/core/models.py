@@ -1,11 +1,17 @@
 # epub_enricher/src/epub_enricher/core/models.py
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class EpubMeta:
-    """Modèle de données pour les métadonnées d'un fichier EPUB."""
+    """
+    Modèle de données pour les métadonnées d'un fichier EPUB.
+
+    Déclaré avec __slots__: pas de __dict__ par instance, ce qui réduit la
+    mémoire lors du traitement de grandes bibliothèques. Tout attribut doit
+    donc être déclaré ici.
+    """
 
     path: str
     filename: str
@@ -30,8 +36,13 @@ class EpubMeta:
     suggested_publication_date: str | None = None
     suggested_tags: List[str] | None = field(default_factory=list)
     suggested_cover_data: bytes | None = None
+    # Couverture OpenLibrary proposée, téléchargée seulement à l'application
+    suggested_cover_id: int | None = None
     suggested_summary: str | None = None
 
+    # Éditions alternatives trouvées sur OpenLibrary
+    found_editions: List[Dict[str, Any]] = field(default_factory=list)
+
     # Statut du traitement
     processed: bool = False
     accepted: bool = False
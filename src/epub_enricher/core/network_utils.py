@@ -3,24 +3,71 @@
 Utilitaires réseau génériques (retry backoff, requêtes HTTP).
 """
 
+import json
 import logging
 import random
 import time
 from functools import wraps
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Dépendance optionnelle (extra "fast")
+    orjson = None
 
 from ..config import (
+    API_CONNECT_TIMEOUT,
     API_TIMEOUT,
+    HTTP_POOL_SIZE,
     INITIAL_BACKOFF,
     JITTER,
     MAX_BACKOFF,
     MAX_RETRIES,
+    USER_AGENT,
 )
 
 logger = logging.getLogger(__name__)
 
+Timeout = Union[float, Tuple[float, float]]
+
+# Connexion courte (hôte injoignable détecté vite), lecture plus tolérante
+DEFAULT_TIMEOUT: Tuple[float, float] = (API_CONNECT_TIMEOUT, API_TIMEOUT)
+
+
+def _create_session() -> requests.Session:
+    """
+    Crée la session HTTP partagée par tous les clients API.
+
+    La session conserve les connexions ouvertes (keep-alive) et réutilise
+    les sessions TLS entre les appels. Les réessais restent gérés par
+    @retry_backoff pour ne pas les multiplier.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+_SESSION = _create_session()
+
+# Statuts HTTP transitoires: les autres erreurs 4xx (404, 400...) ne changeront
+# pas au réessai suivant et sont remontées immédiatement.
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Indique si une erreur réseau mérite un nouvel essai."""
+    response = getattr(exc, "response", None)
+    if response is None:
+        # Erreur de connexion, délai dépassé...: pas de réponse du serveur
+        return True
+    return response.status_code in _RETRYABLE_STATUS
+
 
 def retry_backoff(
     max_retries: int = MAX_RETRIES,
@@ -40,6 +87,10 @@ def retry_backoff(
                     logger.debug("Attempt %d for %s", attempt, func.__name__)
                     return func(*args, **kwargs)
                 except allowed_exceptions as e:
+                    if not _is_retryable(e):
+                        # Cas attendu (ex: 404 Wikipedia): l'appelant journalise s'il le faut
+                        logger.debug("Non-retryable error in %s: %s", func.__name__, e)
+                        raise
                     if attempt == max_retries:
                         logger.exception("Max retries reached for %s", func.__name__)
                         raise
@@ -68,19 +119,36 @@ def http_get(
     url: str,
     params: Optional[Dict[str, str]] = None,
     headers: Optional[Dict[str, str]] = None,
-    timeout: int = API_TIMEOUT,
+    timeout: Timeout = DEFAULT_TIMEOUT,
 ) -> requests.Response:
     """Effectue une requête HTTP GET avec retry automatique."""
     logger.debug("HTTP GET %s params=%s", url, params)
-    r = requests.get(url, params=params, headers=headers, timeout=timeout)
+    r = _SESSION.get(url, params=params, headers=headers, timeout=timeout)
     r.raise_for_status()
     return r
 
 
+def _loads(content: bytes) -> Any:
+    """Décode un corps JSON (orjson si disponible, sinon json standard)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def http_get_json(
+    url: str,
+    params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Timeout = DEFAULT_TIMEOUT,
+) -> Any:
+    """Effectue une requête HTTP GET (avec retry) et décode la réponse JSON."""
+    return _loads(http_get(url, params=params, headers=headers, timeout=timeout).content)
+
+
 @retry_backoff()
-def http_download_bytes(url: str, timeout: int = API_TIMEOUT) -> bytes:
+def http_download_bytes(url: str, timeout: Timeout = DEFAULT_TIMEOUT) -> bytes:
     """Télécharge des données binaires avec retry automatique."""
     logger.debug("Downloading bytes from %s", url)
-    r = requests.get(url, timeout=timeout)
+    r = _SESSION.get(url, timeout=timeout)
     r.raise_for_status()
     return r.content
@@ -5,13 +5,18 @@ Logique pour interroger les APIs (OpenLibrary) et récupérer les métadonnées
 
 import logging
 import os
+import threading
 from typing import Any, Dict, List, Optional
 
-from epub_enricher.core.network_utils import http_download_bytes, http_get
+from epub_enricher.core.cache import cached
+from epub_enricher.core.network_utils import http_download_bytes, http_get_json
 from epub_enricher.core.text_utils import clean_text
 
 from ..config import (
+    API_MEMO_SIZE,
     COVER_CACHE_DIR,
+    OPENLIB_BATCH_SIZE,
+    OPENLIB_BOOK,
     OPENLIB_SEARCH,
     ensure_directories,
 )
@@ -29,8 +34,7 @@ def _fetch_work_details(work_id: str) -> Optional[Dict]:
     """Récupère les détails de l'Œuvre (Work) OpenLibrary."""
     url = f"{OPENLIB_BASE}/works/{work_id}.json"
     try:
-        r = http_get(url)
-        return r.json()
+        return http_get_json(url)
     except Exception as e:
         logger.warning("Failed to fetch OL Work %s: %s", work_id, e)
         return None
@@ -40,13 +44,71 @@ def _fetch_edition_details(edition_id: str) -> Optional[Dict]:
     """Récupère les détails de l'Édition (Edition) OpenLibrary."""
     url = f"{OPENLIB_BASE}/books/{edition_id}.json"
     try:
-        r = http_get(url)
-        return r.json()
+        return http_get_json(url)
     except Exception as e:
         logger.warning("Failed to fetch OL Edition %s: %s", edition_id, e)
         return None
 
 
+def batch_lookup_openlib(isbns: List[str]) -> Dict[str, Dict]:
+    """
+    Récupère les éditions de plusieurs ISBN via l'API Books (paramètre bibkeys).
+
+    Une requête couvre jusqu'à OPENLIB_BATCH_SIZE ISBN au lieu d'une par livre.
+
+    Args:
+        isbns: Liste d'ISBN (doublons et valeurs vides ignorés)
+
+    Returns:
+        Dictionnaire ISBN -> enregistrement d'édition OpenLibrary
+        (les ISBN inconnus sont absents)
+    """
+    unique = list(dict.fromkeys(i for i in isbns if i))
+    results: Dict[str, Dict] = {}
+
+    for start in range(0, len(unique), OPENLIB_BATCH_SIZE):
+        chunk = unique[start : start + OPENLIB_BATCH_SIZE]
+        params = {
+            "bibkeys": ",".join(f"ISBN:{isbn}" for isbn in chunk),
+            "format": "json",
+            "jscmd": "details",
+        }
+        try:
+            data = http_get_json(OPENLIB_BOOK, params=params)
+        except Exception as e:
+            logger.warning("OL batch lookup failed for %d ISBN(s): %s", len(chunk), e)
+            continue
+
+        for bibkey, record in data.items():
+            details = record.get("details")
+            if details:
+                results[bibkey.removeprefix("ISBN:")] = details
+
+    logger.info("OL batch lookup: %d/%d ISBN(s) found", len(results), len(unique))
+    return results
+
+
+def _edition_to_doc(edition: Dict) -> Dict[str, Any]:
+    """Convertit un enregistrement d'édition (API Books) au format d'un résultat de recherche."""
+    works = edition.get("works") or []
+    doc = {
+        "key": works[0].get("key", "") if works else "",
+        "title": edition.get("title"),
+        "author_name": [a["name"] for a in edition.get("authors", []) if a.get("name")],
+        "language": [
+            lang["key"].rsplit("/", 1)[-1] for lang in edition.get("languages", []) if "key" in lang
+        ],
+        "isbn": edition.get("isbn_13", []) + edition.get("isbn_10", []),
+        "edition_key": [edition["key"].rsplit("/", 1)[-1]] if edition.get("key") else [],
+        "cover_i": (edition.get("covers") or [None])[0],
+        "description": edition.get("description"),
+        "subjects": edition.get("subjects"),
+        "publish_date": edition.get("publish_date"),
+        "publishers": edition.get("publishers"),
+    }
+    return {k: v for k, v in doc.items() if v}
+
+
 def extract_metadata_from_openlibrary(data: Dict, work_data: Optional[Dict]) -> Dict:
     """Extrait et nettoie les métadonnées depuis les résultats de l'API OpenLibrary."""
     metadata: Dict[str, Any] = {
@@ -85,25 +147,59 @@ def extract_metadata_from_openlibrary(data: Dict, work_data: Optional[Dict]) ->
     return metadata
 
 
-def query_openlibrary_full(
-    title: Optional[str] = None,
-    authors: Optional[List[str]] = None,
-    isbn: Optional[str] = None,
+def _openlibrary_result(
+    doc: Dict[str, Any], docs: List[Dict], edition: Optional[Dict] = None
 ) -> Dict[str, Any]:
     """
-    Tente une recherche OpenLibrary complète (ISBN -> Work -> Edition).
-    Retourne les métadonnées enrichies.
+    Construit le résultat OpenLibrary depuis l'édition retenue (doc).
+
+    L'œuvre (Work) fournit le résumé; l'édition fournit éditeur, date et
+    sujets. Sans œuvre connue, l'édition est récupérée par son identifiant
+    si elle n'a pas déjà été fournie (edition).
     """
     result: Dict[str, Any] = {"summary": None, "tags": None, "cover_id": None}
-    work_id: Optional[str] = None
-    edition_id: Optional[str] = None
 
-    try:
-        # 1. Recherche initiale par ISBN ou titre/auteur
+    work_id = doc.get("key", "").replace("/works/", "")
+    # Récupérer les détails de l'Œuvre (Work) si possible
+    work_data = _fetch_work_details(work_id) if work_id else None
+
+    # Détails de l'Édition pour la date/éditeur
+    edition_data = edition or doc
+    if not work_id and not edition:
+        # On ne peut pas remonter au Work sans work_id: l'édition seule sert
+        edition_ids = doc.get("edition_key")
+        if edition_ids:
+            edition_data = _fetch_edition_details(edition_ids[0])
+
+    # Extraction finale (priorité à l'œuvre pour le résumé)
+    if work_data or edition_data:
+        result.update(extract_metadata_from_openlibrary(edition_data or {}, work_data))
+
+    # ID de couverture (Open Library utilise un ID unique par travail ou édition)
+    result["cover_id"] = doc.get("cover_i")
+    result["related_docs"] = docs
+
+    logger.info(
+        "OL: Found metadata. Tags: %d, Summary: %s",
+        len(result["tags"]) if result["tags"] else 0,
+        "Yes" if result["summary"] else "No",
+    )
+    return result
 
-        # TOUJOURS utiliser l'API de recherche (OPENLIB_SEARCH)
-        query_url = OPENLIB_SEARCH
 
+@cached(
+    "openlibrary",
+    should_cache=lambda r: bool(r.get("related_docs")),
+    memo_size=API_MEMO_SIZE,
+)
+def _query_openlibrary_search(
+    title: Optional[str] = None,
+    authors: Optional[List[str]] = None,
+    isbn: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Recherche OpenLibrary (API de recherche) puis Work/Edition du premier résultat."""
+    try:
+        # 1. Recherche initiale par ISBN ou titre/auteur (API de recherche)
         params = {}
         if isbn:
             # La recherche 'q' est la plus fiable pour un ISBN ou un texte
@@ -119,56 +215,78 @@ def query_openlibrary_full(
         # Si on n'a ni ISBN, ni titre, ni auteur, on ne peut rien faire
         if not params:
             logger.info("OL: No ISBN, title, or author provided. Skipping search.")
-            return result
+            return {"summary": None, "tags": None, "cover_id": None}
 
-        r = http_get(query_url, params=params)
-        data = r.json()
-
-        # 2. Trouver l'Edition/Work la plus pertinente
-        docs = data.get("docs")
+        docs = http_get_json(OPENLIB_SEARCH, params=params).get("docs")
         if not docs:
             logger.info("OL: No result found for query: %s", params)
-            return result
+            return {"summary": None, "tags": None, "cover_id": None}
 
-        # Prioriser le premier résultat, mais chercher les IDs
-        doc = docs[0]
-        work_id = doc.get("key", "").replace("/works/", "")
+        # 2. Prioriser le premier résultat
+        return _openlibrary_result(docs[0], docs)
 
-        # S'il n'y a pas de work_id, essayer de trouver une edition ID dans les ID existants
-        if not work_id:
-            edition_ids = doc.get("edition_key")
-            edition_id = edition_ids[0] if edition_ids else None
-            # On ne peut pas remonter au Work sans work_id, on s'arrête là pour la recherche avancée
+    except Exception as e:
+        logger.warning("Failed during full OL fetch: %s", e)
+        return {"summary": None, "tags": None, "cover_id": None}
 
-        # 3. Récupérer les détails de l'Œuvre (Work) si possible
-        work_data = _fetch_work_details(work_id) if work_id else None
 
-        # 4. Récupérer les détails de l'Édition pour la date/éditeur (si pas d'ISBN)
-        if edition_id:  # On fetch l'édition uniquement si on n'avait pas l'ISBN
-            edition_data = _fetch_edition_details(edition_id)
-        else:  # Si on a un ISBN, les détails de l'édition sont déjà dans 'doc' (première recherche)
-            edition_data = doc
+@cached(
+    "openlibrary_edition",
+    should_cache=lambda r: bool(r.get("related_docs")),
+    memo_size=API_MEMO_SIZE,
+    ignore=("edition",),
+)
+def _query_openlibrary_edition(isbn: str, edition: Optional[Dict] = None) -> Dict[str, Any]:
+    """
+    Résultat OpenLibrary construit depuis l'édition exacte d'un ISBN (API Books).
 
-        # 5. Extraction finale
-        final_data = work_data if work_data else edition_data  # Priorité à l'œuvre pour le résumé
-        if final_data:
-            result.update(extract_metadata_from_openlibrary(edition_data, work_data))
+    Aucune recherche n'est faite: l'œuvre est désignée par edition["works"]
+    et related_docs ne contient que cette édition. L'édition est celle de
+    batch_lookup_openlib pour cet ISBN (requise hors cache): le résultat ne
+    dépend que de l'ISBN, d'où une clé de cache sans l'édition.
+    """
+    if not edition:
+        return {"summary": None, "tags": None, "cover_id": None}
+    try:
+        doc = _edition_to_doc(edition)
+        return _openlibrary_result(doc, [doc], edition)
+    except Exception as e:
+        logger.warning("Failed during OL edition fetch for %s: %s", isbn, e)
+        return {"summary": None, "tags": None, "cover_id": None}
 
-        # 6. ID de couverture (Open Library utilise un ID unique par travail ou édition)
-        result["cover_id"] = doc.get("cover_i")
 
-        result["related_docs"] = docs
+def is_openlibrary_cached(
+    title: Optional[str] = None,
+    authors: Optional[List[str]] = None,
+    isbn: Optional[str] = None,
+) -> bool:
+    """Indique si query_openlibrary_full(title, authors, isbn) serait servi par le cache."""
+    if isbn and _query_openlibrary_edition.is_cached(isbn):
+        return True
+    return _query_openlibrary_search.is_cached(title, authors, isbn)
 
-        logger.info(
-            "OL: Found metadata. Tags: %d, Summary: %s",
-            len(result["tags"]) if result["tags"] else 0,
-            "Yes" if result["summary"] else "No",
-        )
 
-    except Exception as e:
-        logger.warning("Failed during full OL fetch: %s", e)
+def query_openlibrary_full(
+    title: Optional[str] = None,
+    authors: Optional[List[str]] = None,
+    isbn: Optional[str] = None,
+    edition: Optional[Dict] = None,
+) -> Dict[str, Any]:
+    """
+    Tente une recherche OpenLibrary complète (ISBN -> Work -> Edition).
+    Retourne les métadonnées enrichies.
 
-    return result
+    Une édition déjà obtenue par batch_lookup_openlib pour cet ISBN remplace
+    la recherche: seule l'œuvre est récupérée, et related_docs se limite à
+    cette édition. Un résultat déjà construit ainsi (en cache) est réutilisé
+    même sans édition. Sinon (ou en cas d'échec), la recherche fournit les
+    éditions alternatives.
+    """
+    if isbn and (edition or _query_openlibrary_edition.is_cached(isbn)):
+        result = _query_openlibrary_edition(isbn, edition)
+        if result.get("related_docs"):
+            return result
+    return _query_openlibrary_search(title, authors, isbn)
 
 
 # ======================================================================
@@ -179,29 +297,45 @@ def query_openlibrary_full(
 def _get_cover_from_cache(cover_id: int) -> Optional[bytes]:
     """Tente de charger une couverture depuis le cache."""
     cache_name = os.path.join(COVER_CACHE_DIR, f"{cover_id}.jpg")
-    if os.path.exists(cache_name):
+    try:
         with open(cache_name, "rb") as f:
-            logger.debug("Loaded cover from cache %s", cache_name)
-            return f.read()
-    return None
+            data = f.read()
+    except OSError:
+        return None
+    logger.debug("Loaded cover from cache %s", cache_name)
+    return data
 
 
 def _download_and_cache_cover(cover_id: int, url: str) -> Optional[bytes]:
-    """Télécharge la couverture et la met en cache."""
+    """
+    Télécharge la couverture et la met en cache.
+
+    L'écriture passe par un fichier temporaire propre au thread, renommé
+    atomiquement: une couverture partielle n'est jamais lue depuis le cache,
+    même si deux livres demandent la même couverture en parallèle.
+    """
     cache_name = os.path.join(COVER_CACHE_DIR, f"{cover_id}.jpg")
     try:
         b = http_download_bytes(url)
-        with open(cache_name, "wb") as f:
-            f.write(b)
-        logger.debug("Cached cover to %s", cache_name)
-        return b
     except Exception as e:
-        logger.warning("Failed to cache or download cover %s: %s", cache_name, e)
-        # Supprimer le fichier s'il a été partiellement écrit
-        if os.path.exists(cache_name):
-            os.remove(cache_name)
+        logger.warning("Failed to download cover %s: %s", url, e)
         return None
 
+    temp_name = f"{cache_name}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_name, "wb") as f:
+            f.write(b)
+        os.replace(temp_name, cache_name)
+        logger.debug("Cached cover to %s", cache_name)
+    except OSError as e:
+        # La couverture reste utilisable même si le cache n'a pas pu être écrit
+        logger.warning("Failed to cache cover %s: %s", cache_name, e)
+        try:
+            os.remove(temp_name)
+        except OSError:
+            pass
+    return b
+
 
 def download_cover(cover_id: int) -> Optional[bytes]:
     """Télécharge la couverture depuis OpenLibrary, avec cache."""
@@ -4,7 +4,19 @@ Utilitaires pour le nettoyage et l'analyse de chaînes de caractères.
 """
 
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+try:
+    import ahocorasick
+except ImportError:  # Dépendance optionnelle (extra "fast")
+    ahocorasick = None
+
+# Expressions compilées une seule fois (appelées pour chaque résumé récupéré).
+# Une séquence de balises et/ou d'espaces devient un seul espace: le
+# nettoyage HTML se fait en une passe au lieu de deux.
+_TAG_OR_SPACE_RE = re.compile(r"(?:<[^>]+>|\s)+")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s.,!?;:-]")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 # Mots-clés pour la classification (en français, car l'API Wikipedia est 'fr')
 _CLASSIFICATION_KEYWORDS = {
@@ -23,15 +35,49 @@ _CLASSIFICATION_KEYWORDS = {
 }
 
 
+def _build_keyword_index() -> Dict[str, List[str]]:
+    """
+    Associe chaque mot-clé distinct à la liste des genres qui le contiennent.
+
+    Un genre apparaît plusieurs fois s'il liste le mot-clé plusieurs fois,
+    afin de reproduire exactement le comptage par genre et par mot-clé.
+    """
+    index: Dict[str, List[str]] = {}
+    for genre, keywords in _CLASSIFICATION_KEYWORDS.items():
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(genre)
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+
+def _build_keyword_automaton():
+    """
+    Construit un automate Aho-Corasick sur tous les mots-clés de classification.
+
+    Returns:
+        Automate prêt à l'emploi, ou None si pyahocorasick n'est pas installé
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, genres in _KEYWORD_INDEX.items():
+        automaton.add_word(keyword, genres)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
 def clean_html_text(html_content: str) -> str:
     """Nettoie le HTML pour extraire le texte."""
     if not html_content:
         return ""
-    # Supprimer les balises HTML
-    text = re.sub(r"<[^>]+>", " ", html_content)
-    # Supprimer les espaces multiples
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # Supprimer les balises HTML et les espaces multiples en une seule passe
+    return _TAG_OR_SPACE_RE.sub(" ", html_content).strip()
 
 
 def clean_text(text: str) -> str:
@@ -39,9 +85,9 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     # Supprimer les caractères spéciaux (garder ponctuation basique)
-    text = re.sub(r"[^\w\s.,!?;:-]", " ", text)
+    text = _SPECIAL_CHARS_RE.sub(" ", text)
     # Supprimer les espaces multiples
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
@@ -51,18 +97,27 @@ def classify_genre_from_text(text: str) -> Optional[str]:
         return None
 
     text_lower = text.lower()
-    genre_scores: Dict[str, int] = {}
 
     # Compter les occurrences
-    for genre, keywords in _CLASSIFICATION_KEYWORDS.items():
-        score = sum(text_lower.count(keyword) for keyword in keywords)
-        if score > 0:
-            genre_scores[genre] = score
-
-    # Retourner le genre avec le score le plus élevé (seuil minimum de 1)
-    if genre_scores:
-        best_genre = max(genre_scores, key=genre_scores.get)
-        if genre_scores[best_genre] >= 1:
-            return best_genre
+    genre_scores: Dict[str, int] = {}
+    if _KEYWORD_AUTOMATON is not None:
+        # Un seul parcours du texte pour tous les mots-clés
+        for _, genres in _KEYWORD_AUTOMATON.iter(text_lower):
+            for genre in genres:
+                genre_scores[genre] = genre_scores.get(genre, 0) + 1
+    else:
+        # Repli: un str.count par mot-clé distinct (et non par couple genre/mot-clé)
+        for keyword, genres in _KEYWORD_INDEX.items():
+            count = text_lower.count(keyword)
+            if count:
+                for genre in genres:
+                    genre_scores[genre] = genre_scores.get(genre, 0) + count
 
-    return None
+    # Meilleur genre (seuil minimum de 1).
+    # Les égalités sont départagées par l'ordre de _CLASSIFICATION_KEYWORDS.
+    best_genre, best_score = None, 0
+    for genre in _CLASSIFICATION_KEYWORDS:
+        score = genre_scores.get(genre, 0)
+        if score > best_score:
+            best_genre, best_score = genre, score
+    return best_genre
@@ -9,9 +9,10 @@ graphique.
 
 import logging
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
-from ..core.epub import extract_metadata
+from ..core.epub import extract_metadata_many
 from ..core.file_utils import find_epubs_in_folder
 from ..core.models import EpubMeta
 from . import helpers
@@ -36,19 +37,27 @@ class AppController:
         logger.info(f"Scan du dossier : {folder_path}")
         files = find_epubs_in_folder(folder_path)
 
+        # Lecture des EPUBs en parallèle, ordre des fichiers conservé. Appelé
+        # depuis un thread de fond du processus Tk: pas de pool de processus
+        # (fork d'un processus multi-thread), des threads suffisent ici.
+        with ThreadPoolExecutor() as pool:
+            results = extract_metadata_many(files, executor=pool)
+
         new_meta_list = []
-        for p in files:
-            meta_obj = self._create_meta_from_file(p)
+        for p, res in zip(files, results):
+            meta_obj = self._create_meta_from_file(p, res)
             if meta_obj:
                 new_meta_list.append(meta_obj)
 
         self.meta_list = new_meta_list
         logger.info(f"{len(self.meta_list)} EPUBs chargés.")
 
-    def _create_meta_from_file(self, p: str) -> EpubMeta | None:
-        """Tente d'extraire les métadonnées et de créer un objet EpubMeta."""
+    def _create_meta_from_file(self, p: str, res: Dict | None) -> EpubMeta | None:
+        """Crée un objet EpubMeta à partir des métadonnées extraites d'un fichier."""
+        if res is None:
+            logger.error(f"Échec de l'extraction des métadonnées pour {p}")
+            return None
         try:
-            res = extract_metadata(p)
             meta_obj = EpubMeta(
                 path=p,
                 filename=os.path.basename(p),
@@ -86,6 +86,7 @@ def reset_suggestions_on_model(m: "EpubMeta"):
     m.suggested_publisher = None
     m.suggested_publication_date = None
     m.suggested_cover_data = None
+    m.suggested_cover_id = None
     m.suggested_summary = None
     m.accepted = False  # Nettoyage
     m.processed = False  # Réinitialise aussi le statut 'fetched'
@@ -95,13 +95,23 @@ class EnricherGUI(tk.Tk):
         if self.toolbar:
             self.toolbar.set_folder_var(folder)  # Met à jour la toolbar
 
-        try:
-            self.controller.load_from_folder(folder)
-            self.refresh_tree()
-            self.clear_details()
-        except Exception as e:
-            logger.exception("Failed to scan folder")
-            self.show_error_message("Error", f"An error occurred while scanning: {e}")
+        def on_complete_callback():
+            return self.after(0, self._on_scan_complete)
+
+        def on_error_callback(e: Exception):
+            return self.after(
+                0, self.show_error_message, "Error", f"An error occurred while scanning: {e}"
+            )
+
+        # La lecture des EPUBs est bloquante: elle tourne hors de la boucle Tk
+        task_manager.start_scan_task(
+            self.controller, folder, on_complete_callback, on_error_callback
+        )
+
+    def _on_scan_complete(self):
+        """Rafraîchit la vue une fois le dossier chargé."""
+        self.refresh_tree()
+        self.clear_details()
 
     def fetch_suggestions_for_selected(self):
         """Orchestre la recherche de suggestions."""
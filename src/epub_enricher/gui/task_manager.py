@@ -8,16 +8,50 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Callable, Dict, List
 
+from ..config import BACKUP_BEFORE_APPLY
 from ..core.epub import update_epub_with_metadata
-from ..core.file_utils import rename_epub_file
+from ..core.file_utils import backup_file, rename_epub_file
 from ..core.openlibrary_client import download_cover, query_openlibrary_full
 from . import helpers
 
 if TYPE_CHECKING:
     from ..core.models import EpubMeta
+    from .app_controller import AppController
 
 logger = logging.getLogger(__name__)
 
+# --- TÂCHE DE SCAN ---
+
+
+def start_scan_task(
+    controller: "AppController",
+    folder: str,
+    on_complete: Callable[[], None],
+    on_error: Callable[[Exception], None],
+):
+    """Lance le thread de scan du dossier (lecture des EPUBs hors de la boucle Tk)."""
+    logger.debug(f"Démarrage du Scan Task pour {folder}.")
+    threading.Thread(
+        target=_scan_worker, args=(controller, folder, on_complete, on_error), daemon=True
+    ).start()
+
+
+def _scan_worker(
+    controller: "AppController",
+    folder: str,
+    on_complete: Callable[[], None],
+    on_error: Callable[[Exception], None],
+):
+    """Logique exécutée dans le thread de scan."""
+    try:
+        controller.load_from_folder(folder)
+    except Exception as e:
+        logger.exception("Failed to scan folder")
+        on_error(e)
+        return
+    on_complete()
+
+
 # --- TÂCHE DE FETCH ---
 
 
@@ -134,6 +168,8 @@ def _apply_worker(
 def _apply_single_meta(m: "EpubMeta") -> bool:
     """Tente d'appliquer les modifications à un seul fichier EPUB."""
     try:
+        if BACKUP_BEFORE_APPLY:
+            backup_file(m.path)
         success = update_epub_with_metadata(m.path, m)
         if success:
             m.note = "Updated"
@@ -63,14 +63,20 @@ def run_cli() -> int:
     logger.info("Starting EPUB Enricher CLI mode")
 
     if len(sys.argv) < 2:
-        print("Usage: python -m epub_enricher <folder_path> [--autosave]")
+        print("Usage: python -m epub_enricher <folder_path> [--autosave] [--no-cache]")
         print("  folder_path: Chemin vers le dossier contenant les fichiers EPUB")
         print("  --autosave: Applique automatiquement les suggestions")
+        print("  --no-cache: Ignore le cache local (réponses API, métadonnées EPUB)")
         return 1
 
     folder_path = sys.argv[1]
     autosave = "--autosave" in sys.argv
 
+    if "--no-cache" in sys.argv:
+        from .core.cache import set_cache_enabled
+
+        set_cache_enabled(False)
+
     if not os.path.isdir(folder_path):
         print(f"Error: {folder_path} is not a valid directory")
         return 1
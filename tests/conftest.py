@@ -10,6 +10,16 @@ from typing import Dict
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def disable_api_cache():
+    """Désactive le cache API persistant pour isoler les tests du disque."""
+    from epub_enricher.core import cache
+
+    cache.set_cache_enabled(False)
+    yield
+    cache.set_cache_enabled(True)
+
+
 @pytest.fixture
 def sample_epub_metadata() -> Dict:
     """Retourne des métadonnées d'exemple pour tests."""
@@ -45,6 +55,36 @@ def sample_epub_meta_object():
     )
 
 
+@pytest.fixture
+def sample_epub_path(tmp_path) -> str:
+    """Crée un petit EPUB réel (métadonnées DC, couverture, 2 chapitres)."""
+    from ebooklib import epub
+
+    book = epub.EpubBook()
+    book.set_identifier("9782070368228")
+    book.set_title("Test Book")
+    book.set_language("fr")
+    book.add_author("Test Author")
+    book.add_metadata("DC", "publisher", "Test Publisher")
+    book.add_metadata("DC", "subject", "Fiction")
+    book.set_cover("cover.jpg", b"\xff\xd8fake-jpeg")
+
+    chapters = []
+    for i in range(2):
+        chapter = epub.EpubHtml(title=f"Chapitre {i}", file_name=f"c{i}.xhtml", lang="fr")
+        chapter.content = f"<html><body><h1>Chapitre {i}</h1><p>Texte.</p></body></html>"
+        book.add_item(chapter)
+        chapters.append(chapter)
+    book.toc = chapters
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav", *chapters]
+
+    path = tmp_path / "sample.epub"
+    epub.write_epub(str(path), book)
+    return str(path)
+
+
 @pytest.fixture
 def temp_dir(tmp_path):
     """Fournit un répertoire temporaire pour les tests."""
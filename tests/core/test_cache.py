@@ -0,0 +1,205 @@
+# tests/core/test_cache.py
+"""
+Tests pour le module core.cache.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from epub_enricher.core import cache
+from epub_enricher.core.enrichment import google_books
+
+
+@pytest.fixture
+def enabled_cache(tmp_path, monkeypatch):
+    """Active le cache sur une base temporaire."""
+    monkeypatch.setattr(cache, "API_CACHE_PATH", str(tmp_path / "api_cache.sqlite"))
+    cache.set_cache_enabled(True)
+    yield cache
+
+
+class TestCached:
+    """Tests pour le decorator cached."""
+
+    def test_second_call_served_from_cache(self, enabled_cache):
+        """Test qu'un appel identique ne ré-exécute pas la fonction."""
+        calls = []
+
+        @enabled_cache.cached("test")
+        def fetch(isbn):
+            calls.append(isbn)
+            return {"isbn": isbn}
+
+        assert fetch("123") == {"isbn": "123"}
+        assert fetch("123") == {"isbn": "123"}
+        assert calls == ["123"]
+
+    def test_empty_result_not_cached(self, enabled_cache):
+        """Test qu'un résultat vide (ex: échec réseau) n'est pas figé."""
+        calls = []
+
+        @enabled_cache.cached("test")
+        def fetch(isbn):
+            calls.append(isbn)
+            return {}
+
+        fetch("123")
+        fetch("123")
+        assert len(calls) == 2
+
+    def test_concurrent_identical_calls_share_one_request(self, enabled_cache, monkeypatch):
+        """Test que des appels simultanés pour la même clé ne font qu'une requête."""
+        calls = []
+        started = threading.Event()
+        joined = threading.Event()
+
+        class SignalingFuture(Future):
+            def result(self, timeout=None):
+                joined.set()
+                return super().result(timeout)
+
+        monkeypatch.setattr(enabled_cache, "Future", SignalingFuture)
+
+        @enabled_cache.cached("test")
+        def fetch(isbn):
+            calls.append(isbn)
+            started.set()
+            joined.wait(5)
+            return {"isbn": isbn}
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(fetch, "123")
+            started.wait(5)
+            second = pool.submit(fetch, "123")
+            results = [first.result(5), second.result(5)]
+
+        assert results == [{"isbn": "123"}, {"isbn": "123"}]
+        assert results[0] is not results[1]
+        assert calls == ["123"]
+
+    def test_memo_serves_repeated_calls_without_sqlite(self, enabled_cache, monkeypatch):
+        """Test que le niveau mémoire évite la lecture SQLite et reste borné."""
+        calls = []
+
+        @enabled_cache.cached("test", memo_size=1)
+        def fetch(isbn):
+            calls.append(isbn)
+            return {"isbn": isbn}
+
+        fetch("123")
+        cache_get = MagicMock(wraps=enabled_cache.cache_get)
+        monkeypatch.setattr(enabled_cache, "cache_get", cache_get)
+
+        assert fetch("123") == {"isbn": "123"}
+        cache_get.assert_not_called()
+
+        fetch("456")  # évince "123" du niveau mémoire
+        fetch("123")  # relu depuis SQLite
+        assert calls == ["123", "456"]
+        assert cache_get.call_count == 2
+
+    def test_memo_hits_are_independent_copies(self, enabled_cache):
+        """Test qu'un appelant qui modifie son résultat n'altère pas les appels suivants."""
+
+        @enabled_cache.cached("test", memo_size=4)
+        def fetch(isbn):
+            return {"tags": ["Roman"], "related_docs": [{"title": "T"}]}
+
+        first = fetch("123")
+        first["tags"].append("Modifié")
+        second = fetch("123")
+        second["related_docs"][0]["title"] = "Autre"
+
+        assert fetch("123") == {"tags": ["Roman"], "related_docs": [{"title": "T"}]}
+
+    def test_is_cached_matches_call_forms(self, enabled_cache):
+        """Test qu'appels positionnels et nommés partagent la clé, hors paramètres ignorés."""
+        calls = []
+
+        @enabled_cache.cached("test", ignore=("hint",))
+        def fetch(title, isbn=None, hint=None):
+            calls.append(hint)
+            return {"isbn": isbn}
+
+        assert not fetch.is_cached("Titre", "123")
+        fetch("Titre", "123", hint={"pre": "chargé"})
+
+        assert fetch.is_cached(title="Titre", isbn="123")
+        assert fetch(title="Titre", isbn="123") == {"isbn": "123"}
+        assert calls == [{"pre": "chargé"}]
+
+        enabled_cache.set_cache_enabled(False)
+        assert not fetch.is_cached("Titre", "123")
+
+    def test_expired_entry_ignored(self, enabled_cache):
+        """Test qu'une entrée expirée n'est pas retournée."""
+        key = enabled_cache.make_key("test", "123")
+        enabled_cache.cache_set(key, {"a": 1}, ttl=-1)
+
+        found, value = enabled_cache.cache_get(key)
+        assert found is False
+        assert value is None
+
+    def test_disabled_cache_bypassed(self, enabled_cache):
+        """Test que le cache désactivé appelle toujours la fonction."""
+        calls = []
+
+        @enabled_cache.cached("test")
+        def fetch(isbn):
+            calls.append(isbn)
+            return {"isbn": isbn}
+
+        enabled_cache.set_cache_enabled(False)
+        fetch("123")
+        fetch("123")
+        assert len(calls) == 2
+
+
+class TestCachedSources:
+    """Tests du cache appliqué aux clients API."""
+
+    def test_google_books_cached(self, enabled_cache, monkeypatch):
+        """Test qu'une recherche Google Books identique n'est faite qu'une fois."""
+        response = {"items": [{"volumeInfo": {"description": "Résumé"}}]}
+        mock_get = MagicMock(return_value=response)
+        monkeypatch.setattr(google_books, "http_get_json", mock_get)
+
+        first = google_books.query_google_books(isbn="9782070360024")
+        second = google_books.query_google_books(isbn="9782070360024")
+
+        assert first == second == {"summary": "Résumé"}
+        assert mock_get.call_count == 1
+
+    def test_wal_journal_mode(self, enabled_cache):
+        """Test que la base est ouverte en mode WAL."""
+        mode = enabled_cache._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_connection_reused_per_thread(self, enabled_cache, monkeypatch):
+        """Test qu'un thread garde sa connexion et que la table n'est créée qu'une fois."""
+        connect = MagicMock(wraps=enabled_cache.sqlite3.connect)
+        monkeypatch.setattr(enabled_cache.sqlite3, "connect", connect)
+
+        for i in range(3):
+            enabled_cache.cache_set(f"k{i}", i)
+            assert enabled_cache.cache_get(f"k{i}") == (True, i)
+        own = enabled_cache._connect()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(enabled_cache._connect).result()
+
+        assert own is enabled_cache._connect()
+        assert other is not own
+        # Initialisation de la base, connexion du thread, connexion de l'autre thread
+        assert connect.call_count == 3
+
+    def test_connection_reopened_after_error(self, enabled_cache):
+        """Test qu'une base supprimée en cours d'exécution est recréée."""
+        enabled_cache.cache_set("k", 1)
+        enabled_cache._connect().execute("DROP TABLE api_cache")
+
+        assert enabled_cache.cache_get("k") == (False, None)
+        enabled_cache.cache_set("k", 2)
+        assert enabled_cache.cache_get("k") == (True, 2)
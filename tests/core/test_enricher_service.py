@@ -3,9 +3,15 @@
 Tests pour le module core.enricher_service.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
-from epub_enricher.core.enricher_service import EnricherService
+from epub_enricher.core.enricher_service import (
+    EnricherService,
+    _BatchPrefetch,
+    _extract_only,
+    _prefetch_batch,
+)
 from epub_enricher.core.models import EpubMeta
 
 
@@ -22,9 +28,8 @@ class TestProcessEpub:
     """Tests pour process_epub."""
 
     @patch("epub_enricher.core.enricher_service.extract_metadata")
-    @patch("epub_enricher.core.enricher_service.query_openlibrary_full")
     @patch("epub_enricher.core.enricher_service.fetch_enriched_metadata")
-    def test_process_epub_success(self, mock_fetch, mock_ol, mock_extract):
+    def test_process_epub_success(self, mock_fetch, mock_extract):
         """Test traitement réussi d'un EPUB."""
         # Setup mocks
         mock_extract.return_value = {
@@ -39,7 +44,13 @@ class TestProcessEpub:
             "cover_data": None,
         }
 
-        mock_ol.return_value = {
+        mock_fetch.return_value = {
+            "genre": "Fiction",
+            "summary": "Test summary",
+            "tags": ["Fiction"],
+            "cover_id": None,
+            "ol_pub_date": "2024",
+            "ol_publisher": "Test Publisher",
             "related_docs": [
                 {
                     "title": "Test Book Enhanced",
@@ -47,16 +58,7 @@ class TestProcessEpub:
                     "language": ["en"],
                     "isbn": ["9781234567890"],
                 }
-            ]
-        }
-
-        mock_fetch.return_value = {
-            "genre": "Fiction",
-            "summary": "Test summary",
-            "tags": ["Fiction"],
-            "cover_data": None,
-            "ol_pub_date": "2024",
-            "ol_publisher": "Test Publisher",
+            ],
         }
 
         # Execute
@@ -81,8 +83,8 @@ class TestProcessEpub:
         assert result is None
 
     @patch("epub_enricher.core.enricher_service.extract_metadata")
-    @patch("epub_enricher.core.enricher_service.query_openlibrary_full")
-    def test_process_epub_no_openlibrary_results(self, mock_ol, mock_extract):
+    @patch("epub_enricher.core.enricher_service.fetch_enriched_metadata")
+    def test_process_epub_no_openlibrary_results(self, mock_fetch, mock_extract):
         """Test sans résultats OpenLibrary."""
         mock_extract.return_value = {
             "title": "Test Book",
@@ -96,7 +98,7 @@ class TestProcessEpub:
             "cover_data": None,
         }
 
-        mock_ol.return_value = {"related_docs": []}
+        mock_fetch.return_value = {"related_docs": []}
 
         service = EnricherService()
         result = service.process_epub("/fake/path/test.epub")
@@ -106,12 +108,119 @@ class TestProcessEpub:
         assert result.suggested_authors == result.original_authors
 
 
+class TestLookupMemo:
+    """Tests pour la mémorisation des recherches pendant un traitement de dossier."""
+
+    @staticmethod
+    def _meta(name):
+        return EpubMeta(
+            path=f"/folder/{name}", filename=name, original_title="Test Book", original_isbn="1"
+        )
+
+    @patch("epub_enricher.core.enricher_service.fetch_enriched_metadata")
+    def test_identical_lookups_are_deduplicated(self, mock_fetch):
+        """Test que deux livres identiques ne déclenchent qu'une recherche."""
+        mock_fetch.return_value = {"tags": ["Roman"], "related_docs": [{"title": "Test Book"}]}
+
+        service = EnricherService()
+        memo = {}
+        first = service._enrich(self._meta("a.epub"), memo)
+        second = service._enrich(self._meta("b.epub"), memo)
+
+        mock_fetch.assert_called_once_with(
+            title="Test Book", authors=None, isbn="1", ol_edition=None, google_prefetched=None
+        )
+        # Chaque EpubMeta possède ses propres listes
+        first.suggested_tags.append("Modifié")
+        first.found_editions.clear()
+        assert second.suggested_tags == ["Roman"]
+        assert second.found_editions == [{"title": "Test Book"}]
+
+    @patch("epub_enricher.core.enricher_service.fetch_enriched_metadata")
+    def test_empty_lookup_is_retried(self, mock_fetch):
+        """Test qu'une recherche sans résultat (ex: délai dépassé) n'est pas mémorisée."""
+        mock_fetch.return_value = {"tags": [], "summary": None, "related_docs": []}
+
+        service = EnricherService()
+        memo = {}
+        service._enrich(self._meta("a.epub"), memo)
+        service._enrich(self._meta("b.epub"), memo)
+
+        assert mock_fetch.call_count == 2
+        assert memo == {}
+
+    @patch("epub_enricher.core.enricher_service.fetch_enriched_metadata")
+    def test_no_memo_outside_folder_run(self, mock_fetch):
+        """Test qu'hors traitement de dossier (GUI) chaque recherche est refaite."""
+        mock_fetch.return_value = {"tags": ["Roman"], "related_docs": [{"title": "Test Book"}]}
+
+        service = EnricherService()
+        service._enrich(self._meta("a.epub"))
+        service._enrich(self._meta("a.epub"))
+
+        assert mock_fetch.call_count == 2
+
+
+class TestPrefetchBatch:
+    """Tests pour les requêtes groupées d'un lot."""
+
+    @staticmethod
+    def _metas(*isbns):
+        return [EpubMeta(path=f"/f/{i}.epub", filename=f"{i}.epub", original_isbn=i) for i in isbns]
+
+    @patch("epub_enricher.core.enricher_service.query_google_books_batch")
+    @patch("epub_enricher.core.enricher_service.query_google_books")
+    @patch("epub_enricher.core.enricher_service.batch_lookup_openlib")
+    @patch("epub_enricher.core.enricher_service.is_openlibrary_cached")
+    def test_only_uncached_isbns_are_batched(self, mock_ol, mock_batch, mock_gb, mock_gb_batch):
+        """Test que seuls les livres absents du cache sont demandés par lot."""
+        mock_ol.side_effect = lambda title, authors, isbn: isbn == "1"
+        mock_batch.return_value = {"2": {"key": "/books/OL2M"}}
+        mock_gb.is_cached.side_effect = lambda title, isbn: isbn == "2"
+        mock_gb_batch.return_value = {"1": {}}
+
+        prefetch = _prefetch_batch(self._metas("1", "2", None))
+
+        mock_batch.assert_called_once_with(["2"])
+        mock_gb_batch.assert_called_once_with(["1"])
+        assert prefetch.editions == {"2": {"key": "/books/OL2M"}}
+        assert prefetch.books == {"1": {}}
+
+    @patch("epub_enricher.core.enricher_service.query_google_books_batch")
+    @patch("epub_enricher.core.enricher_service.query_google_books")
+    @patch("epub_enricher.core.enricher_service.batch_lookup_openlib")
+    @patch("epub_enricher.core.enricher_service.is_openlibrary_cached")
+    def test_warm_batch_sends_no_request(self, mock_ol, mock_batch, mock_gb, mock_gb_batch):
+        """Test qu'un lot entièrement en cache n'envoie aucune requête groupée."""
+        mock_ol.return_value = True
+        mock_gb.is_cached.return_value = True
+
+        prefetch = _prefetch_batch(self._metas("1", "2"))
+
+        assert prefetch.editions == {} and prefetch.books == {}
+        mock_batch.assert_not_called()
+        mock_gb_batch.assert_not_called()
+
+    @patch("epub_enricher.core.enricher_service.fetch_enriched_metadata")
+    def test_prefetched_edition_passed_to_lookup(self, mock_fetch):
+        """Test que les résultats pré-chargés du livre sont transmis à l'agrégateur."""
+        mock_fetch.return_value = {}
+        edition = {"key": "/books/OL1M"}
+        prefetch = _BatchPrefetch(editions={"1": edition}, books={"1": {"summary": "S"}})
+
+        EnricherService()._enrich(self._metas("1")[0], prefetch=prefetch)
+
+        assert mock_fetch.call_args.kwargs["ol_edition"] == edition
+        assert mock_fetch.call_args.kwargs["google_prefetched"] == {"summary": "S"}
+
+
 class TestApplyEnrichment:
     """Tests pour apply_enrichment."""
 
+    @patch("epub_enricher.core.enricher_service.backup_file")
     @patch("epub_enricher.core.enricher_service.update_epub_with_metadata")
     @patch("epub_enricher.core.enricher_service.rename_epub_file")
-    def test_apply_enrichment_success(self, mock_rename, mock_update):
+    def test_apply_enrichment_success(self, mock_rename, mock_update, mock_backup):
         """Test application réussie."""
         mock_update.return_value = True
 
@@ -123,11 +232,70 @@ class TestApplyEnrichment:
         result = service.apply_enrichment(meta)
 
         assert result is True
+        mock_backup.assert_called_once_with("/fake/path/test.epub")
         mock_update.assert_called_once()
         mock_rename.assert_called_once()
 
+    @patch("epub_enricher.core.enricher_service.BACKUP_BEFORE_APPLY", False)
+    @patch("epub_enricher.core.enricher_service.backup_file")
     @patch("epub_enricher.core.enricher_service.update_epub_with_metadata")
-    def test_apply_enrichment_failure(self, mock_update):
+    @patch("epub_enricher.core.enricher_service.rename_epub_file")
+    def test_backup_can_be_disabled(self, mock_rename, mock_update, mock_backup):
+        """Test qu'aucune sauvegarde n'est faite quand BACKUP_BEFORE_APPLY est désactivé."""
+        mock_update.return_value = True
+        meta = EpubMeta(path="/fake/path/test.epub", filename="test.epub")
+
+        assert EnricherService().apply_enrichment(meta) is True
+
+        mock_backup.assert_not_called()
+
+    def test_backup_keeps_original_content(self, sample_epub_path, tmp_path, monkeypatch):
+        """Test que la sauvegarde (lien physique) garde le fichier d'avant l'écriture."""
+        from epub_enricher.core import file_utils
+
+        monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path / "backups"))
+        monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+        (tmp_path / "backups").mkdir()
+        with open(sample_epub_path, "rb") as f:
+            before = f.read()
+
+        meta = EpubMeta(path=sample_epub_path, filename="sample.epub", suggested_title="Nouveau")
+        with patch("epub_enricher.core.enricher_service.rename_epub_file"):
+            assert EnricherService().apply_enrichment(meta) is True
+
+        (backup,) = (tmp_path / "backups").iterdir()
+        assert backup.read_bytes() == before
+        with open(sample_epub_path, "rb") as f:
+            assert f.read() != before
+
+    @patch("epub_enricher.core.enricher_service.backup_file")
+    @patch("epub_enricher.core.enricher_service.update_epub_with_metadata")
+    @patch("epub_enricher.core.enricher_service.rename_epub_file")
+    @patch("epub_enricher.core.enricher_service.download_cover")
+    def test_apply_enrichment_downloads_suggested_cover(
+        self, mock_cover, mock_rename, mock_update, mock_backup
+    ):
+        """Test que la couverture proposée n'est téléchargée qu'à l'application."""
+        mock_cover.return_value = b"new-cover"
+        mock_update.return_value = True
+
+        meta = EpubMeta(
+            path="/fake/path/test.epub",
+            filename="test.epub",
+            suggested_cover_data=b"old-cover",
+            suggested_cover_id=42,
+        )
+
+        service = EnricherService()
+        assert service.apply_enrichment(meta) is True
+
+        mock_cover.assert_called_once_with(42)
+        assert mock_update.call_args.args[1].suggested_cover_data == b"new-cover"
+        assert meta.suggested_cover_id is None
+
+    @patch("epub_enricher.core.enricher_service.backup_file")
+    @patch("epub_enricher.core.enricher_service.update_epub_with_metadata")
+    def test_apply_enrichment_failure(self, mock_update, mock_backup):
         """Test échec d'application."""
         mock_update.return_value = False
 
@@ -142,8 +310,8 @@ class TestApplyEnrichment:
 class TestProcessFolder:
     """Tests pour process_folder."""
 
-    @patch("epub_enricher.core.enricher_service.find_epubs_in_folder")
-    @patch.object(EnricherService, "process_epub")
+    @patch("epub_enricher.core.enricher_service.iter_epubs_in_folder")
+    @patch.object(EnricherService, "_enrich")
     def test_process_folder_multiple_files(self, mock_process, mock_find):
         """Test traitement de plusieurs fichiers."""
         mock_find.return_value = ["/folder/book1.epub", "/folder/book2.epub"]
@@ -161,8 +329,8 @@ class TestProcessFolder:
         assert len(results) == 2
         assert mock_process.call_count == 2
 
-    @patch("epub_enricher.core.enricher_service.find_epubs_in_folder")
-    @patch.object(EnricherService, "process_epub")
+    @patch("epub_enricher.core.enricher_service.iter_epubs_in_folder")
+    @patch.object(EnricherService, "_enrich")
     @patch.object(EnricherService, "apply_enrichment")
     def test_process_folder_with_autosave(self, mock_apply, mock_process, mock_find):
         """Test traitement avec autosave."""
@@ -178,3 +346,41 @@ class TestProcessFolder:
 
         assert len(results) == 1
         mock_apply.assert_called_once_with(mock_meta)
+
+    @patch("epub_enricher.core.enricher_service.iter_epubs_in_folder")
+    @patch("epub_enricher.core.enricher_service._extract_only")
+    @patch.object(EnricherService, "_enrich")
+    def test_process_folder_skips_failed_extractions(self, mock_process, mock_extract, mock_find):
+        """Test qu'un échec d'extraction n'interrompt pas le dossier."""
+        mock_find.return_value = ["/folder/book1.epub"]
+        mock_extract.return_value = None
+
+        service = EnricherService()
+        results = service.process_folder("/folder")
+
+        assert results == []
+        mock_process.assert_not_called()
+
+    @patch("epub_enricher.core.enricher_service.FOLDER_BATCH_SIZE", 2)
+    @patch("epub_enricher.core.enricher_service.iter_epubs_in_folder")
+    @patch("epub_enricher.core.enricher_service._extract_only")
+    @patch.object(EnricherService, "_enrich")
+    def test_process_folder_in_batches(self, mock_process, mock_extract, mock_find):
+        """Test que les fichiers sont traités par lots en conservant l'ordre."""
+        paths = [f"/folder/book{i}.epub" for i in range(3)]
+        mock_find.return_value = iter(paths)
+        mock_extract.side_effect = lambda p: EpubMeta(path=p, filename=p.rsplit("/", 1)[-1])
+        mock_process.side_effect = lambda meta, **_: meta
+
+        service = EnricherService()
+        with patch("epub_enricher.core.enricher_service.ProcessPoolExecutor", ThreadPoolExecutor):
+            results = service.process_folder("/folder")
+
+        assert [m.path for m in results] == paths
+
+    def test_extract_only_drops_cover_bytes(self, sample_epub_path):
+        """Test que l'extraction en processus ne renvoie pas la couverture originale."""
+        meta = _extract_only(sample_epub_path)
+
+        assert meta.original_title == "Test Book"
+        assert meta.original_cover_data is None
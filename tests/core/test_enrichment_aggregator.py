@@ -0,0 +1,113 @@
+# tests/core/test_enrichment_aggregator.py
+"""
+Tests pour le module core.enrichment.aggregator.
+"""
+
+import threading
+from unittest.mock import patch
+
+from epub_enricher.core.enrichment.aggregator import fetch_enriched_metadata
+
+
+class TestFetchEnrichedMetadata:
+    """Tests pour fetch_enriched_metadata."""
+
+    def test_without_title_or_isbn(self):
+        """Test qu'aucune source n'est interrogée sans titre ni ISBN."""
+        result = fetch_enriched_metadata(authors=["Author"])
+
+        assert result["summary"] is None
+        assert result["tags"] == []
+
+    @patch("epub_enricher.core.enrichment.aggregator.query_wikipedia_summary")
+    @patch("epub_enricher.core.enrichment.aggregator.query_google_books")
+    @patch("epub_enricher.core.enrichment.aggregator.query_openlibrary_full")
+    def test_sources_queried_concurrently(self, mock_ol, mock_google, mock_wiki):
+        """Test qu'OpenLibrary et Google sont interrogés en même temps."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def source(value):
+            def query(*args):
+                barrier.wait()  # Échoue si les sources sont appelées l'une après l'autre
+                return value
+
+            return query
+
+        mock_ol.side_effect = source({"tags": ["Roman"]})
+        mock_google.side_effect = source({"summary": "Résumé Google", "tags": ["Fiction"]})
+
+        result = fetch_enriched_metadata(title="Titre", isbn="9782070360024")
+
+        assert result["summary"] == "Résumé Google"
+        assert result["tags"] == ["Roman", "Fiction"]
+        mock_wiki.assert_not_called()
+
+    @patch("epub_enricher.core.enrichment.aggregator.query_wikipedia_summary")
+    @patch("epub_enricher.core.enrichment.aggregator.query_google_books")
+    @patch("epub_enricher.core.enrichment.aggregator.query_openlibrary_full")
+    def test_wikipedia_used_without_other_summary(self, mock_ol, mock_google, mock_wiki):
+        """Test que Wikipedia n'est interrogé qu'en dernier recours."""
+        mock_ol.return_value = {}
+        mock_google.return_value = {}
+        mock_wiki.return_value = "Résumé Wikipedia"
+
+        result = fetch_enriched_metadata(title="Titre")
+
+        mock_wiki.assert_called_once_with("Titre")
+        assert result["summary"] == "Résumé Wikipedia"
+
+    @patch("epub_enricher.core.enrichment.aggregator.query_wikipedia_summary")
+    @patch("epub_enricher.core.enrichment.aggregator.query_google_books")
+    @patch("epub_enricher.core.enrichment.aggregator.query_openlibrary_full")
+    def test_returns_openlibrary_editions(self, mock_ol, mock_google, mock_wiki):
+        """Test que les éditions OpenLibrary sont renvoyées (pas de seconde requête OL)."""
+        mock_ol.return_value = {"summary": "Résumé OL", "related_docs": [{"title": "Titre"}]}
+        mock_google.return_value = {}
+
+        result = fetch_enriched_metadata(title="Titre")
+
+        mock_ol.assert_called_once_with("Titre", None, None, None)
+        mock_wiki.assert_not_called()
+        assert result["summary"] == "Résumé OL"
+        assert result["related_docs"] == [{"title": "Titre"}]
+
+    @patch("epub_enricher.core.enrichment.aggregator.query_wikipedia_summary")
+    @patch("epub_enricher.core.enrichment.aggregator.query_google_books")
+    @patch("epub_enricher.core.enrichment.aggregator.query_openlibrary_full")
+    def test_placeholder_title_skips_title_searches(self, mock_ol, mock_google, mock_wiki):
+        """Test qu'un titre générique n'entraîne ni recherche Google ni Wikipedia."""
+        mock_ol.return_value = {}
+
+        result = fetch_enriched_metadata(title=" Untitled ")
+
+        mock_google.assert_not_called()
+        mock_wiki.assert_not_called()
+        assert result["summary"] is None
+
+    @patch("epub_enricher.core.enrichment.aggregator.query_wikipedia_summary")
+    @patch("epub_enricher.core.enrichment.aggregator.query_google_books")
+    @patch("epub_enricher.core.enrichment.aggregator.query_openlibrary_full")
+    def test_placeholder_title_with_isbn_keeps_google(self, mock_ol, mock_google, mock_wiki):
+        """Test que Google Books reste interrogé par ISBN malgré un titre générique."""
+        mock_ol.return_value = {}
+        mock_google.return_value = {}
+
+        fetch_enriched_metadata(title="?", isbn="9782070360024")
+
+        mock_google.assert_called_once_with("?", "9782070360024", None)
+        mock_wiki.assert_not_called()
+
+    @patch("epub_enricher.core.enrichment.aggregator.query_wikipedia_summary")
+    @patch("epub_enricher.core.enrichment.aggregator.query_google_books")
+    @patch("epub_enricher.core.enrichment.aggregator.query_openlibrary_full")
+    def test_cover_is_not_downloaded(self, mock_ol, mock_google, mock_wiki):
+        """Test que seule la référence de couverture est renvoyée."""
+        mock_ol.return_value = {"summary": "Résumé OL", "cover_id": 42}
+        mock_google.return_value = {}
+
+        with patch("epub_enricher.core.openlibrary_client.http_download_bytes") as mock_download:
+            result = fetch_enriched_metadata(title="Titre")
+
+        mock_download.assert_not_called()
+        assert result["cover_id"] == 42
+        assert "cover_data" not in result
@@ -3,6 +3,9 @@
 Tests pour le module core.enrichment.genre_mapper.
 """
 
+import pytest
+
+from epub_enricher.core.enrichment import genre_mapper
 from epub_enricher.core.enrichment.genre_mapper import (
     GENRE_MAPPING,
     aggregate_genre,
@@ -39,10 +42,23 @@ class TestMapTagsToGenre:
         result = map_tags_to_genre(["Unknown Genre"])
         assert result is None
 
+    def test_map_uses_genre_priority_not_tag_order(self):
+        """Test que le genre le plus prioritaire l'emporte, quel que soit l'ordre des tags."""
+        assert map_tags_to_genre(["Thriller", "Novel"]) == "Fiction"
+        # "Fantasy" figure dans Science-Fiction avant Fantasy
+        assert map_tags_to_genre(["fantasy"]) == "Science-Fiction"
+
 
 class TestMapOpenlibSubjectToGenre:
     """Tests pour map_openlibrary_subject_to_genre."""
 
+    @pytest.fixture(autouse=True)
+    def clear_subject_cache(self):
+        """Vide le cache des sujets pour tester chaque chemin de recherche."""
+        map_openlibrary_subject_to_genre.cache_clear()
+        yield
+        map_openlibrary_subject_to_genre.cache_clear()
+
     def test_map_with_keyword_in_subject(self):
         """Test avec keyword dans le sujet."""
         result = map_openlibrary_subject_to_genre("French Fiction Literature")
@@ -53,6 +69,30 @@ class TestMapOpenlibSubjectToGenre:
         result = map_openlibrary_subject_to_genre("Unknown Subject")
         assert result is None
 
+    def test_same_result_without_automaton(self, monkeypatch):
+        """Test que le repli sans pyahocorasick donne le même genre."""
+        subject = "Juvenile fiction, Fantasy, Magic"
+        expected = map_openlibrary_subject_to_genre(subject)
+        map_openlibrary_subject_to_genre.cache_clear()
+
+        monkeypatch.setattr(genre_mapper, "_SUBJECT_AUTOMATON", None)
+
+        assert map_openlibrary_subject_to_genre(subject) == expected == "Fiction"
+
+    def test_fallback_sees_overlapping_keywords(self, monkeypatch):
+        """Test que le repli voit les mots-clés chevauchants ("fiction" dans "science fiction")."""
+        monkeypatch.setattr(genre_mapper, "_SUBJECT_AUTOMATON", None)
+
+        assert map_openlibrary_subject_to_genre("Science fiction") == "Fiction"
+        assert map_openlibrary_subject_to_genre("Poems about history") == "History"
+
+    def test_repeated_subject_served_from_cache(self):
+        """Test qu'un sujet déjà vu n'est pas réanalysé."""
+        map_openlibrary_subject_to_genre("Detective and mystery stories")
+        map_openlibrary_subject_to_genre("Detective and mystery stories")
+
+        assert map_openlibrary_subject_to_genre.cache_info().hits == 1
+
 
 class TestAggregateGenre:
     """Tests pour aggregate_genre."""
@@ -3,11 +3,13 @@
 Tests pour le module core.enrichment.google_books.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
+from epub_enricher.core.enrichment import google_books
 from epub_enricher.core.enrichment.google_books import (
     _parse_google_book,
     query_google_books,
+    query_google_books_batch,
 )
 
 
@@ -30,6 +32,14 @@ class TestParseGoogleBook:
         assert "tags" in result
         assert len(result["tags"]) == 2
 
+    def test_parse_deduplicates_tags(self):
+        """Test que les tags sont dédoublonnés sans tenir compte de la casse."""
+        item = {"volumeInfo": {"categories": ["Fiction", "fiction", "Mystery", "Fiction"]}}
+
+        result = _parse_google_book(item)
+
+        assert result["tags"] == ["Fiction", "Mystery"]
+
     def test_parse_with_minimal_data(self):
         """Test parsing avec données minimales."""
         item = {"volumeInfo": {}}
@@ -61,33 +71,31 @@ class TestQueryGoogleBooks:
         result = query_google_books()
         assert result == {}
 
-    @patch("epub_enricher.core.enrichment.google_books.http_get")
+    @patch("epub_enricher.core.enrichment.google_books.http_get_json")
     def test_query_with_isbn(self, mock_http_get):
         """Test query avec ISBN."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_http_get.return_value = {
             "items": [{"volumeInfo": {"description": "Test book", "categories": ["Fiction"]}}]
         }
-        mock_http_get.return_value = mock_response
 
         result = query_google_books(isbn="9781234567890")
 
         assert "summary" in result
         assert "tags" in result
         mock_http_get.assert_called_once()
+        params = mock_http_get.call_args.kwargs["params"]
+        assert params["fields"] == google_books.GOOGLE_BOOKS_FIELDS
 
-    @patch("epub_enricher.core.enrichment.google_books.http_get")
+    @patch("epub_enricher.core.enrichment.google_books.http_get_json")
     def test_query_with_no_results(self, mock_http_get):
         """Test query sans résultats."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"items": None}
-        mock_http_get.return_value = mock_response
+        mock_http_get.return_value = {"items": None}
 
         result = query_google_books(title="Nonexistent Book")
 
         assert result == {}
 
-    @patch("epub_enricher.core.enrichment.google_books.http_get")
+    @patch("epub_enricher.core.enrichment.google_books.http_get_json")
     def test_query_with_api_error(self, mock_http_get):
         """Test query avec erreur API."""
         mock_http_get.side_effect = Exception("API Error")
@@ -95,3 +103,49 @@ class TestQueryGoogleBooks:
         result = query_google_books(title="Test Book")
 
         assert result == {}
+
+
+class TestQueryGoogleBooksBatch:
+    """Tests pour query_google_books_batch et le pré-chargement."""
+
+    @patch("epub_enricher.core.enrichment.google_books.http_get_json")
+    def test_batch_routes_results_to_isbns(self, mock_get):
+        """Test qu'un seul appel couvre le lot et que chaque volume retrouve son ISBN."""
+        mock_get.return_value = {
+            "items": [
+                {
+                    "volumeInfo": {
+                        "description": "Résumé B",
+                        "industryIdentifiers": [
+                            {"type": "ISBN_10", "identifier": "2070360024"},
+                            {"type": "ISBN_13", "identifier": "9782070360024"},
+                        ],
+                    }
+                }
+            ]
+        }
+
+        result = query_google_books_batch(["9781111111111", "9782070360024"])
+
+        assert mock_get.call_count == 1
+        query = mock_get.call_args.kwargs["params"]["q"]
+        assert query == "isbn:9781111111111 OR isbn:9782070360024"
+        assert "industryIdentifiers" in mock_get.call_args.kwargs["params"]["fields"]
+        # Réponse complète: l'ISBN sans volume est connu comme absent
+        assert result == {"9782070360024": {"summary": "Résumé B"}, "9781111111111": {}}
+
+    @patch("epub_enricher.core.enrichment.google_books.http_get_json")
+    def test_failed_batch_leaves_isbns_unresolved(self, mock_get):
+        """Test qu'un lot en échec n'associe aucun résultat à ses ISBN."""
+        mock_get.side_effect = RuntimeError("boom")
+
+        assert query_google_books_batch(["9781111111111"]) == {}
+
+    @patch("epub_enricher.core.enrichment.google_books.http_get_json")
+    def test_prefetched_result_skips_request(self, mock_get):
+        """Test qu'un résultat pré-chargé (même vide) évite la requête individuelle."""
+        result = query_google_books(isbn="9782070360024", prefetched={"summary": "Résumé"})
+
+        assert result == {"summary": "Résumé"}
+        assert query_google_books(isbn="9781111111111", prefetched={}) == {}
+        mock_get.assert_not_called()
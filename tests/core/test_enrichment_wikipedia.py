@@ -0,0 +1,51 @@
+# tests/core/test_enrichment_wikipedia.py
+"""
+Tests pour le module core.enrichment.wikipedia.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from epub_enricher.core import cache
+from epub_enricher.core.enrichment.wikipedia import query_wikipedia_summary
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    return requests.HTTPError(response=MagicMock(status_code=status))
+
+
+@pytest.fixture
+def api_cache(tmp_path, monkeypatch):
+    """Active le cache API dans une base temporaire."""
+    monkeypatch.setattr(cache, "API_CACHE_PATH", str(tmp_path / "cache.sqlite"))
+    cache.set_cache_enabled(True)
+
+
+@patch("epub_enricher.core.enrichment.wikipedia.http_get_json")
+def test_summary_found(mock_get):
+    """Test qu'un résumé HTML est nettoyé."""
+    mock_get.return_value = {"extract_html": "<p>Un <b>roman</b>.</p>"}
+
+    assert query_wikipedia_summary("Titre") == "Un roman ."
+
+
+@patch("epub_enricher.core.enrichment.wikipedia.http_get_json")
+def test_missing_page_is_cached(mock_get, api_cache):
+    """Test qu'une page absente (404) n'est demandée qu'une fois."""
+    mock_get.side_effect = _http_error(404)
+
+    assert query_wikipedia_summary("Titre inconnu") is None
+    assert query_wikipedia_summary("Titre inconnu") is None
+
+    assert mock_get.call_count == 1
+
+
+@patch("epub_enricher.core.enrichment.wikipedia.http_get_json")
+def test_network_failure_is_not_cached(mock_get, api_cache):
+    """Test qu'un échec réseau sera retenté au prochain appel."""
+    mock_get.side_effect = [_http_error(503), {"extract_html": "<p>Résumé</p>"}]
+
+    assert query_wikipedia_summary("Titre") is None
+    assert query_wikipedia_summary("Titre") == "Résumé"
@@ -0,0 +1,59 @@
+# tests/core/test_epub_cover_finder.py
+"""
+Tests pour le module core.epub.cover_finder.
+"""
+
+import ebooklib
+
+from epub_enricher.core.epub.cover_finder import _find_cover_by_bruteforce, _find_cover_by_opf
+from epub_enricher.core.epub.fast_reader import read_epub_fast
+
+
+class FakeImage:
+    """Image EPUB minimale exposant get_name()."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def get_name(self) -> str:
+        return self.name
+
+
+class FakeBook:
+    """Livre minimal exposant get_items_of_type()."""
+
+    def __init__(self, names):
+        self.images = [FakeImage(n) for n in names]
+
+    def get_items_of_type(self, item_type):
+        return iter(self.images) if item_type == ebooklib.ITEM_IMAGE else iter([])
+
+
+class TestFindCoverByBruteforce:
+    """Tests pour _find_cover_by_bruteforce."""
+
+    def test_cover_name_wins_over_couv(self):
+        """Test qu'une image "cover" est préférée à une image "couv" placée avant."""
+        book = FakeBook(["img/fig1.png", "img/Couverture.jpg", "img/Cover.jpg"])
+        assert _find_cover_by_bruteforce(book).get_name() == "img/Cover.jpg"
+
+    def test_couv_name_wins_over_first_image(self):
+        """Test qu'une image "couv" est préférée à la première image."""
+        book = FakeBook(["img/fig1.png", "img/couv.jpg"])
+        assert _find_cover_by_bruteforce(book).get_name() == "img/couv.jpg"
+
+    def test_falls_back_to_first_image(self):
+        """Test du repli sur la première image."""
+        book = FakeBook(["img/fig1.png", "img/fig2.png"])
+        assert _find_cover_by_bruteforce(book).get_name() == "img/fig1.png"
+
+    def test_no_images(self):
+        """Test sans image."""
+        assert _find_cover_by_bruteforce(FakeBook([])) is None
+
+
+def test_find_cover_by_opf_with_fast_reader(sample_epub_path):
+    """Test de la stratégie OPF sur l'arbre parsé par la lecture rapide."""
+    with read_epub_fast(sample_epub_path) as book:
+        assert book.get_cover_id() == "cover-img"
+        assert _find_cover_by_opf(book).get_content() == b"\xff\xd8fake-jpeg"
@@ -0,0 +1,98 @@
+# tests/core/test_epub_fast_reader.py
+"""
+Tests pour le module core.epub.fast_reader.
+"""
+
+import zipfile
+
+import ebooklib
+from ebooklib import epub
+
+from epub_enricher.core.epub.fast_reader import read_epub_fast
+from epub_enricher.core.epub.reader import extract_metadata
+
+
+def test_read_epub_fast_matches_ebooklib_metadata(sample_epub_path):
+    """Test que les métadonnées DC lues sont identiques à celles d'ebooklib."""
+    reference = epub.read_epub(sample_epub_path)
+
+    with read_epub_fast(sample_epub_path) as book:
+        for name in ("title", "creator", "identifier", "language", "publisher", "subject"):
+            values = [v for v, _ in book.get_metadata("DC", name)]
+            assert values == [v for v, _ in reference.get_metadata("DC", name)]
+        assert book.get_metadata("OPF", "cover")[0][1]["content"] == "cover-img"
+
+
+def test_read_epub_fast_reads_items_lazily(sample_epub_path):
+    """Test que les items du manifeste sont typés et lisibles à la demande."""
+    with read_epub_fast(sample_epub_path) as book:
+        docs = [item.get_name() for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)]
+        cover = next(book.get_items_of_type(ebooklib.ITEM_COVER))
+
+        assert docs == ["cover.xhtml", "c0.xhtml", "c1.xhtml"]
+        assert cover.get_content() == b"\xff\xd8fake-jpeg"
+        assert book.get_item_with_id("cover-img") is cover
+
+
+def test_read_epub_fast_invalid_file(tmp_path):
+    """Test qu'un fichier qui n'est pas un EPUB renvoie None."""
+    path = tmp_path / "broken.epub"
+    path.write_bytes(b"not a zip")
+
+    assert read_epub_fast(str(path)) is None
+
+
+def test_extract_metadata_with_fast_reader(sample_epub_path):
+    """Test de l'extraction complète sur un vrai EPUB."""
+    data = extract_metadata(sample_epub_path)
+
+    assert data["title"] == "Test Book"
+    assert data["authors"] == ["Test Author"]
+    assert data["identifier"] == "9782070368228"
+    assert data["tags"] == ["Fiction"]
+    assert data["cover_data"] == b"\xff\xd8fake-jpeg"
+
+
+def test_read_epub_fast_stops_after_manifest(tmp_path):
+    """Test que le contenu de l'OPF après le manifeste n'est pas parsé."""
+    opf = (
+        '<?xml version="1.0"?>'
+        '<package xmlns="http://www.idpf.org/2007/opf" version="2.0">'
+        '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>T</dc:title></metadata>'
+        '<manifest><item id="c" href="c.xhtml" media-type="application/xhtml+xml"/></manifest>'
+        "<spine><itemref idref="  # XML invalide: ne doit jamais être lu
+    )
+    container = (
+        '<?xml version="1.0"?>'
+        '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container" version="1.0">'
+        '<rootfiles><rootfile full-path="content.opf" media-type="application/oebps-package+xml"/>'
+        "</rootfiles></container>"
+    )
+    path = tmp_path / "partial.epub"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("META-INF/container.xml", container)
+        zf.writestr("content.opf", opf)
+
+    with read_epub_fast(str(path)) as book:
+        assert book.get_metadata("DC", "title")[0][0] == "T"
+        assert book.get_item_with_id("c").get_name() == "c.xhtml"
+
+
+def test_read_prefix_returns_start_of_item(sample_epub_path):
+    """Test que read_prefix ne renvoie que le début du contenu de l'item."""
+    with read_epub_fast(sample_epub_path) as book:
+        item = book.get_item_with_id("cover-img")
+
+        assert item.read_prefix(4) == b"\xff\xd8fa"
+        assert item.read_prefix(1024) == item.get_content()
+
+
+def test_read_prefix_reuses_longer_prefix(sample_epub_path):
+    """Test qu'un préfixe plus court que le précédent ne relit pas l'archive."""
+    with read_epub_fast(sample_epub_path) as book:
+        item = book.get_item_with_id("cover-img")
+        content = item.read_prefix(1024)
+        item._zip = None  # Toute nouvelle lecture échouerait
+
+        assert item.read_prefix(4) == content[:4]
+        assert item.read_prefix(1024) == content
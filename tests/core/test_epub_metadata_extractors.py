@@ -0,0 +1,149 @@
+# tests/core/test_epub_metadata_extractors.py
+"""
+Tests pour le module core.epub.metadata_extractors.
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from epub_enricher.config import LANGDETECT_LANGUAGES
+from epub_enricher.core.epub.metadata_extractors import (
+    _get_detector_factory,
+    _html_text,
+    detect_language_from_text,
+    find_isbn_in_text,
+    validate_isbn,
+)
+
+
+class FakeItem:
+    """Document EPUB minimal exposant get_content()."""
+
+    def __init__(self, content: bytes):
+        self._content = content
+
+    def get_content(self) -> bytes:
+        return self._content
+
+
+def test_find_isbn_in_text_skips_invalid_candidates():
+    """Test qu'un numéro invalide n'empêche pas de trouver l'ISBN suivant."""
+    docs = [FakeItem(b"<p>Tel 0123456789012</p><p>ISBN 978-2-07-036822-8</p>")]
+
+    assert find_isbn_in_text(docs) == "9782070368228"
+
+
+def test_find_isbn_in_text_ignores_content_beyond_scan_limit(monkeypatch):
+    """Test que seul le début de chaque document est analysé."""
+    monkeypatch.setattr("epub_enricher.core.epub.metadata_extractors.ISBN_SCAN_BYTES", 16)
+    docs = [FakeItem(b"x" * 32 + b"ISBN 978-2-07-036822-8")]
+
+    assert find_isbn_in_text(docs) is None
+
+
+def test_find_isbn_in_text_limits_scanned_documents(monkeypatch):
+    """Test que seuls les premiers et derniers documents sont analysés."""
+    monkeypatch.setattr("epub_enricher.core.epub.metadata_extractors.ISBN_SCAN_DOCS", 2)
+    chapter = FakeItem(b"<p>Chapitre</p>")
+    docs = [chapter] * 2 + [FakeItem(b"ISBN 978-2-07-036822-8")] + [chapter] * 2
+
+    assert find_isbn_in_text(docs) is None
+
+
+def test_find_isbn_in_text_scans_last_documents(monkeypatch):
+    """Test qu'un ISBN du colophon (dernier document) est trouvé."""
+    monkeypatch.setattr("epub_enricher.core.epub.metadata_extractors.ISBN_SCAN_DOCS", 2)
+    docs = [FakeItem(b"<p>Chapitre</p>")] * 10 + [FakeItem(b"ISBN 978-2-07-036822-8")]
+
+    assert find_isbn_in_text(docs) == "9782070368228"
+
+
+def test_detect_language_ignores_markup():
+    """Test que la langue est détectée sur le texte, sans les balises."""
+    paragraph = (
+        "<p class='texte'>Aujourd'hui, maman est morte. Ou peut-être hier, je ne sais pas.</p>"
+    )
+    docs = [FakeItem(("<html><body>" + paragraph * 20 + "</body></html>").encode("utf-8"))]
+
+    assert detect_language_from_text(docs) == "fr"
+
+
+def test_html_text_handles_xhtml_prefix():
+    """Test l'extraction du texte d'un début de XHTML (déclaration XML, coupure UTF-8)."""
+    html = (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body>\n'
+        "  <p>L'été <em>était</em>   chaud.</p>\n  <p>Fin é"
+    ).encode("utf-8")[:-1]
+
+    assert _html_text(html, 100).startswith("L'été était chaud. Fin")
+    assert _html_text(html, 5) == "L'été"
+    assert _html_text(b"", 100) == ""
+
+
+def test_detect_language_without_docs():
+    """Test sans document."""
+    assert detect_language_from_text([]) is None
+
+
+def test_find_isbn_in_text_no_docs():
+    """Test sans document."""
+    assert find_isbn_in_text([]) is None
+
+
+def test_detector_factory_loads_only_configured_profiles():
+    """Test que seuls les profils de langue configurés sont chargés, une fois."""
+    factory = _get_detector_factory()
+
+    assert factory.get_lang_list() == list(LANGDETECT_LANGUAGES)
+    assert _get_detector_factory() is factory
+
+
+def test_detect_language_reuses_result_for_identical_sample(monkeypatch):
+    """Test qu'un échantillon déjà analysé n'est pas redonné à langdetect."""
+    from epub_enricher.core.epub import metadata_extractors
+
+    docs = [FakeItem(("<p>" + "The quick brown fox jumps over the lazy dog. " * 20).encode())]
+    assert detect_language_from_text(docs) == "en"
+
+    monkeypatch.setattr(
+        metadata_extractors, "_get_detector_factory", lambda: pytest.fail("langdetect called again")
+    )
+    assert detect_language_from_text(docs) == "en"
+
+
+class FakeCld3:
+    """Module gcld3 minimal: identifiant au résultat fixe."""
+
+    def __init__(self, language: str, is_reliable: bool):
+        self.result = SimpleNamespace(language=language, is_reliable=is_reliable)
+
+    def NNetLanguageIdentifier(self, min_num_bytes: int, max_num_bytes: int):
+        return SimpleNamespace(FindLanguage=lambda sample: self.result)
+
+
+@pytest.mark.parametrize(
+    "cld3, expected",
+    [(FakeCld3("de", True), "de"), (FakeCld3("de", False), "en"), (None, "en")],
+)
+def test_detect_language_prefers_reliable_cld3(monkeypatch, cld3, expected):
+    """Test que CLD3 est utilisé s'il est fiable, langdetect sinon ou s'il est absent."""
+    from epub_enricher.core.epub import metadata_extractors
+
+    monkeypatch.setattr(metadata_extractors, "gcld3", cld3)
+    monkeypatch.setattr(metadata_extractors, "_cld3_identifier", None)
+    monkeypatch.setattr(metadata_extractors, "_detected_languages", OrderedDict())
+
+    sample = "The quick brown fox jumps over the lazy dog. " * 20
+    assert metadata_extractors._detect_language(sample) == expected
+
+
+def test_validate_isbn():
+    """Test la validation d'ISBN-10 et ISBN-13 avec séparateurs."""
+    assert validate_isbn("2-07-036822-X") == "207036822X"
+    assert validate_isbn("2-07-036822-4") is None
+    assert validate_isbn("978-2-07-036822-8") == "9782070368228"
+    assert validate_isbn("978-2-07-036822-9") is None
+    assert validate_isbn("12345") is None
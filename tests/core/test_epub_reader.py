@@ -3,11 +3,14 @@
 Tests pour le module core.epub.reader.
 """
 
+import pytest
+
 from epub_enricher.core.epub.reader import (
     _get_authors,
     _get_tags,
     _get_title,
     extract_metadata,
+    extract_metadata_many,
     safe_read_epub,
 )
 
@@ -94,3 +97,88 @@ class TestMetadataExtractors:
 
         result = _get_tags(MockBook())
         assert result is None
+
+
+class TestExtractMetadataCache:
+    """Tests pour le cache disque de extract_metadata."""
+
+    def test_unchanged_file_not_read_again(self, sample_epub_path, tmp_path, monkeypatch):
+        """Test qu'un EPUB inchangé est servi par le cache, couverture comprise."""
+        from epub_enricher.core import cache
+        from epub_enricher.core.epub import reader
+
+        monkeypatch.setattr(cache, "API_CACHE_PATH", str(tmp_path / "cache.sqlite"))
+        cache.set_cache_enabled(True)
+
+        first = extract_metadata(sample_epub_path)
+        monkeypatch.setattr(reader, "read_epub_fast", lambda p: pytest.fail("EPUB re-read"))
+        second = extract_metadata(sample_epub_path)
+
+        assert second == first
+        assert isinstance(second["cover_data"], bytes)
+
+    def test_large_cover_not_cached(self, sample_epub_path, tmp_path, monkeypatch):
+        """Test qu'une couverture trop lourde n'est pas stockée dans le cache."""
+        from epub_enricher.core import cache
+        from epub_enricher.core.epub import reader
+
+        monkeypatch.setattr(cache, "API_CACHE_PATH", str(tmp_path / "cache.sqlite"))
+        monkeypatch.setattr(reader, "METADATA_CACHE_MAX_COVER_BYTES", 1)
+        cache.set_cache_enabled(True)
+
+        extract_metadata(sample_epub_path)
+        reads = []
+        monkeypatch.setattr(reader, "read_epub_fast", lambda p: reads.append(p))
+        extract_metadata(sample_epub_path)
+
+        assert reads == [sample_epub_path]
+
+
+class TestExtractMetadataMany:
+    """Tests pour extract_metadata_many."""
+
+    def test_order_kept_and_failures_isolated(self, sample_epub_path, monkeypatch):
+        """Test que l'ordre est conservé et qu'un échec ne bloque pas les autres."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from epub_enricher.core.epub import reader
+
+        real_extract = reader.extract_metadata
+
+        def extract(path):
+            if path == "boom.epub":
+                raise RuntimeError("boom")
+            return real_extract(path)
+
+        monkeypatch.setattr(reader, "extract_metadata", extract)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = extract_metadata_many(
+                [sample_epub_path, "boom.epub", sample_epub_path], executor=pool
+            )
+
+        assert [r and r["title"] for r in results] == ["Test Book", None, "Test Book"]
+
+    def test_workers_inherit_disabled_cache(self, sample_epub_path, monkeypatch):
+        """Test que le cache désactivé (--no-cache) est transmis aux processus."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from epub_enricher.core import cache
+        from epub_enricher.core.epub import reader
+
+        pools = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def __init__(self, max_workers, initializer, initargs):
+                pools.append((initializer, initargs))
+                super().__init__(max_workers)
+
+            def map(self, fn, *iterables, chunksize=1):
+                return super().map(fn, *iterables)
+
+        monkeypatch.setattr(reader, "ProcessPoolExecutor", RecordingPool)
+        cache.set_cache_enabled(False)
+
+        extract_metadata_many([sample_epub_path, sample_epub_path], max_workers=1)
+
+        assert pools == [(cache.set_cache_enabled, (False,))]
@@ -0,0 +1,242 @@
+# tests/core/test_epub_writer.py
+"""
+Tests pour le module core.epub.writer.
+"""
+
+import os
+import shutil
+import zipfile
+
+import pytest
+from ebooklib import epub
+from lxml import etree
+
+from epub_enricher.core.epub import writer
+from epub_enricher.core.epub.fast_reader import _find_opf_path
+from epub_enricher.core.epub.reader import extract_metadata
+from epub_enricher.core.epub.writer import update_epub_with_metadata
+from epub_enricher.core.models import EpubMeta
+
+
+def _meta(path: str, **suggested) -> EpubMeta:
+    return EpubMeta(path=path, filename="sample.epub", **suggested)
+
+
+class _Unseekable:
+    """Flux en écriture seule: zipfile écrit alors des data descriptors."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def write(self, data):
+        return self._f.write(data)
+
+    def flush(self):
+        self._f.flush()
+
+
+def _rewrite_archive(src_path: str, target, force_zip64: bool = False) -> None:
+    """Réécrit une archive entrée par entrée (en flux, éventuellement en zip64)."""
+    with zipfile.ZipFile(src_path) as src, zipfile.ZipFile(target, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            entry = zipfile.ZipInfo(info.filename, info.date_time)
+            entry.compress_type = info.compress_type
+            with dst.open(entry, "w", force_zip64=force_zip64) as out:
+                out.write(data)
+
+
+def _entries(epub_path: str) -> dict:
+    """
+    Retourne {nom: (méthode de compression, contenu)} dans l'ordre de l'archive.
+
+    Vérifie au passage l'intégrité de l'archive (CRC de chaque entrée).
+    """
+    with zipfile.ZipFile(epub_path) as zf:
+        assert zf.testzip() is None
+        return {i.filename: (i.compress_type, zf.read(i)) for i in zf.infolist()}
+
+
+def _dc_values(epub_path: str) -> dict:
+    """Retourne les valeurs DC de l'OPF, par champ, dans l'ordre du document."""
+    with zipfile.ZipFile(epub_path) as zf:
+        opf = etree.fromstring(zf.read(_find_opf_path(zf)))
+    values = {}
+    for el in opf.iter(f"{{{writer._DC_NS}}}*"):
+        values.setdefault(etree.QName(el).localname, []).append(el.text)
+    return values
+
+
+class TestUpdateOpfInPlace:
+    """Tests pour la mise à jour directe de l'OPF."""
+
+    def test_only_opf_is_rewritten(self, sample_epub_path, monkeypatch):
+        """Test que seules les métadonnées changent, sans reconstruction."""
+        monkeypatch.setattr(writer.epub, "write_epub", lambda *a: pytest.fail("rebuilt"))
+        with zipfile.ZipFile(sample_epub_path) as zf:
+            before = {i.filename: zf.read(i) for i in zf.infolist() if "opf" not in i.filename}
+
+        meta = _meta(
+            sample_epub_path,
+            suggested_title="Nouveau titre",
+            suggested_authors=["Auteur Un", "Auteur Deux"],
+            suggested_tags=["Roman"],
+            suggested_isbn="9782070360024",
+        )
+        assert update_epub_with_metadata(sample_epub_path, meta) is True
+
+        with zipfile.ZipFile(sample_epub_path) as zf:
+            names = zf.namelist()
+            after = {n: zf.read(n) for n in names if n in before}
+        assert names[0] == "mimetype"
+        assert after == before
+
+        data = extract_metadata(sample_epub_path)
+        assert data["title"] == "Nouveau titre"
+        assert data["authors"] == ["Auteur Un", "Auteur Deux"]
+        assert data["tags"] == ["Roman"]
+        assert data["identifier"] == "9782070360024"
+        # Les champs sans suggestion sont conservés
+        assert data["publisher"] == "Test Publisher"
+        assert data["language"] == "fr"
+
+    def test_entries_keep_content_and_compression(self, sample_epub_path):
+        """Test que les autres entrées gardent contenu, ordre et méthode de compression."""
+        with zipfile.ZipFile(sample_epub_path, "a") as zf:
+            zf.writestr("EPUB/big.xhtml", b"texte " * 5000, zipfile.ZIP_DEFLATED, compresslevel=1)
+            zf.writestr("EPUB/raw.bin", b"stocke", zipfile.ZIP_STORED)
+        before = _entries(sample_epub_path)
+
+        writer._update_opf_in_place(sample_epub_path, _meta(sample_epub_path, suggested_title="T"))
+
+        after = _entries(sample_epub_path)
+        opf_path = next(n for n in after if n.endswith(".opf"))
+        assert list(after) == list(before)
+        assert {n: v for n, v in after.items() if n != opf_path} == {
+            n: v for n, v in before.items() if n != opf_path
+        }
+        assert after["mimetype"][0] == zipfile.ZIP_STORED
+
+    def test_data_descriptor_entries(self, sample_epub_path, tmp_path):
+        """Test une archive dont les entrées utilisent un data descriptor (écriture en flux)."""
+        streamed = tmp_path / "streamed.epub"
+        with open(streamed, "wb") as f:
+            _rewrite_archive(sample_epub_path, _Unseekable(f))
+        with zipfile.ZipFile(streamed) as zf:
+            assert all(i.flag_bits & 0x08 for i in zf.infolist())
+        before = _entries(str(streamed))
+
+        assert update_epub_with_metadata(str(streamed), _meta(str(streamed), suggested_title="T"))
+
+        after = _entries(str(streamed))
+        assert {n: v for n, v in after.items() if not n.endswith(".opf")} == {
+            n: v for n, v in before.items() if not n.endswith(".opf")
+        }
+        assert extract_metadata(str(streamed))["title"] == "T"
+
+    def test_zip64_entries(self, sample_epub_path, tmp_path):
+        """Test une archive dont les en-têtes locaux portent un champ extra zip64."""
+        zip64 = tmp_path / "zip64.epub"
+        _rewrite_archive(sample_epub_path, str(zip64), force_zip64=True)
+        with zipfile.ZipFile(zip64) as zf:
+            assert all(i.extract_version >= zipfile.ZIP64_VERSION for i in zf.infolist())
+        before = _entries(str(zip64))
+
+        assert update_epub_with_metadata(str(zip64), _meta(str(zip64), suggested_title="T"))
+
+        after = _entries(str(zip64))
+        assert {n: v for n, v in after.items() if not n.endswith(".opf")} == {
+            n: v for n, v in before.items() if not n.endswith(".opf")
+        }
+        assert extract_metadata(str(zip64))["title"] == "T"
+
+    def test_same_dc_metadata_as_rebuild(self, sample_epub_path, tmp_path):
+        """Test que mise à jour directe et reconstruction écrivent les mêmes champs DC."""
+        rebuilt_path = str(tmp_path / "rebuilt.epub")
+        shutil.copy(sample_epub_path, rebuilt_path)
+        suggested = dict(
+            suggested_title="Nouveau titre",
+            suggested_authors=["Auteur Un", "Auteur Deux"],
+            suggested_isbn="9782070360024",
+            suggested_language="en",
+            suggested_publisher="Gallimard",
+            suggested_publication_date="1972",
+            suggested_tags=["Roman", "Classique"],
+            suggested_summary="Un résumé.",
+        )
+
+        writer._update_opf_in_place(sample_epub_path, _meta(sample_epub_path, **suggested))
+
+        meta = _meta(rebuilt_path, **suggested)
+        old_book = writer.safe_read_epub(rebuilt_path)
+        # Seules les métadonnées sont comparées: la table des matières relue
+        # depuis nav.xhtml (liens sans uid) n'est pas réécrite par ebooklib
+        old_book.toc = []
+        new_book = epub.EpubBook()
+        writer._apply_new_metadata(new_book, meta, old_book)
+        item_map = writer._copy_items(new_book, old_book, meta)
+        writer._handle_cover(new_book, old_book, meta, item_map)
+        writer._copy_navigation(new_book, old_book)
+        writer._write_rebuilt_epub(new_book, rebuilt_path)
+
+        assert _dc_values(sample_epub_path) == _dc_values(rebuilt_path)
+
+    def test_new_cover_uses_rebuild(self, sample_epub_path, monkeypatch):
+        """Test qu'une nouvelle couverture passe par la reconstruction complète."""
+        rebuilt = []
+        monkeypatch.setattr(
+            writer, "_update_opf_in_place", lambda *a: pytest.fail("in-place update")
+        )
+        monkeypatch.setattr(writer, "_write_rebuilt_epub", lambda book, path: rebuilt.append(path))
+
+        meta = _meta(sample_epub_path, suggested_title="T", suggested_cover_data=b"\xff\xd8new")
+        assert update_epub_with_metadata(sample_epub_path, meta) is True
+
+        assert rebuilt == [sample_epub_path]
+
+    def test_falls_back_to_rebuild_on_failure(self, sample_epub_path, monkeypatch):
+        """Test qu'un OPF illisible déclenche la reconstruction, sans fichier temporaire."""
+        rebuilt = []
+        monkeypatch.setattr(writer, "_find_opf_path", lambda zf: "missing.opf")
+        monkeypatch.setattr(writer, "_write_rebuilt_epub", lambda book, path: rebuilt.append(path))
+
+        assert update_epub_with_metadata(sample_epub_path, _meta(sample_epub_path)) is True
+
+        assert rebuilt == [sample_epub_path]
+        assert not os.path.exists(sample_epub_path + ".tmp")
+
+    def test_rebuild_failure_sets_short_note(self, sample_epub_path, monkeypatch):
+        """Test qu'un échec de reconstruction laisse une note sans trace d'appels."""
+        monkeypatch.setattr(writer, "safe_read_epub", lambda path: None)
+        meta = _meta(sample_epub_path, suggested_cover_data=b"\xff\xd8new")
+
+        assert update_epub_with_metadata(sample_epub_path, meta) is False
+
+        assert meta.note.startswith("Error rebuilding epub: ")
+        assert "Traceback" not in meta.note
+
+
+class TestWriteRebuiltEpub:
+    """Tests pour l'écriture du livre reconstruit."""
+
+    def test_writes_archive_in_one_go(self, tmp_path):
+        """Test que l'archive construite en mémoire remplace le fichier cible."""
+        book = epub.EpubBook()
+        book.set_identifier("id")
+        book.set_title("Titre")
+        book.set_language("fr")
+        chapter = epub.EpubHtml(title="C1", file_name="c1.xhtml", lang="fr")
+        chapter.content = "<html><body><p>Texte</p></body></html>"
+        book.add_item(chapter)
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ["nav", chapter]
+        target = tmp_path / "book.epub"
+        target.write_bytes(b"ancien contenu")
+
+        writer._write_rebuilt_epub(book, str(target))
+
+        with zipfile.ZipFile(target) as zf:
+            assert zf.read("mimetype") == b"application/epub+zip"
+            assert "EPUB/c1.xhtml" in zf.namelist()
+        assert not os.path.exists(str(target) + ".tmp")
@@ -0,0 +1,169 @@
+# tests/core/test_file_utils.py
+"""
+Tests pour le module core.file_utils.
+"""
+
+import errno
+import os
+
+import pytest
+
+from epub_enricher.core import file_utils
+from epub_enricher.core.file_utils import (
+    _resolve_filename_collision,
+    backup_file,
+    find_epubs_in_folder,
+    iter_epubs_in_folder,
+    sanitize_filename,
+)
+
+
+def test_iter_epubs_in_folder_recursive(tmp_path):
+    """Test que les EPUB des sous-dossiers sont trouvés et les autres fichiers ignorés."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.epub").write_bytes(b"")
+    (tmp_path / "sub" / "B.EPUB").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+
+    found = sorted(iter_epubs_in_folder(str(tmp_path)))
+
+    assert found == sorted([str(tmp_path / "a.epub"), str(tmp_path / "sub" / "B.EPUB")])
+
+
+def test_find_epubs_in_folder_missing_dir(tmp_path):
+    """Test qu'un dossier inexistant renvoie une liste vide."""
+    assert find_epubs_in_folder(str(tmp_path / "missing")) == []
+
+
+def test_iter_epubs_in_folder_deep_tree(tmp_path):
+    """Test qu'une arborescence profonde est parcourue sans récursion."""
+    folder = tmp_path
+    for i in range(50):
+        folder = folder / f"d{i}"
+    folder.mkdir(parents=True)
+    (folder / "deep.epub").write_bytes(b"")
+    (tmp_path / "top.epub").write_bytes(b"")
+
+    found = sorted(iter_epubs_in_folder(str(tmp_path)))
+
+    assert found == sorted([str(folder / "deep.epub"), str(tmp_path / "top.epub")])
+
+
+def test_sanitize_filename():
+    """Test la suppression des caractères interdits et la fusion des espaces."""
+    assert sanitize_filename(" Les <Misérables>:\t tome\n1/2? ") == "Les Misérables tome 12"
+    assert sanitize_filename('a\\b*c"d|e') == "abcde"
+
+
+def test_resolve_filename_collision_picks_first_free_suffix(tmp_path):
+    """Test qu'un nom déjà pris reçoit le premier suffixe libre."""
+    for name in ("2001 - A - T.epub", "2001 - A - T (1).epub", "2001 - A - T (2).EPUB"):
+        (tmp_path / name).write_bytes(b"")
+    parts = {"year": "2001", "authors": "A", "title": "T"}
+
+    assert _resolve_filename_collision(tmp_path, parts) == (
+        tmp_path / "2001 - A - T (3).epub",
+        "2001 - A - T (3).epub",
+    )
+    assert _resolve_filename_collision(tmp_path, {**parts, "year": None})[1] == "A - T.epub"
+
+
+def test_backup_file_survives_replacement_of_original(tmp_path, monkeypatch):
+    """Test que la sauvegarde garde l'ancien contenu après un os.replace de l'original."""
+    monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+    (tmp_path / "backups").mkdir()
+    original = tmp_path / "book.epub"
+    original.write_bytes(b"avant")
+
+    dst = backup_file(str(original))
+    (tmp_path / "book.epub.tmp").write_bytes(b"apres")
+    os.replace(tmp_path / "book.epub.tmp", original)
+
+    assert open(dst, "rb").read() == b"avant"
+
+
+def test_backup_file_copies_when_link_fails(tmp_path, monkeypatch):
+    """Test le repli sur une copie quand le lien physique est impossible."""
+    monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+
+    def cross_device_link(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(file_utils.os, "link", cross_device_link)
+    original = tmp_path / "book.epub"
+    original.write_bytes(b"contenu")
+
+    dst = backup_file(str(original))
+
+    assert open(dst, "rb").read() == b"contenu"
+    assert os.stat(dst).st_ino != os.stat(original).st_ino
+
+
+def test_backup_file_same_name_never_overwrites(tmp_path, monkeypatch):
+    """Test que deux fichiers homonymes sauvegardés dans la même seconde restent intacts."""
+    monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+    monkeypatch.setattr(file_utils.time, "strftime", lambda fmt: "20240101-000000")
+    (tmp_path / "backups").mkdir()
+    for folder, content in (("a", b"livre A"), ("b", b"livre B")):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "x.epub").write_bytes(content)
+
+    first = backup_file(str(tmp_path / "a" / "x.epub"))
+    second = backup_file(str(tmp_path / "b" / "x.epub"))
+
+    assert first != second
+    assert (tmp_path / "a" / "x.epub").read_bytes() == b"livre A"
+    assert open(first, "rb").read() == b"livre A"
+    assert open(second, "rb").read() == b"livre B"
+
+
+def test_backup_file_copy_never_overwrites(tmp_path, monkeypatch):
+    """Test que la copie de repli ne réécrit pas une sauvegarde existante (lien d'un original)."""
+    monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+    monkeypatch.setattr(file_utils.time, "strftime", lambda fmt: "20240101-000000")
+    monkeypatch.setattr(file_utils, "_same_device", lambda path, directory: False)
+    (tmp_path / "backups").mkdir()
+    other = tmp_path / "autre.epub"
+    other.write_bytes(b"original A")
+    os.link(other, tmp_path / "backups" / "20240101-000000-x.epub")
+    original = tmp_path / "x.epub"
+    original.write_bytes(b"livre B")
+
+    dst = backup_file(str(original))
+
+    assert dst.endswith("20240101-000000-x (1).epub")
+    assert other.read_bytes() == b"original A"
+    assert open(dst, "rb").read() == b"livre B"
+
+
+def test_backup_file_other_device_skips_link(tmp_path, monkeypatch):
+    """Test qu'un dossier de sauvegarde sur un autre volume passe directement à la copie."""
+    monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+    monkeypatch.setattr(file_utils, "_same_device", lambda path, directory: False)
+    monkeypatch.setattr(file_utils.os, "link", lambda src, dst: pytest.fail("os.link"))
+    original = tmp_path / "book.epub"
+    original.write_bytes(b"contenu")
+
+    assert open(backup_file(str(original)), "rb").read() == b"contenu"
+
+
+def test_backup_file_unexpected_link_error_is_raised(tmp_path, monkeypatch):
+    """Test qu'une erreur de lien sans rapport (ex: droits) n'est pas masquée par une copie."""
+    monkeypatch.setattr(file_utils, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(file_utils, "ensure_directories", lambda: None)
+
+    def denied(src, dst):
+        raise OSError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(file_utils.os, "link", denied)
+    original = tmp_path / "book.epub"
+    original.write_bytes(b"contenu")
+
+    with pytest.raises(PermissionError):
+        backup_file(str(original))
+    assert os.listdir(tmp_path) == ["book.epub"]
@@ -0,0 +1,26 @@
+# tests/core/test_models.py
+"""
+Tests pour le module core.models.
+"""
+
+import pickle
+
+import pytest
+
+from epub_enricher.core.models import EpubMeta
+
+
+def test_epub_meta_has_no_instance_dict():
+    """Test que EpubMeta utilise __slots__ et refuse les attributs non déclarés."""
+    meta = EpubMeta(path="/fake/test.epub", filename="test.epub")
+
+    assert not hasattr(meta, "__dict__")
+    with pytest.raises(AttributeError):
+        meta.unknown_field = 1
+
+
+def test_epub_meta_is_picklable():
+    """Test que EpubMeta traverse les processus d'extraction (pickle)."""
+    meta = EpubMeta(path="/fake/test.epub", filename="test.epub", found_editions=[{"title": "T"}])
+
+    assert pickle.loads(pickle.dumps(meta)) == meta
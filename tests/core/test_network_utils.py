@@ -0,0 +1,73 @@
+# tests/core/test_network_utils.py
+"""
+Tests pour le module core.network_utils.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from epub_enricher.core import network_utils
+
+
+def test_session_pools_http_and_https():
+    """Test que HTTP et HTTPS partagent le même adaptateur avec pool."""
+    session = network_utils._create_session()
+
+    assert session.get_adapter("http://example.com") is session.get_adapter("https://example.com")
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+@patch.object(network_utils, "_SESSION")
+def test_http_get_uses_connect_and_read_timeouts(mock_session):
+    """Test que http_get distingue délai de connexion et délai de lecture."""
+    mock_session.get.return_value = MagicMock()
+
+    network_utils.http_get("https://example.com", params={"q": "x"})
+
+    assert mock_session.get.call_args.kwargs["timeout"] == network_utils.DEFAULT_TIMEOUT
+
+
+@patch.object(network_utils, "_SESSION")
+def test_http_get_json_decodes_body(mock_session):
+    """Test que http_get_json décode le corps brut de la réponse."""
+    mock_session.get.return_value = MagicMock(content='{"title": "L\'Étranger"}'.encode())
+
+    assert network_utils.http_get_json("https://example.com") == {"title": "L'Étranger"}
+
+
+@patch.object(network_utils, "orjson", None)
+@patch.object(network_utils, "_SESSION")
+def test_http_get_json_without_orjson(mock_session):
+    """Test du repli sur le module json standard sans orjson."""
+    mock_session.get.return_value = MagicMock(content=b'{"docs": []}')
+
+    assert network_utils.http_get_json("https://example.com") == {"docs": []}
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    """Construit une HTTPError portant le statut donné."""
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+@pytest.mark.parametrize(
+    "error, expected_calls",
+    [
+        (_http_error(404), 1),
+        (_http_error(503), 3),
+        (_http_error(429), 3),
+        (requests.ConnectionError("reset"), 3),
+    ],
+)
+def test_retry_backoff_skips_permanent_client_errors(monkeypatch, error, expected_calls):
+    """Test que seules les erreurs transitoires sont réessayées."""
+    monkeypatch.setattr(network_utils.time, "sleep", lambda _: None)
+    func = MagicMock(side_effect=error, __name__="func")
+
+    with pytest.raises(type(error)):
+        network_utils.retry_backoff(max_retries=3)(func)()
+
+    assert func.call_count == expected_calls
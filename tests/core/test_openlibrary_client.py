@@ -0,0 +1,144 @@
+# tests/core/test_openlibrary_client.py
+"""
+Tests pour le module core.openlibrary_client.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from epub_enricher.core import cache, openlibrary_client
+from epub_enricher.core.openlibrary_client import (
+    batch_lookup_openlib,
+    download_cover,
+    is_openlibrary_cached,
+    query_openlibrary_full,
+)
+
+EDITION = {
+    "key": "/books/OL1M",
+    "title": "L'Étranger",
+    "authors": [{"key": "/authors/OL1A", "name": "Albert Camus"}],
+    "works": [{"key": "/works/OL1W"}],
+    "languages": [{"key": "/languages/fre"}],
+    "isbn_13": ["9782070360024"],
+    "covers": [42],
+    "publishers": ["Gallimard"],
+    "publish_date": "1972",
+}
+
+
+class TestBatchLookup:
+    """Tests pour batch_lookup_openlib."""
+
+    @patch("epub_enricher.core.openlibrary_client.OPENLIB_BATCH_SIZE", 2)
+    @patch("epub_enricher.core.openlibrary_client.http_get_json")
+    def test_chunked_requests(self, mock_get):
+        """Test que les ISBN sont regroupés par paquets, sans doublon."""
+        mock_get.return_value = {"ISBN:1": {"details": {"title": "A"}}}
+
+        result = batch_lookup_openlib(["1", "2", "1", "3", None])
+
+        assert mock_get.call_count == 2
+        bibkeys = [c.kwargs["params"]["bibkeys"] for c in mock_get.call_args_list]
+        assert bibkeys == ["ISBN:1,ISBN:2", "ISBN:3"]
+        assert result == {"1": {"title": "A"}}
+
+    @patch("epub_enricher.core.openlibrary_client.http_get_json")
+    def test_empty_list_no_request(self, mock_get):
+        """Test qu'aucune requête n'est faite sans ISBN."""
+        assert batch_lookup_openlib([]) == {}
+        mock_get.assert_not_called()
+
+    @patch("epub_enricher.core.openlibrary_client.http_get_json")
+    def test_failed_chunk_is_skipped(self, mock_get):
+        """Test qu'un échec réseau renvoie un résultat vide sans lever."""
+        mock_get.side_effect = Exception("Network error")
+
+        assert batch_lookup_openlib(["1"]) == {}
+
+
+class TestPrefetchedQuery:
+    """Tests pour query_openlibrary_full avec éditions pré-chargées."""
+
+    @pytest.fixture
+    def enabled_cache(self, tmp_path, monkeypatch):
+        """Active le cache sur une base temporaire."""
+        monkeypatch.setattr(cache, "API_CACHE_PATH", str(tmp_path / "api_cache.sqlite"))
+        cache.set_cache_enabled(True)
+
+    @patch("epub_enricher.core.openlibrary_client._fetch_work_details")
+    @patch("epub_enricher.core.openlibrary_client.http_get_json")
+    def test_prefetched_edition_replaces_search(self, mock_get, mock_work):
+        """Test que l'édition pré-chargée remplace la recherche: seule l'œuvre est demandée."""
+        mock_work.return_value = {"description": "Un roman."}
+
+        result = query_openlibrary_full(isbn="9782070360024", edition=EDITION)
+
+        mock_get.assert_not_called()
+        mock_work.assert_called_once_with("OL1W")
+        (doc,) = result["related_docs"]
+        assert doc["author_name"] == ["Albert Camus"]
+        assert doc["language"] == ["fre"]
+        assert result["cover_id"] == 42
+        assert result["summary"] == "Un roman."
+        assert result["publisher"] == "Gallimard"
+        assert result["publication_date"] == "1972"
+
+    @patch("epub_enricher.core.openlibrary_client._fetch_work_details")
+    @patch("epub_enricher.core.openlibrary_client.http_get_json")
+    def test_edition_and_search_results_cached_apart(self, mock_get, mock_work, enabled_cache):
+        """Test qu'un résultat de recherche en cache n'est pas servi à un appel avec édition."""
+        search_docs = [{"key": "/works/OL9W", "title": "Autre"}]
+        mock_get.return_value = {"docs": search_docs}
+        mock_work.return_value = None
+
+        searched = query_openlibrary_full(isbn="9782070360024")
+        from_edition = query_openlibrary_full(isbn="9782070360024", edition=EDITION)
+
+        assert searched["related_docs"] == search_docs
+        assert from_edition["related_docs"][0]["title"] == "L'Étranger"
+        assert mock_get.call_count == 1
+
+    @patch("epub_enricher.core.openlibrary_client._fetch_work_details")
+    @patch("epub_enricher.core.openlibrary_client.http_get_json")
+    def test_cached_edition_result_reused_without_edition(self, mock_get, mock_work, enabled_cache):
+        """Test qu'une exécution suivante (sans lot) réutilise le résultat de l'édition."""
+        mock_work.return_value = None
+        # ISBN propre au test: le niveau mémoire du cache est partagé par le processus
+        first = query_openlibrary_full("Titre", None, "9780000000002", EDITION)
+
+        assert is_openlibrary_cached("Titre", None, "9780000000002")
+        assert query_openlibrary_full("Titre", None, "9780000000002") == first
+        mock_get.assert_not_called()
+        mock_work.assert_called_once()
+
+
+class TestDownloadCover:
+    """Tests pour download_cover et son cache disque."""
+
+    @pytest.fixture
+    def cover_dir(self, tmp_path, monkeypatch):
+        """Redirige le cache des couvertures vers un dossier temporaire."""
+        monkeypatch.setattr(openlibrary_client, "COVER_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(openlibrary_client, "ensure_directories", lambda: None)
+        return tmp_path
+
+    @patch("epub_enricher.core.openlibrary_client.http_download_bytes")
+    def test_second_call_served_from_cache(self, mock_download, cover_dir):
+        """Test que la couverture est écrite sous son nom final puis relue sans requête."""
+        mock_download.return_value = b"jpeg"
+
+        assert download_cover(42) == b"jpeg"
+        assert download_cover(42) == b"jpeg"
+
+        mock_download.assert_called_once()
+        assert [p.name for p in cover_dir.iterdir()] == ["42.jpg"]
+
+    @patch("epub_enricher.core.openlibrary_client.http_download_bytes")
+    def test_cache_write_failure_keeps_cover(self, mock_download, cover_dir, monkeypatch):
+        """Test qu'un échec d'écriture du cache ne fait pas perdre la couverture."""
+        mock_download.return_value = b"jpeg"
+        monkeypatch.setattr(openlibrary_client, "COVER_CACHE_DIR", str(cover_dir / "missing"))
+
+        assert download_cover(42) == b"jpeg"
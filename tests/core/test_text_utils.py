@@ -0,0 +1,74 @@
+"""
+Tests pour le module core.text_utils.
+"""
+
+from epub_enricher.core import text_utils
+from epub_enricher.core.text_utils import (
+    classify_genre_from_text,
+    clean_html_text,
+    clean_text,
+)
+
+
+class TestCleanHtmlText:
+    """Tests pour clean_html_text."""
+
+    def test_empty_input(self):
+        """Test avec contenu vide."""
+        assert clean_html_text("") == ""
+
+    def test_tags_replaced_by_single_space(self):
+        """Test que balises et espaces adjacents sont fusionnés."""
+        html = "<p>Un  <b>roman</b>\n</p><p>sombre</p>"
+        assert clean_html_text(html) == "Un roman sombre"
+
+    def test_adjacent_blocks_stay_separated(self):
+        """Test que deux blocs contigus ne sont pas collés."""
+        assert clean_html_text("<p>a</p><p>b</p>") == "a b"
+
+
+class TestCleanText:
+    """Tests pour clean_text."""
+
+    def test_empty_input(self):
+        """Test avec texte vide."""
+        assert clean_text("") == ""
+
+    def test_special_chars_and_spaces(self):
+        """Test que les caractères spéciaux sont retirés et les espaces fusionnés."""
+        assert (
+            clean_text("  Science*Fiction  &\tFantasy, vol. 2 ")
+            == "Science Fiction Fantasy, vol. 2"
+        )
+
+
+class TestClassifyGenreFromText:
+    """Tests pour classify_genre_from_text."""
+
+    TEXT = "Un roman de science fiction: un robot explore l'espace, une autre planète."
+
+    def test_empty_text(self):
+        """Test avec texte vide."""
+        assert classify_genre_from_text("") is None
+
+    def test_best_genre(self):
+        """Test que le genre le plus représenté l'emporte."""
+        assert classify_genre_from_text(self.TEXT) == "Science-Fiction"
+
+    def test_no_keyword(self):
+        """Test sans mot-clé connu."""
+        assert classify_genre_from_text("xyz") is None
+
+    def test_same_result_without_automaton(self, monkeypatch):
+        """Test que le repli str.count donne le même résultat."""
+        expected = classify_genre_from_text(self.TEXT)
+        monkeypatch.setattr(text_utils, "_KEYWORD_AUTOMATON", None)
+        assert classify_genre_from_text(self.TEXT) == expected
+        assert classify_genre_from_text("un crime, une enquête") == "Mystery"
+
+    def test_repeated_keyword_weight_kept_in_both_modes(self, monkeypatch):
+        """Test qu'un mot-clé listé deux fois par un genre compte double, avec ou sans automate."""
+        text = "la science et la fiction"
+        assert classify_genre_from_text(text) == "Science"
+        monkeypatch.setattr(text_utils, "_KEYWORD_AUTOMATON", None)
+        assert classify_genre_from_text(text) == "Science"